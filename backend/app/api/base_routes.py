@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List, Optional, Dict, Any
-from ..database import get_db
+from ..database import get_async_db
 from ..models.models import Legislation, LegislationType
+from ..schemas import LegislationDetail, LegislationPage, SUMMARY_COLUMNS
+from .queries import filter_legislation, paginate, sort_column
 from datetime import datetime
 
 class BaseRouter:
@@ -12,46 +16,44 @@ class BaseRouter:
         self.setup_routes()
 
     def setup_routes(self):
-        @self.router.get("/")
+        @self.router.get("/", response_model=LegislationPage)
         async def get_legislation(
             page: int = Query(1, ge=1),
             limit: int = Query(20, ge=1, le=100),
             status: Optional[str] = None,
             start_date: Optional[datetime] = None,
             end_date: Optional[datetime] = None,
-            db: Session = Depends(get_db)
+            stale_days: Optional[int] = Query(None, ge=0),
+            cursor: Optional[str] = None,
+            include_total: Optional[bool] = None,
+            db: AsyncSession = Depends(get_async_db)
         ):
-            query = db.query(Legislation).filter(
-                Legislation.type == self.legislation_type
-            )
-
-            if status:
-                query = query.filter(Legislation.status == status)
-            if start_date:
-                query = query.filter(Legislation.introduced_date >= start_date)
-            if end_date:
-                query = query.filter(Legislation.introduced_date <= end_date)
+            def load(session):
+                query = filter_legislation(
+                    session.query(*SUMMARY_COLUMNS),
+                    self.legislation_type,
+                    status=status,
+                    start_date=start_date,
+                    end_date=end_date,
+                    stale_days=stale_days
+                )
+                return paginate(query, page, limit, cursor, include_total, sort_column(stale_days))
 
-            total = query.count()
-            items = query.offset((page - 1) * limit).limit(limit).all()
-            
-            return {
-                "total": total,
-                "page": page,
-                "limit": limit,
-                "data": items
-            }
+            return await db.run_sync(load)
 
-        @self.router.get("/{legislation_id}")
+        @self.router.get("/{legislation_id}", response_model=LegislationDetail)
         async def get_legislation_by_id(
             legislation_id: str,
-            db: Session = Depends(get_db)
+            db: AsyncSession = Depends(get_async_db)
         ):
-            item = db.query(Legislation).filter(
-                Legislation.id == legislation_id,
-                Legislation.type == self.legislation_type
-            ).first()
+            item = await db.scalar(
+                select(Legislation).options(selectinload(Legislation.document)).filter(
+                    Legislation.id == legislation_id,
+                    Legislation.type == self.legislation_type
+                )
+            )
             
             if not item:
                 raise HTTPException(status_code=404, detail="Legislation not found")
-            return item
+
+            return LegislationDetail.from_legislation(item)
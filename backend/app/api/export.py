@@ -0,0 +1,118 @@
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Sequence
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..models import LegislationType
+from ..schemas import SUMMARY_COLUMNS
+from .queries import filter_legislation, order_legislation, sort_column
+
+# Rows fetched per round trip; also the size of each streamed chunk
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FIELDS = [column.key for column in SUMMARY_COLUMNS]
+DATE_FIELDS = {"introduced_date", "last_action_date"}
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+def export_statement(legislation_type: LegislationType, **filters) -> Select:
+    """List-row columns for every item matching the list filters, in list order"""
+    return order_legislation(
+        filter_legislation(select(*SUMMARY_COLUMNS), legislation_type, **filters),
+        sort_column(filters.get("stale_days"))
+    )
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def ndjson_chunk(rows: Iterable[Sequence[Any]]) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row))), separators=(",", ":")) + "\n"
+        for row in rows
+    )
+
+def csv_chunk(rows: Iterable[Sequence[Any]], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+ENCODERS = {"ndjson": ndjson_chunk, "csv": csv_chunk}
+
+def iter_batches(db: Session, statement: Select, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Rows in lists of ``batch_size`` read from a server-side cursor"""
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield rows
+
+async def stream_export(
+    db: AsyncSession,
+    statement: Select,
+    format: str,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[str]:
+    """Encoded chunks of ``statement``'s rows, one per fetched batch.
+
+    Only one batch is held at a time whatever the size of the result,
+    so memory stays flat for exports of the whole corpus.
+    """
+    encode = ENCODERS[format]
+    if format == "csv":
+        yield csv_chunk([], header=True)
+    result = await db.stream(statement.execution_options(yield_per=batch_size))
+    async for rows in result.partitions():
+        yield encode(rows)
+
+def write_text(batches: Iterable[List[Any]], format: str, out) -> int:
+    """Write NDJSON or CSV to a text stream; returns the number of rows"""
+    if format == "csv":
+        out.write(csv_chunk([], header=True))
+    count = 0
+    for rows in batches:
+        out.write(ENCODERS[format](rows))
+        count += len(rows)
+    return count
+
+def write_columnar(batches: Iterable[List[Any]], format: str, path: str) -> int:
+    """Write a Parquet or Arrow IPC snapshot one record batch at a time.
+
+    Needs the optional ``pyarrow`` dependency. Returns the number of rows.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError(f"{format} export requires pyarrow (pip install pyarrow)") from e
+
+    schema = pa.schema([
+        (name, pa.timestamp("us") if name in DATE_FIELDS else pa.string())
+        for name in EXPORT_FIELDS
+    ])
+    if format == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    count = 0
+    with writer:
+        for rows in batches:
+            columns = [
+                [row[index] if name in DATE_FIELDS else _plain(row[index]) for row in rows]
+                for index, name in enumerate(EXPORT_FIELDS)
+            ]
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+            count += len(rows)
+    return count
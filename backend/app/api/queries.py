@@ -0,0 +1,286 @@
+from datetime import datetime
+from typing import Optional, Tuple, List, Dict, Any
+import base64
+import json
+import threading
+from cachetools import TTLCache
+from fastapi import HTTPException
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query, Session
+from ..cache import data_version
+from ..config import get_settings
+from ..models import Legislation, LegislationRollup, LegislationType, LegislativeAction
+
+settings = get_settings()
+
+_count_cache = TTLCache(maxsize=1024, ttl=settings.COUNT_CACHE_TTL)
+_count_lock = threading.Lock()
+
+def year_bounds(year: int):
+    """Half-open [start, end) datetime range covering a calendar year"""
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+def filter_legislation(
+    query: Query,
+    legislation_type: LegislationType,
+    status: Optional[str] = None,
+    year: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    congress: Optional[str] = None,
+    president: Optional[str] = None,
+    state: Optional[str] = None,
+    stale_days: Optional[int] = None
+) -> Query:
+    """Apply the list filters shared by every legislation route.
+
+    Every filter is a plain comparison on an indexed column so the
+    (type, <filter>, introduced_date) indexes can serve both the WHERE
+    clause and the ORDER BY. ``stale_days`` keeps bills with no action in
+    that many days, as a range on (type, last_action_date).
+    """
+    query = query.filter(Legislation.type == legislation_type.value)
+
+    if status:
+        query = query.filter(Legislation.status == status)
+    if year:
+        start, end = year_bounds(year)
+        query = query.filter(
+            Legislation.introduced_date >= start,
+            Legislation.introduced_date < end
+        )
+    if start_date:
+        query = query.filter(Legislation.introduced_date >= start_date)
+    if end_date:
+        query = query.filter(Legislation.introduced_date <= end_date)
+    if congress:
+        query = query.filter(Legislation.congress == str(congress))
+    if president:
+        query = query.filter(Legislation.president == president)
+    if state:
+        query = query.filter(Legislation.state == state.upper())
+    if stale_days is not None:
+        query = query.filter(Legislation.is_stale(stale_days))
+    return query
+
+def sort_column(stale_days: Optional[int] = None):
+    """Date lists are ordered on: introduction, or last action for stale-bill lists.
+
+    A stale filter is a range on last_action_date, so ordering on it lets
+    (type, last_action_date, id) serve both the WHERE and the ORDER BY.
+    """
+    return Legislation.introduced_date if stale_days is None else Legislation.last_action_date
+
+def order_legislation(query: Query, column=Legislation.introduced_date) -> Query:
+    """Newest first, with id as a tie-breaker so pages are stable"""
+    return query.order_by(column.desc(), Legislation.id.desc())
+
+def pack_cursor(date: Optional[datetime], id_: str) -> str:
+    """Opaque cursor for a (date, id) keyset position"""
+    raw = json.dumps([date.isoformat() if date else None, id_], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def encode_cursor(item: Any, column=Legislation.introduced_date) -> str:
+    """Opaque cursor pointing just past ``item`` in list order"""
+    return pack_cursor(getattr(item, column.key), item.id)
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        introduced, last_id = json.loads(raw)
+        return (datetime.fromisoformat(introduced) if introduced else None), str(last_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+def keyset_page(
+    query: Query,
+    cursor: Optional[str],
+    limit: int,
+    column=Legislation.introduced_date
+) -> Tuple[List[Any], Optional[str]]:
+    """Fetch the page after ``cursor`` using (``column``, id) seeks.
+
+    Dated rows are walked newest first with a row-value comparison, then
+    undated rows by id. Splitting the two keeps every step an index range
+    scan regardless of where the backend sorts NULLs.
+    """
+    introduced, id_ = column, Legislation.id
+    after_date, after_id = decode_cursor(cursor) if cursor else (None, None)
+
+    items = []
+    if after_id is None or after_date is not None:
+        dated = query.filter(introduced.isnot(None))
+        if after_id is not None:
+            dated = dated.filter(tuple_(introduced, id_) < tuple_(after_date, after_id))
+        items = dated.order_by(introduced.desc(), id_.desc()).limit(limit + 1).all()
+
+    if len(items) <= limit:
+        undated = query.filter(introduced.is_(None))
+        if after_id is not None and after_date is None:
+            undated = undated.filter(id_ < after_id)
+        items += undated.order_by(id_.desc()).limit(limit + 1 - len(items)).all()
+
+    next_cursor = encode_cursor(items[limit - 1], column) if len(items) > limit else None
+    return items[:limit], next_cursor
+
+def action_page(db: Session, legislation_id: str, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """One page of a bill's timeline, oldest first, seeking (action_date, id).
+
+    Each page is a range scan of ix_legislative_actions_legislation_date,
+    however deep into the timeline the cursor points.
+    """
+    query = db.query(LegislativeAction).filter(LegislativeAction.legislation_id == legislation_id)
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        if after_date is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            tuple_(LegislativeAction.action_date, LegislativeAction.id) > tuple_(after_date, after_id)
+        )
+    items = query.order_by(LegislativeAction.action_date, LegislativeAction.id).limit(limit + 1).all()
+
+    # An empty first page is the only one where a missing bill is told apart
+    if not items and not cursor and db.get(Legislation, legislation_id) is None:
+        raise HTTPException(status_code=404, detail="Legislation not found")
+
+    next_cursor = pack_cursor(items[limit - 1].action_date, items[limit - 1].id) if len(items) > limit else None
+    return {
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "data": items[:limit]
+    }
+
+def cached_count(query: Query) -> int:
+    """Row count for a filtered query, cached for COUNT_CACHE_TTL seconds.
+
+    Keyed on the data version too, so a scrape commit retires every count
+    taken before it, in whichever process the scrape ran.
+    """
+    compiled = query.statement.compile()
+    key = (data_version(), str(compiled), tuple(sorted(compiled.params.items())))
+    with _count_lock:
+        total = _count_cache.get(key)
+    if total is None:
+        total = query.order_by(None).count()
+        with _count_lock:
+            _count_cache[key] = total
+    return total
+
+def paginate(
+    query: Query,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    column=Legislation.introduced_date
+) -> Dict[str, Any]:
+    """Build a list response in offset (``page``) or keyset (``cursor``) mode.
+
+    Rows are ordered newest first on ``column`` (see sort_column). The
+    total is computed by default in page mode only, and comes from the
+    short-lived count cache either way.
+    """
+    if include_total is None:
+        include_total = cursor is None
+    total = cached_count(query) if include_total else None
+
+    if cursor:
+        items, next_cursor = keyset_page(query, cursor, limit, column)
+        page = None
+    else:
+        items = order_legislation(query, column).offset((page - 1) * limit).limit(limit + 1).all()
+        next_cursor = encode_cursor(items[limit - 1], column) if len(items) > limit else None
+        items = items[:limit]
+
+    return {
+        "total": total,
+        "page": page,
+        "pages": (total + limit - 1) // limit if total is not None else None,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "data": items
+    }
+
+def legislation_stats(db: Session) -> Dict[str, Any]:
+    """Counts by type, status and introduction year from legislation_rollups.
+
+    The scrapers keep the rollups current, so this sums O(groups) rows
+    however large the legislation table grows. Years are string keys so
+    the payload is the same whether or not it went through a JSON cache.
+    """
+    rows = db.query(
+        LegislationRollup.type, LegislationRollup.status, LegislationRollup.year,
+        func.sum(LegislationRollup.count)
+    ).group_by(LegislationRollup.type, LegislationRollup.status, LegislationRollup.year).all()
+
+    by_type = {
+        legislation_type.value: {"total": 0, "by_status": {}, "by_year": {}}
+        for legislation_type in LegislationType
+    }
+    by_status: Dict[str, int] = {}
+    by_year: Dict[str, int] = {}
+    for legislation_type, status, introduced_year, count in rows:
+        bucket = by_type[legislation_type]
+        bucket["total"] += count
+        _tally(bucket["by_status"], status, count)
+        _tally(by_status, status, count)
+        if introduced_year:
+            _tally(bucket["by_year"], str(introduced_year), count)
+            _tally(by_year, str(introduced_year), count)
+
+    for bucket in by_type.values():
+        bucket["by_year"] = dict(sorted(bucket["by_year"].items(), reverse=True))
+
+    return {
+        "federal_count": by_type[LegislationType.FEDERAL.value]["total"],
+        "executive_count": by_type[LegislationType.EXECUTIVE.value]["total"],
+        "state_count": by_type[LegislationType.STATE.value]["total"],
+        "total": sum(bucket["total"] for bucket in by_type.values()),
+        "by_type": by_type,
+        "by_status": by_status,
+        "by_year": dict(sorted(by_year.items(), reverse=True))
+    }
+
+# Breakdown dimensions besides type, as (payload key, rollup column, sort newest first)
+BREAKDOWN_DIMENSIONS = (
+    ("by_status", "status", False),
+    ("by_year", "year", True),
+    ("by_congress", "congress", True),
+    ("by_president", "president", False),
+    ("by_state", "state", False),
+)
+
+def _tally(counts: Dict[str, int], key: str, count: int) -> None:
+    counts[key] = counts.get(key, 0) + count
+
+def _breakdown_bucket() -> Dict[str, Any]:
+    return {"total": 0, **{key: {} for key, _, _ in BREAKDOWN_DIMENSIONS}}
+
+def legislation_breakdown(db: Session) -> Dict[str, Any]:
+    """Counts along every dashboard dimension, overall and per type.
+
+    Reads every row of legislation_rollups once; each is added to one
+    bucket per dimension. Year 0 and empty congress, president or state
+    stand for "not set" and are left out of their breakdowns, though
+    those items still count towards the totals.
+    """
+    columns = [getattr(LegislationRollup, column) for _, column, _ in BREAKDOWN_DIMENSIONS]
+    rows = db.query(LegislationRollup.type, *columns, LegislationRollup.count).all()
+
+    overall = _breakdown_bucket()
+    by_type = {legislation_type.value: _breakdown_bucket() for legislation_type in LegislationType}
+    for legislation_type, *values, count in rows:
+        for bucket in (overall, by_type[legislation_type]):
+            bucket["total"] += count
+            for (key, _, _), value in zip(BREAKDOWN_DIMENSIONS, values):
+                if value:
+                    _tally(bucket[key], str(value), count)
+
+    for bucket in (overall, *by_type.values()):
+        for key, _, newest_first in BREAKDOWN_DIMENSIONS:
+            if newest_first:
+                # Congress numbers and years sort numerically, not as strings
+                bucket[key] = dict(sorted(bucket[key].items(), key=lambda item: (len(item[0]), item[0]), reverse=True))
+            else:
+                bucket[key] = dict(sorted(bucket[key].items()))
+    return {**overall, "by_type": by_type}
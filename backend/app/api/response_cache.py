@@ -0,0 +1,122 @@
+import hashlib
+import re
+import time
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode
+from prometheus_client import Counter, Histogram
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from ..cache import data_version, get_response_cache
+
+REQUESTS = Counter(
+    "response_cache_requests_total",
+    "Cacheable API requests by route and outcome (hit, miss, not_modified)",
+    ["route", "result"]
+)
+LATENCY = Histogram(
+    "response_cache_latency_seconds",
+    "Time to answer cacheable API requests by outcome",
+    ["result"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+def cache_key(path: str, query: str) -> str:
+    """Path plus query parameters sorted, with empty values dropped"""
+    params = sorted(parse_qsl(query, keep_blank_values=False))
+    return f"{path}?{urlencode(params)}" if params else path
+
+def etag_for(version: str, key: str) -> str:
+    digest = hashlib.sha1(f"{version}:{key}".encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}"'
+
+def last_modified_for(version: str) -> datetime:
+    # Versions are nanosecond timestamps; HTTP dates have second precision
+    return datetime.fromtimestamp(int(version) // 10**9, tz=timezone.utc)
+
+def _not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return etag in tags or "*" in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Serve GET responses of read-only routes from a cache keyed on the data version.
+
+    Responses only change when a scrape commits, which bumps the data
+    version. Every cacheable response carries an ETag and Last-Modified
+    derived from that version, so conditional requests are answered with
+    304 from the version alone, without touching the database. Full
+    responses are stored per (version, path, normalized query) and served
+    until the next bump. Requests carrying any of ``volatile_params``
+    depend on the clock as well as the data and are never cached.
+    """
+
+    def __init__(self, app, routes: dict, volatile_params: Iterable[str] = ()):
+        super().__init__(app)
+        # Route label -> compiled path pattern
+        self.routes = {label: re.compile(pattern) for label, pattern in routes.items()}
+        self.volatile_params = frozenset(volatile_params)
+
+    def _route(self, path: str) -> Optional[str]:
+        for label, pattern in self.routes.items():
+            if pattern.fullmatch(path):
+                return label
+        return None
+
+    async def dispatch(self, request: Request, call_next):
+        route = self._route(request.url.path) if request.method == "GET" else None
+        if route is None or not self.volatile_params.isdisjoint(request.query_params):
+            return await call_next(request)
+
+        started = time.perf_counter()
+        version = data_version()
+        key = cache_key(request.url.path, request.url.query)
+        etag = etag_for(version, key)
+        last_modified = last_modified_for(version)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": format_datetime(last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+        if _not_modified(request, etag, last_modified):
+            response = Response(status_code=304, headers=headers)
+            result = "not_modified"
+        else:
+            cache = get_response_cache()
+            entry = cache.get(f"response:{version}:{key}")
+            if entry is not None:
+                response = Response(
+                    content=entry["body"], media_type=entry["media_type"],
+                    headers={**headers, "X-Cache": "HIT"}
+                )
+                result = "hit"
+            else:
+                response = await call_next(request)
+                if response.status_code != 200:
+                    return response
+                body = b"".join([chunk async for chunk in response.body_iterator])
+                media_type = response.headers.get("content-type", "application/json")
+                cache.set(f"response:{version}:{key}", {
+                    "body": body.decode("utf-8"), "media_type": media_type
+                })
+                response = Response(
+                    content=body, media_type=media_type,
+                    headers={**headers, "X-Cache": "MISS"}
+                )
+                result = "miss"
+
+        REQUESTS.labels(route=route, result=result).inc()
+        LATENCY.labels(result=result).observe(time.perf_counter() - started)
+        return response
@@ -1,120 +1,137 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import extract, and_
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List, Optional
-from ..database import get_db
+from ..cache import BREAKDOWN_KEY, STATS_KEY, get_or_set_async
+from ..database import get_async_db
 from ..models import Legislation, LegislationType, Status
+from ..schemas import ActionPage, LegislationDetail, LegislationPage, SearchPage, SUMMARY_COLUMNS
+from .export import MEDIA_TYPES, export_statement, stream_export
+from .queries import action_page, filter_legislation, legislation_breakdown, legislation_stats, paginate, sort_column
+from .search import search_legislation
 
 api_router = APIRouter()
 
-@api_router.get("/federal")
+@api_router.get("/federal", response_model=LegislationPage)
 async def get_federal_legislation(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
     year: Optional[int] = None,
     congress: Optional[str] = None,
-    db: Session = Depends(get_db)
+    stale_days: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    query = db.query(Legislation).filter(
-        Legislation.type == LegislationType.FEDERAL.value
-    )
-
-    # Apply filters
-    if status:
-        query = query.filter(Legislation.status == status)
-    if year:
-        query = query.filter(extract('year', Legislation.introduced_date) == year)
-    if congress:
-        query = query.filter(
-            Legislation.extra_data['congress'].astext == str(congress)
+    def load(session):
+        query = filter_legislation(
+            session.query(*SUMMARY_COLUMNS), LegislationType.FEDERAL,
+            status=status, year=year, congress=congress, stale_days=stale_days
         )
+        return paginate(query, page, limit, cursor, include_total, sort_column(stale_days))
 
-    # Get total count for pagination
-    total = query.count()
-    
-    # Add sorting and pagination
-    query = query.order_by(Legislation.introduced_date.desc())
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    
-    return {
-        "total": total,
-        "page": page,
-        "pages": (total + limit - 1) // limit,
-        "limit": limit,
-        "data": items
-    }
+    return await db.run_sync(load)
 
-@api_router.get("/executive")
+@api_router.get("/executive", response_model=LegislationPage)
 async def get_executive_orders(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
     year: Optional[int] = None,
     president: Optional[str] = None,
-    db: Session = Depends(get_db)
+    stale_days: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    query = db.query(Legislation).filter(
-        Legislation.type == LegislationType.EXECUTIVE.value
-    )
-
-    # Apply filters
-    if status:
-        query = query.filter(Legislation.status == status)
-    if year:
-        query = query.filter(extract('year', Legislation.introduced_date) == year)
-    if president:
-        query = query.filter(
-            Legislation.extra_data['president'].astext == president
+    def load(session):
+        query = filter_legislation(
+            session.query(*SUMMARY_COLUMNS), LegislationType.EXECUTIVE,
+            status=status, year=year, president=president, stale_days=stale_days
         )
+        return paginate(query, page, limit, cursor, include_total, sort_column(stale_days))
 
-    # Get total count for pagination
-    total = query.count()
-    
-    # Add sorting and pagination
-    query = query.order_by(Legislation.introduced_date.desc())
-    items = query.offset((page - 1) * limit).limit(limit).all()
-    
-    return {
-        "total": total,
-        "page": page,
-        "pages": (total + limit - 1) // limit,
-        "limit": limit,
-        "data": items
-    }
+    return await db.run_sync(load)
+
+@api_router.get("/search", response_model=SearchPage)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[str] = Query(None, pattern="^(federal|executive|state)$"),
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    legislation_type = LegislationType(type.upper()) if type else None
+    return await db.run_sync(
+        lambda session: search_legislation(session, q, legislation_type, page, limit)
+    )
+
+@api_router.get("/export")
+async def export_legislation(
+    type: str = Query(..., pattern="^(federal|executive|state)$"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status: Optional[str] = None,
+    year: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    congress: Optional[str] = None,
+    president: Optional[str] = None,
+    state: Optional[str] = None,
+    stale_days: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Every matching list row as NDJSON or CSV, streamed from a server-side cursor"""
+    statement = export_statement(
+        LegislationType(type.upper()), status=status, year=year,
+        start_date=start_date, end_date=end_date,
+        congress=congress, president=president, state=state, stale_days=stale_days
+    )
+    # The session dependency is closed once the response has been sent,
+    # so it outlives the stream
+    return StreamingResponse(
+        stream_export(db, statement, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{type}.{format}"'}
+    )
 
-@api_router.get("/legislation/{legislation_id}")
+@api_router.get("/legislation/{legislation_id}", response_model=LegislationDetail)
 async def get_legislation_by_id(
     legislation_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    item = db.query(Legislation).filter(
-        Legislation.id == legislation_id
-    ).first()
+    item = await db.get(
+        Legislation, legislation_id, options=[selectinload(Legislation.document)]
+    )
     
     if not item:
         raise HTTPException(status_code=404, detail="Legislation not found")
     
-    return item
+    # The document body is only fetched here, never by the list routes
+    return LegislationDetail.from_legislation(item)
+
+@api_router.get("/legislation/{legislation_id}/actions", response_model=ActionPage)
+async def get_legislation_actions(
+    legislation_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """The bill's action timeline, oldest first; follow ``next_cursor`` for more"""
+    return await db.run_sync(lambda session: action_page(session, legislation_id, cursor, limit))
 
 @api_router.get("/stats")
 async def get_statistics(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    federal_count = db.query(Legislation).filter(
-        Legislation.type == LegislationType.FEDERAL.value
-    ).count()
-    
-    executive_count = db.query(Legislation).filter(
-        Legislation.type == LegislationType.EXECUTIVE.value
-    ).count()
-    
-    state_count = db.query(Legislation).filter(
-        Legislation.type == LegislationType.STATE.value
-    ).count()
-    
-    return {
-        "federal_count": federal_count,
-        "executive_count": executive_count,
-        "state_count": state_count
-    }
+    # Scrapers drop the cached payload whenever they commit changes
+    return await get_or_set_async(STATS_KEY, lambda: db.run_sync(legislation_stats))
+
+@api_router.get("/stats/breakdown")
+async def get_statistics_breakdown(
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Counts by status, year, congress, president and state, overall and per type"""
+    return await get_or_set_async(BREAKDOWN_KEY, lambda: db.run_sync(legislation_breakdown))
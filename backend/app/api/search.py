@@ -0,0 +1,127 @@
+from typing import Any, Dict, Optional
+import re
+from sqlalchemy import Float, String, column, text
+from sqlalchemy.orm import Session
+from ..models import Legislation, LegislationType, SEARCH_TABLE
+from ..schemas import LegislationSummary
+
+MARK_START = "<mark>"
+MARK_END = "</mark>"
+
+_TERM = re.compile(r"\w+")
+
+# Result columns, typed so dates and enums come back as they do from the ORM
+_COLUMNS = [Legislation.__table__.c[name] for name in LegislationSummary.model_fields]
+_SELECT = ", ".join(f"legislation.{c.name}" for c in _COLUMNS)
+
+def fts5_query(q: str) -> Optional[str]:
+    """Turn free text into an FTS5 query of quoted terms that must all match.
+
+    Quoting keeps FTS5 operators and punctuation in user input from being
+    parsed as query syntax. The last term is prefix-matched because the
+    dashboard searches as the user types.
+    """
+    terms = [f'"{term}"' for term in _TERM.findall(q)]
+    if not terms:
+        return None
+    terms[-1] += "*"
+    return " ".join(terms)
+
+def _type_filter(legislation_type, params):
+    if legislation_type is None:
+        return ""
+    params["type"] = legislation_type.value
+    return " AND legislation.type = :type"
+
+def _sqlite_search(db, q, legislation_type, limit, offset):
+    match = fts5_query(q)
+    if match is None:
+        return 0, []
+    params = {"match": match}
+    if legislation_type is None:
+        source = SEARCH_TABLE
+        where = f"{SEARCH_TABLE} MATCH :match"
+    else:
+        source = f"{SEARCH_TABLE} JOIN legislation ON legislation.id = {SEARCH_TABLE}.id"
+        where = f"{SEARCH_TABLE} MATCH :match" + _type_filter(legislation_type, params)
+
+    total = db.execute(text(f"SELECT count(*) FROM {source} WHERE {where}"), params).scalar()
+
+    # Rank and page on rowids alone, then build snippets for that page only;
+    # in a single query SQLite would run snippet() for every match before
+    # sorting. bm25() is lower-is-better: title hits weigh most, body hits
+    # least, and the first weight belongs to the unindexed id column. The
+    # CROSS JOIN pins the page as the outer loop so each snippet is a rowid
+    # seek rather than a second full MATCH.
+    rows = db.execute(text(
+        f"WITH hit AS ("
+        f"SELECT {SEARCH_TABLE}.rowid AS hit_rowid, bm25({SEARCH_TABLE}, 0.0, 10.0, 4.0, 1.0) AS score "
+        f"FROM {source} WHERE {where} "
+        f"ORDER BY score, {SEARCH_TABLE}.rowid DESC LIMIT :limit OFFSET :offset"
+        f") SELECT {_SELECT}, "
+        f"snippet({SEARCH_TABLE}, -1, '{MARK_START}', '{MARK_END}', '…', 24) AS snippet, "
+        f"-hit.score AS rank "
+        f"FROM hit CROSS JOIN {SEARCH_TABLE} ON {SEARCH_TABLE}.rowid = hit.hit_rowid "
+        f"JOIN legislation ON legislation.id = {SEARCH_TABLE}.id "
+        f"WHERE {SEARCH_TABLE} MATCH :match ORDER BY hit.score, legislation.id DESC"
+    ).columns(*_COLUMNS, column("snippet", String), column("rank", Float)),
+        {**params, "limit": limit, "offset": offset}
+    ).all()
+    return total, rows
+
+def _postgresql_search(db, q, legislation_type, limit, offset):
+    params = {"q": q}
+    where = "s.document @@ query" + _type_filter(legislation_type, params)
+
+    total = db.execute(text(
+        f"SELECT count(*) FROM {SEARCH_TABLE} s "
+        "CROSS JOIN websearch_to_tsquery('english', :q) query "
+        f"JOIN legislation ON legislation.id = s.id WHERE {where}"
+    ), params).scalar()
+
+    # Rank and page first so ts_headline only runs for the rows returned
+    rows = db.execute(text(
+        f"SELECT {_SELECT}, "
+        "ts_headline('english', concat_ws(' ', hit.title, hit.summary, hit.body), hit.query, "
+        f"'StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=30, MinWords=12') AS snippet, "
+        "hit.rank FROM ("
+        "SELECT s.id, s.title, s.summary, s.body, query, ts_rank_cd(s.document, query) AS rank "
+        f"FROM {SEARCH_TABLE} s CROSS JOIN websearch_to_tsquery('english', :q) query "
+        f"JOIN legislation ON legislation.id = s.id WHERE {where} "
+        "ORDER BY rank DESC, s.id DESC LIMIT :limit OFFSET :offset"
+        ") hit JOIN legislation ON legislation.id = hit.id "
+        "ORDER BY hit.rank DESC, hit.id DESC"
+    ).columns(*_COLUMNS, column("snippet", String), column("rank", Float)),
+        {**params, "limit": limit, "offset": offset}
+    ).all()
+    return total, rows
+
+def search_legislation(
+    db: Session,
+    q: str,
+    legislation_type: Optional[LegislationType] = None,
+    page: int = 1,
+    limit: int = 20
+) -> Dict[str, Any]:
+    """Ranked full-text matches for ``q``, one page at a time.
+
+    Uses the FTS5 table on SQLite and the GIN-indexed tsvector on
+    PostgreSQL. Snippets wrap matched terms in ``<mark>`` tags.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        search = _sqlite_search
+    elif dialect == "postgresql":
+        search = _postgresql_search
+    else:
+        raise NotImplementedError(f"Full-text search not supported on {dialect}")
+
+    total, rows = search(db, q, legislation_type, limit, (page - 1) * limit)
+
+    return {
+        "total": total,
+        "page": page,
+        "pages": (total + limit - 1) // limit,
+        "limit": limit,
+        "data": rows
+    }
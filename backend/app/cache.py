@@ -0,0 +1,140 @@
+import json
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+
+from cachetools import TTLCache
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Key of the /stats payload; scrapers delete it whenever they commit changes
+STATS_KEY = "legislation:stats"
+
+# Key of the /stats/breakdown payload, dropped along with STATS_KEY
+BREAKDOWN_KEY = "legislation:stats:breakdown"
+
+# Token of the last committed scrape, a nanosecond timestamp. Cached HTTP
+# responses and their ETags are keyed on it.
+DATA_VERSION_KEY = "legislation:version"
+
+
+class MemoryCache:
+    """In-process TTL cache.
+
+    Invalidations only reach the process that made them, so entries written
+    by the API are dropped by a scraper running in the same process but
+    otherwise live until the TTL expires.
+    """
+
+    def __init__(self, ttl: int, maxsize: int = 256):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisCache:
+    """JSON values in Redis, shared by the API and the Celery workers.
+
+    Redis being unavailable degrades to a cache miss rather than an error.
+    """
+
+    def __init__(self, url: str, ttl: int):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._ttl = ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            value = self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache read failed for {key}: {str(e)}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self._client.set(key, json.dumps(value, default=str), ex=self._ttl)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache invalidation failed for {key}: {str(e)}")
+
+
+def get_or_set(key: str, compute: Callable[[], Any]) -> Any:
+    """Cached value of ``key``, computing and storing it on a miss"""
+    cache = get_cache()
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value)
+    return value
+
+
+async def get_or_set_async(key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """``get_or_set`` for values computed by a coroutine"""
+    cache = get_cache()
+    value = cache.get(key)
+    if value is None:
+        value = await compute()
+        cache.set(key, value)
+    return value
+
+
+def invalidate(*keys: str) -> None:
+    cache = get_cache()
+    for key in keys:
+        cache.delete(key)
+
+
+def bump_data_version() -> str:
+    version = str(time.time_ns())
+    get_cache().set(DATA_VERSION_KEY, version)
+    return version
+
+
+def data_version() -> str:
+    """Current data version, starting a new one if none is stored.
+
+    A fresh process or a flushed Redis therefore invalidates every
+    response cached or validated under an older version.
+    """
+    version = get_cache().get(DATA_VERSION_KEY)
+    return version if version is not None else bump_data_version()
+
+
+def _backend(maxsize: int):
+    settings = get_settings()
+    if settings.CACHE_URL.startswith(("redis://", "rediss://")):
+        return RedisCache(settings.CACHE_URL, settings.CACHE_TTL)
+    return MemoryCache(settings.CACHE_TTL, maxsize=maxsize)
+
+
+@lru_cache()
+def get_cache():
+    return _backend(maxsize=256)
+
+
+@lru_cache()
+def get_response_cache():
+    """Separate, larger store for rendered API responses"""
+    return _backend(maxsize=get_settings().RESPONSE_CACHE_SIZE)
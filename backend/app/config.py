@@ -1,10 +1,19 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 from functools import lru_cache
 
 class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = "sqlite:///./legislation.db"
+    # Driver URL for the API's async engine; derived from DATABASE_URL
+    # (aiosqlite / asyncpg) when unset
+    ASYNC_DATABASE_URL: str | None = None
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    # Seconds a SQLite connection waits for another writer's lock
+    SQLITE_BUSY_TIMEOUT: float = 30.0
     
     # API settings
     API_V1_STR: str = "/api/v1"
@@ -17,10 +26,49 @@ class Settings(BaseSettings):
     
     # External API URLs
     CONGRESS_API_BASE_URL: str = "https://api.congress.gov/v3"
+    CONGRESS_PAGE_SIZE: int = 250
+    CONGRESS_MAX_CONCURRENCY: int = 4
+    FEDERAL_REGISTER_API_BASE_URL: str = "https://www.federalregister.gov/api/v1"
     
+    # Seconds a list endpoint total is reused before it is recounted
+    COUNT_CACHE_TTL: int = 60
+
+    # Cache for derived payloads such as /stats: memory:// or a redis:// URL.
+    # Scrapers invalidate it on commit; the TTL only bounds staleness when
+    # the API and the workers do not share a Redis instance.
+    CACHE_URL: str = "memory://"
+    CACHE_TTL: int = 3600
+    # Rendered list/detail/stats responses kept in memory (ignored with Redis)
+    RESPONSE_CACHE_SIZE: int = 1024
+
     # Rate limiting
     RATELIMIT_STORAGE_URL: str = "memory://"
     DEFAULT_RATE_LIMIT: str = "100/minute"
+
+    # Scraper persistence
+    SCRAPER_BATCH_SIZE: int = 500
+
+    # Scraper HTTP: seconds to connect / to wait for a response, and
+    # transport retries of connection errors and 500/502/504
+    SCRAPER_CONNECT_TIMEOUT: float = 5.0
+    SCRAPER_READ_TIMEOUT: float = 30.0
+    SCRAPER_HTTP_RETRIES: int = 3
+    # On-disk cache of upstream responses (off when unset): entries younger
+    # than the TTL skip the network, older ones are revalidated. Offline
+    # mode replays from the cache only.
+    SCRAPER_CACHE_DIR: str | None = None
+    SCRAPER_CACHE_TTL: int = 86400
+    SCRAPER_CACHE_MAX_BYTES: int = 2 * 1024 ** 3
+    SCRAPER_OFFLINE: bool = False
+
+    # Scrape orchestration: units (congresses, administrations, states) of
+    # one source run at most this many at a time
+    SCRAPER_CONCURRENCY: Dict[str, int] = {"congress": 3, "federal_register": 2, "state": 2}
+    # Comma-separated state codes, or ALL for every state with an adapter
+    SCRAPER_STATES: str = "NY"
+    # Open States-style bulk dumps of state bills: a local directory, or a
+    # URL template with {state} (lowercase code), e.g. .../{state}.jsonl
+    STATE_BULK_DATA_URL: str | None = None
     
     # CORS Settings
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
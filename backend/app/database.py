@@ -1,16 +1,76 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import get_settings
 
 settings = get_settings()
-engine = create_engine(settings.DATABASE_URL)
+
+# Async drivers used by the API for each synchronous DATABASE_URL backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def async_database_url(url: str) -> str:
+    """``url`` with its driver swapped for the asyncio equivalent"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def pool_options(url: str) -> dict:
+    """Pool sizing from Settings; in-memory SQLite has a single static connection"""
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    options = {}
+    if url.get_driver_name() == "aiosqlite":
+        # aiosqlite defaults to NullPool, reconnecting on every request
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return {
+        **options,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+def connect_args(url: str) -> dict:
+    """Driver options; SQLite writers wait for each other's locks instead of failing"""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"timeout": settings.SQLITE_BUSY_TIMEOUT}
+    return {}
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    connect_args=connect_args(settings.DATABASE_URL),
+    **pool_options(settings.DATABASE_URL)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=connect_args(ASYNC_DATABASE_URL),
+    **pool_options(ASYNC_DATABASE_URL)
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,6 +1,8 @@
 # backend/app/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import make_asgi_app
+from .api.response_cache import ResponseCacheMiddleware
 from .api.routes import api_router
 from .config import get_settings
 
@@ -20,9 +22,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read-only routes whose responses only change when a scrape commits
+app.add_middleware(ResponseCacheMiddleware, routes={
+    "federal": rf"{settings.API_V1_STR}/federal",
+    "executive": rf"{settings.API_V1_STR}/executive",
+    "legislation": rf"{settings.API_V1_STR}/legislation/[^/]+",
+    "actions": rf"{settings.API_V1_STR}/legislation/[^/]+/actions",
+    "stats": rf"{settings.API_V1_STR}/stats",
+    "stats_breakdown": rf"{settings.API_V1_STR}/stats/breakdown",
+}, volatile_params=["stale_days"])
+
 # Include routers
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Prometheus metrics, including response cache hits and latency
+app.mount("/metrics", make_asgi_app())
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
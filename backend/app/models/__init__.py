@@ -1,9 +1,22 @@
-from .models import Legislation, LegislativeAction, LegislationType, Status, Base
+from .models import Legislation, LegislationDocument, LegislationRollup, LegislativeAction, LegislationType, Status, ScrapeRun, ScrapeState, Base
+from .rollups import ROLLUP_DIMENSIONS, ROLLUP_SOURCE_COLUMNS, rebuild_rollups, rollup_deltas
+from .search import SEARCH_TABLE, search_table, search_text
 
 __all__ = [
     'Legislation',
+    'LegislationDocument',
+    'LegislationRollup',
     'LegislativeAction',
     'LegislationType',
     'Status',
+    'ScrapeRun',
+    'ScrapeState',
+    'ROLLUP_DIMENSIONS',
+    'ROLLUP_SOURCE_COLUMNS',
+    'rebuild_rollups',
+    'rollup_deltas',
+    'SEARCH_TABLE',
+    'search_table',
+    'search_text',
     'Base'
 ]
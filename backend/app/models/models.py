@@ -1,9 +1,46 @@
-from sqlalchemy import Column, String, DateTime, JSON, Enum, ForeignKey
+from sqlalchemy import Boolean, Column, String, DateTime, Float, JSON, Enum, ForeignKey, Index, Integer, LargeBinary
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.sql.functions import FunctionElement
+from datetime import datetime, timedelta
+from typing import Optional
 import enum
+import hashlib
+import zlib
 from ..database import Base
 
+class days_since(FunctionElement):
+    """Whole days from a naive UTC timestamp to now, NULL when it is NULL"""
+    type = Integer()
+    inherit_cache = True
+
+@compiles(days_since)
+def _days_since_default(element, compiler, **kw):
+    return f"CAST(EXTRACT(DAY FROM CURRENT_TIMESTAMP - {compiler.process(element.clauses, **kw)}) AS INTEGER)"
+
+@compiles(days_since, "sqlite")
+def _days_since_sqlite(element, compiler, **kw):
+    # julianday('now') is UTC, like the stored timestamps
+    return f"CAST(julianday('now') - julianday({compiler.process(element.clauses, **kw)}) AS INTEGER)"
+
+@compiles(days_since, "postgresql")
+def _days_since_postgresql(element, compiler, **kw):
+    # Columns are timestamp without time zone holding UTC; now() is local to the session
+    return (
+        f"CAST(floor(extract(epoch FROM timezone('utc', now()) - {compiler.process(element.clauses, **kw)}) / 86400) "
+        "AS INTEGER)"
+    )
+
+def stale_cutoff(days: int) -> datetime:
+    """Last action dates before this are more than ``days`` days old.
+
+    Truncated to the minute, so the stale-list queries of that minute
+    share their parameters and with them a cached count.
+    """
+    return datetime.utcnow().replace(second=0, microsecond=0) - timedelta(days=days)
+
 class LegislationType(str, enum.Enum):
     """Type of legislation"""
     FEDERAL = "FEDERAL"
@@ -19,10 +56,100 @@ class Status(str, enum.Enum):
     SIGNED = "SIGNED"      # Signed into law
     VETOED = "VETOED"      # Vetoed by executive
 
+class ScrapeState(Base):
+    """Sync watermark per scraper source and scope (congress or administration)"""
+    __tablename__ = "scrape_state"
+
+    source = Column(String, primary_key=True)
+    scope = Column(String, primary_key=True)
+    last_synced_at = Column(DateTime, nullable=False)
+    last_full_sync_at = Column(DateTime)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ScrapeState {self.source}/{self.scope} synced {self.last_synced_at}>"
+
+class ScrapeRun(Base):
+    """Outcome of one scrape of a source scope, written when the scrape ends"""
+    __tablename__ = "scrape_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source = Column(String, nullable=False)
+    scope = Column(String, nullable=False)
+    full = Column(Boolean, nullable=False, default=False)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=False)
+    duration_seconds = Column(Float, nullable=False)
+    pages = Column(Integer, nullable=False, default=0)
+    fetched = Column(Integer, nullable=False, default=0)
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    unchanged = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    error = Column(String)
+
+    __table_args__ = (
+        Index("ix_scrape_runs_source_started_at", "source", "started_at"),
+    )
+
+    def __repr__(self):
+        return f"<ScrapeRun {self.source}/{self.scope} at {self.started_at}>"
+
+class LegislationRollup(Base):
+    """Legislation counts per combination of the dashboard dimensions.
+
+    Kept current by the scrapers' batched upsert, which applies the count
+    deltas of the rows it changes in the same transaction, so dashboard
+    aggregates read O(groups) rows instead of O(legislation). Dimensions
+    are never NULL so that each combination has exactly one row: an
+    undated item counts under year 0, and a missing congress, president
+    or state is "".
+    """
+    __tablename__ = "legislation_rollups"
+
+    type = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    congress = Column(String, primary_key=True)
+    president = Column(String, primary_key=True)
+    state = Column(String(2), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<LegislationRollup {self.type}/{self.status}/{self.year}: {self.count}>"
+
+class LegislationDocument(Base):
+    """zlib-compressed full text of a legislation item, kept off the list rows"""
+    __tablename__ = "legislation_documents"
+
+    legislation_id = Column(String, ForeignKey('legislation.id', ondelete="CASCADE"), primary_key=True)
+    content_type = Column(String, nullable=False, server_default="text/html")
+    body = Column(LargeBinary, nullable=False)
+    raw_size = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    legislation = relationship("Legislation", back_populates="document")
+
+    @staticmethod
+    def compress(text: str) -> bytes:
+        return zlib.compress(text.encode("utf-8"), 6)
+
+    @property
+    def text(self) -> str:
+        return zlib.decompress(self.body).decode("utf-8")
+
+    def __repr__(self):
+        return f"<LegislationDocument {self.legislation_id} ({len(self.body)}/{self.raw_size} bytes)>"
+
 class LegislativeAction(Base):
     """Model for tracking legislative actions"""
     __tablename__ = "legislative_actions"
+    # Serves the timeline of one bill in (action_date, id) keyset order
+    __table_args__ = (
+        Index("ix_legislative_actions_legislation_date", "legislation_id", "action_date", "id"),
+    )
 
+    # Natural key (see natural_id), so re-ingesting a timeline is idempotent
     id = Column(String, primary_key=True)
     legislation_id = Column(String, ForeignKey('legislation.id'), nullable=False)
     action_date = Column(DateTime, nullable=False)
@@ -30,16 +157,42 @@ class LegislativeAction(Base):
     description = Column(String)
     extra_data = Column(JSON)
     created_at = Column(DateTime, server_default=func.now())
+    # Set by every upsert of the bill's timeline; older rows were dropped upstream
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationship back to the legislation
     legislation = relationship("Legislation", back_populates="actions")
 
+    @staticmethod
+    def natural_id(
+        legislation_id: str,
+        action_date: datetime,
+        action_type: str,
+        description: Optional[str],
+        source: Optional[str] = None
+    ) -> str:
+        """Stable id of an action: its bill plus a digest of what happened, when and who reported it"""
+        key = "\x1f".join([action_date.isoformat(), action_type, description or "", source or ""])
+        return f"{legislation_id}:{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}"
+
     def __repr__(self):
         return f"<LegislativeAction {self.action_type} on {self.action_date}>"
 
 class Legislation(Base):
     """Model for legislation data"""
     __tablename__ = "legislation"
+    # Match the list routes: filter on type (and status), newest first.
+    # A descending ORDER BY is served by scanning these indexes backwards.
+    __table_args__ = (
+        Index("ix_legislation_type_introduced", "type", "introduced_date", "id"),
+        Index("ix_legislation_type_status_introduced", "type", "status", "introduced_date", "id"),
+        Index("ix_legislation_type_congress_introduced", "type", "congress", "introduced_date", "id"),
+        Index("ix_legislation_type_president_introduced", "type", "president", "introduced_date", "id"),
+        Index("ix_legislation_type_state_introduced", "type", "state", "introduced_date", "id"),
+        # Stale-bill filters: last action older than a cutoff
+        Index("ix_legislation_type_last_action", "type", "last_action_date", "id"),
+        Index("ix_legislation_bill", "congress", "bill_type", "bill_number"),
+    )
 
     id = Column(String, primary_key=True)
     type = Column(Enum(LegislationType), nullable=False)
@@ -49,12 +202,22 @@ class Legislation(Base):
     introduced_date = Column(DateTime)
     last_action_date = Column(DateTime)
     source_url = Column(String)
+    # Filterable fields promoted out of extra_data
+    congress = Column(String)
+    president = Column(String)
+    state = Column(String(2))
+    bill_type = Column(String)
+    bill_number = Column(String)
     extra_data = Column(JSON)
+    # SHA-256 of the normalized scraper payload, used to skip no-op rewrites
+    content_hash = Column(String(64))
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
 
     # Relationship to actions
     actions = relationship("LegislativeAction", back_populates="legislation", cascade="all, delete-orphan")
+    # Full text is only loaded when accessed, i.e. by the detail endpoint
+    document = relationship("LegislationDocument", back_populates="legislation", uselist=False, cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<Legislation(id={self.id}, type={self.type}, title={self.title})>"
@@ -63,33 +226,63 @@ class Legislation(Base):
     def current_status(self) -> str:
         return self.status.value if self.status else "unknown"
 
-    @property
+    # Whole days since a date, 0 when it is unset: computed with datetime on
+    # an instance, and as the dialect's date arithmetic in a query
+    @hybrid_property
     def days_since_introduction(self) -> int:
         if not self.introduced_date:
             return 0
-        delta = func.now() - self.introduced_date
-        return delta.days
+        return (datetime.utcnow() - self.introduced_date).days
 
-    @property
+    @days_since_introduction.inplace.expression
+    @classmethod
+    def _days_since_introduction_expression(cls):
+        return func.coalesce(days_since(cls.introduced_date), 0).label("days_since_introduction")
+
+    @hybrid_property
     def days_since_last_action(self) -> int:
         if not self.last_action_date:
             return 0
-        delta = func.now() - self.last_action_date
-        return delta.days
+        return (datetime.utcnow() - self.last_action_date).days
+
+    @days_since_last_action.inplace.expression
+    @classmethod
+    def _days_since_last_action_expression(cls):
+        return func.coalesce(days_since(cls.last_action_date), 0).label("days_since_last_action")
+
+    @hybrid_method
+    def is_stale(self, days: int) -> bool:
+        """No action for more than ``days`` days; bills with no action date are never stale"""
+        return self.last_action_date is not None and self.last_action_date < stale_cutoff(days)
+
+    @is_stale.inplace.expression
+    @classmethod
+    def _is_stale_expression(cls, days: int):
+        # A plain range on last_action_date, so ix_legislation_type_last_action
+        # serves it, unlike a comparison on days_since_last_action
+        return cls.last_action_date < stale_cutoff(days)
 
-    def add_action(self, action_type: str, description: str, extra_data: dict = None) -> LegislativeAction:
-        from uuid import uuid4
-        
+    def add_action(
+        self,
+        action_type: str,
+        description: str,
+        extra_data: dict = None,
+        action_date: Optional[datetime] = None,
+        source: Optional[str] = None
+    ) -> LegislativeAction:
+        """Record a single action through the session; scrapers write timelines in bulk instead"""
+        action_date = action_date or datetime.utcnow()
         action = LegislativeAction(
-            id=str(uuid4()),
+            id=LegislativeAction.natural_id(self.id, action_date, action_type, description, source),
             legislation_id=self.id,
             action_type=action_type,
             description=description,
             extra_data=extra_data or {},
-            action_date=func.now()
+            action_date=action_date
         )
         self.actions.append(action)
-        self.last_action_date = action.action_date
+        if self.last_action_date is None or action_date > self.last_action_date:
+            self.last_action_date = action_date
         return action
 
     def update_status(self, new_status: Status) -> None:
@@ -0,0 +1,69 @@
+"""Maintenance of legislation_rollups, the precomputed dashboard counts.
+
+Scrapers keep the table current incrementally: each batch they upsert
+turns into per-combination count deltas (``rollup_deltas``) written in the
+same transaction. ``rebuild_rollups`` recomputes it from scratch, for
+migrations, after bulk deletes, or to repair drift.
+"""
+from collections import Counter
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+from sqlalchemy import Integer, cast, delete, extract, func, insert, select
+
+from .models import Legislation, LegislationRollup
+
+ROLLUP_DIMENSIONS = ("type", "status", "year", "congress", "president", "state")
+
+# Legislation columns a rollup key is derived from
+ROLLUP_SOURCE_COLUMNS = ("type", "status", "introduced_date", "congress", "president", "state")
+
+RollupKey = Tuple[str, str, int, str, str, str]
+
+
+def _value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+def rollup_key(row: Mapping[str, Any]) -> RollupKey:
+    """The rollup combination a legislation row counts under"""
+    introduced = row.get("introduced_date")
+    return (
+        _value(row["type"]),
+        _value(row["status"]),
+        introduced.year if introduced else 0,
+        row.get("congress") or "",
+        row.get("president") or "",
+        row.get("state") or "",
+    )
+
+
+def rollup_deltas(
+    changed: Iterable[Mapping[str, Any]],
+    previous: Mapping[str, Mapping[str, Any]]
+) -> Dict[RollupKey, int]:
+    """Count changes from writing ``changed`` rows over the ``previous`` state of those that existed"""
+    deltas: Counter = Counter()
+    for row in changed:
+        deltas[rollup_key(row)] += 1
+        if row["id"] in previous:
+            deltas[rollup_key(previous[row["id"]])] -= 1
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def rebuild_rollups(db) -> None:
+    """Recompute every rollup from the legislation table with one INSERT ... SELECT"""
+    table = Legislation.__table__
+    year = func.coalesce(cast(extract("year", table.c.introduced_date), Integer), 0)
+    dimensions = [
+        table.c.type,
+        table.c.status,
+        year,
+        func.coalesce(table.c.congress, ""),
+        func.coalesce(table.c.president, ""),
+        func.coalesce(table.c.state, ""),
+    ]
+    db.execute(delete(LegislationRollup.__table__))
+    db.execute(insert(LegislationRollup.__table__).from_select(
+        [*ROLLUP_DIMENSIONS, "count"],
+        select(*dimensions, func.count()).group_by(*dimensions)
+    ))
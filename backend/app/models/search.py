@@ -0,0 +1,60 @@
+"""Full-text index over legislation titles, summaries and document bodies.
+
+The index lives in ``legislation_search``, outside the ORM mapping because
+its shape depends on the dialect: an FTS5 virtual table on SQLite, and a
+plain table with a generated, GIN-indexed ``tsvector`` on PostgreSQL. Both
+expose the same (id, title, summary, body) columns, so the scrapers write to
+it through the lightweight ``search_table`` construct either way.
+"""
+import html
+import re
+
+from sqlalchemy import DDL, column, event, table
+
+from .models import Base
+
+SEARCH_TABLE = "legislation_search"
+
+search_table = table(
+    SEARCH_TABLE,
+    column("id"),
+    column("title"),
+    column("summary"),
+    column("body"),
+)
+
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    "id UNINDEXED, title, summary, body, tokenize='porter unicode61')",
+]
+
+POSTGRESQL_DDL = [
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+    "id VARCHAR PRIMARY KEY REFERENCES legislation (id) ON DELETE CASCADE, "
+    "title TEXT, summary TEXT, body TEXT, "
+    "document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(body, '')), 'C')"
+    ") STORED)",
+    f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING GIN (document)",
+]
+
+DROP_DDL = f"DROP TABLE IF EXISTS {SEARCH_TABLE}"
+
+_TAG = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+
+
+def search_text(body):
+    """Plain text of an HTML document body, for indexing"""
+    if not body:
+        return None
+    return _SPACE.sub(" ", html.unescape(_TAG.sub(" ", body))).strip()
+
+
+for statement in SQLITE_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRESQL_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+event.listen(Base.metadata, "before_drop", DDL(DROP_DDL))
@@ -0,0 +1,15 @@
+from .legislation import (
+    LegislationSummary, LegislationDetail, LegislationPage, LegislativeActionSummary, ActionPage,
+    SearchResult, SearchPage, SUMMARY_COLUMNS
+)
+
+__all__ = [
+    'LegislationSummary',
+    'LegislationDetail',
+    'LegislationPage',
+    'LegislativeActionSummary',
+    'ActionPage',
+    'SearchResult',
+    'SearchPage',
+    'SUMMARY_COLUMNS'
+]
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
+from ..models import Legislation, LegislationType, Status
+
+class LegislationSummary(BaseModel):
+    """Row shape returned by the list endpoints"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    type: LegislationType
+    title: str
+    summary: Optional[str] = None
+    status: Status
+    introduced_date: Optional[datetime] = None
+    last_action_date: Optional[datetime] = None
+    source_url: Optional[str] = None
+    congress: Optional[str] = None
+    president: Optional[str] = None
+    state: Optional[str] = None
+    bill_type: Optional[str] = None
+    bill_number: Optional[str] = None
+
+class LegislationDetail(LegislationSummary):
+    """Full record, including extra_data and the stored document body"""
+    extra_data: Optional[Dict[str, Any]] = None
+    full_text: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_legislation(cls, item: Legislation) -> "LegislationDetail":
+        detail = cls.model_validate(item)
+        detail.full_text = item.document.text if item.document else None
+        return detail
+
+class LegislationPage(BaseModel):
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
+    limit: int
+    next_cursor: Optional[str] = None
+    data: List[LegislationSummary]
+
+class LegislativeActionSummary(BaseModel):
+    """One entry of a bill's action timeline"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    action_date: datetime
+    action_type: str
+    description: Optional[str] = None
+    extra_data: Optional[Dict[str, Any]] = None
+
+class ActionPage(BaseModel):
+    limit: int
+    next_cursor: Optional[str] = None
+    data: List[LegislativeActionSummary]
+
+class SearchResult(LegislationSummary):
+    """List row plus the matched excerpt, with hits wrapped in <mark> tags"""
+    snippet: Optional[str] = None
+    rank: float
+
+class SearchPage(BaseModel):
+    total: int
+    page: int
+    pages: int
+    limit: int
+    data: List[SearchResult]
+
+# Columns selected by the list endpoints instead of hydrating entities
+SUMMARY_COLUMNS = [
+    getattr(Legislation, name) for name in LegislationSummary.model_fields
+]
@@ -1,7 +1,9 @@
 from .base import BaseScraper, APIKeyMissingError, RateLimitError
 from .congress import CongressScraper
 from .state import StateLegislatureScraper
+from .state_adapters import StateAdapter, register_adapter
 from .federal_register import FederalRegisterScraper
+from .throttle import RateLimiter
 
 __all__ = [
     'BaseScraper',
@@ -9,6 +11,9 @@ __all__ = [
     'RateLimitError',
     'CongressScraper',
     'StateLegislatureScraper',
-    'FederalRegisterScraper'
+    'StateAdapter',
+    'register_adapter',
+    'FederalRegisterScraper',
+    'RateLimiter'
 ]
 
@@ -1,24 +1,96 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import islice
+import hashlib
+import json
+from typing import Callable, List, Dict, Any, Mapping, Optional, Iterable, Iterator
 import logging
-from ratelimit import limits, sleep_and_retry
+import time
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import literal
+from sqlalchemy import delete, insert, literal, select, func
+from sqlalchemy.dialects import postgresql, sqlite
+from ..cache import BREAKDOWN_KEY, STATS_KEY, bump_data_version, invalidate
 from ..database import SessionLocal
 from ..config import get_settings
-from ..models import Legislation, Status, LegislationType
+from .http_cache import open_cache
+from .http_client import HTTPClient
+from .throttle import RateLimitError  # noqa: F401 (re-exported)
+from ..models import (
+    Legislation, LegislationDocument, LegislationRollup, LegislativeAction, Status, LegislationType, ScrapeRun,
+    ScrapeState, ROLLUP_DIMENSIONS, ROLLUP_SOURCE_COLUMNS, rollup_deltas, search_table, search_text
+)
 
 class APIKeyMissingError(Exception):
     pass
 
-class RateLimitError(Exception):
-    pass
+# Columns written by the batched upsert; everything else is server-managed
+UPSERT_COLUMNS = [
+    "id", "type", "title", "summary", "status", "introduced_date",
+    "last_action_date", "source_url", "congress", "president", "state",
+    "bill_type", "bill_number", "extra_data",
+]
+
+# Counters of a scrape run, persisted to scrape_runs
+RUN_COUNTERS = ("pages", "fetched", "inserted", "updated", "unchanged", "failed")
+
+def empty_counts() -> Dict[str, int]:
+    return dict.fromkeys(RUN_COUNTERS, 0)
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """A naive UTC datetime from an ISO date or timestamp, None when blank or malformed"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def content_hash(
+    row: Dict[str, Any],
+    full_text: Optional[str] = None,
+    actions: Optional[List[Dict[str, Any]]] = None
+) -> str:
+    """Stable SHA-256 over the normalized payload of a legislation row"""
+    payload = {name: row.get(name) for name in UPSERT_COLUMNS}
+    if full_text:
+        payload["full_text"] = full_text
+    if actions is not None:
+        payload["actions"] = actions
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of at most ``size`` items from ``rows``"""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 class BaseScraper(ABC):
+    # Key under which sync watermarks are stored in scrape_state
+    source: str = ""
+    # Keep-alive connections per upstream host; raise it for scrapers
+    # that fetch pages concurrently
+    http_pool_size: int = 1
+    # Set when the source's rows may carry only part of what another of
+    # its ingest paths stored: a missing summary then keeps the stored one
+    # and extra_data keys are merged into the stored object (see _merge_stored)
+    merge_partial_rows: bool = False
+
     def __init__(self):
         self._db = None
+        self._http = None
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.settings = get_settings()
+        self.batch_size = self.settings.SCRAPER_BATCH_SIZE
+        # Counters of the run in progress, see track_run
+        self.counts = empty_counts()
 
     @property
     def db(self):
@@ -26,10 +98,32 @@ class BaseScraper(ABC):
             self._db = SessionLocal()
         return self._db
 
+    @property
+    def http(self) -> HTTPClient:
+        """Pooled keep-alive sessions shared by every request of this scraper"""
+        if self._http is None:
+            settings = self.settings
+            cache = None
+            if settings.SCRAPER_CACHE_DIR:
+                cache = open_cache(
+                    settings.SCRAPER_CACHE_DIR, settings.SCRAPER_CACHE_TTL, settings.SCRAPER_CACHE_MAX_BYTES
+                )
+            self._http = HTTPClient(
+                pool_size=self.http_pool_size,
+                timeout=(settings.SCRAPER_CONNECT_TIMEOUT, settings.SCRAPER_READ_TIMEOUT),
+                retries=settings.SCRAPER_HTTP_RETRIES,
+                cache=cache,
+                offline=settings.SCRAPER_OFFLINE
+            )
+        return self._http
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._http:
+            self._http.close()
+            self._http = None
         if self._db:
             self._db.close()
             self._db = None
@@ -39,9 +133,121 @@ class BaseScraper(ABC):
             raise APIKeyMissingError(f"API key required for {source}")
 
     @abstractmethod
-    def scrape(self) -> List[Dict[str, Any]]:
+    def scrape(self) -> Dict[str, Any]:
+        """Run a scrape and return its summary (see scrape_scopes)"""
         pass
 
+    @contextmanager
+    def track_run(self, scope: str, full: bool = False) -> Iterator[Dict[str, int]]:
+        """Count one scrape of ``scope`` and record it in scrape_runs when it ends.
+
+        Yields ``self.counts``, reset for the run, which the fetch, parse and
+        upsert stages bump as rows go by. A run that raises is recorded
+        with its error and the exception propagates.
+        """
+        self.counts = counts = empty_counts()
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        error = None
+        try:
+            yield counts
+        except Exception as e:
+            error = str(e)
+            self.db.rollback()
+            raise
+        finally:
+            try:
+                self.db.add(ScrapeRun(
+                    source=self.source,
+                    scope=scope,
+                    full=full,
+                    started_at=started_at,
+                    finished_at=datetime.utcnow(),
+                    duration_seconds=time.perf_counter() - started,
+                    error=error,
+                    **counts
+                ))
+                self.db.commit()
+            except Exception as e:
+                # Losing the record must not fail the scrape itself
+                self.db.rollback()
+                self.logger.error(f"Could not record scrape run of {self.source}/{scope}: {str(e)}")
+
+    def scrape_scopes(
+        self,
+        scopes: Iterable[str],
+        scrape_scope: Callable[[str, bool], Dict[str, int]],
+        full: bool = False
+    ) -> Dict[str, Any]:
+        """Scrape each scope in turn, carrying on past failures; returns the run summary.
+
+        The summary is small and JSON-serializable, so Celery can keep it as
+        a task result: the RUN_COUNTERS totals, timing, and the error of
+        every scope that failed.
+        """
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        totals = empty_counts()
+        errors = {}
+        for scope in scopes:
+            try:
+                counts = scrape_scope(scope, full)
+            except Exception as e:
+                print(f"Error processing {self.source} {scope}: {str(e)}")
+                errors[scope] = str(e)
+                continue
+            for key, value in counts.items():
+                totals[key] += value
+
+        summary = {
+            "source": self.source,
+            "full": full,
+            "started_at": started_at.isoformat(),
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            **totals,
+            "errors": errors,
+        }
+        print(
+            f"\n{self.source}: {totals['fetched']} fetched from {totals['pages']} pages, "
+            f"{totals['inserted']} added, {totals['updated']} updated, {totals['unchanged']} unchanged, "
+            f"{totals['failed']} failed in {summary['duration_seconds']:.1f}s"
+        )
+        return summary
+
+    def invalidate_caches(self) -> None:
+        """Drop cached payloads derived from the legislation table"""
+        invalidate(STATS_KEY)
+        invalidate(BREAKDOWN_KEY)
+        bump_data_version()
+
+    def get_watermark(self, scope: str) -> Optional[datetime]:
+        """Start time of the last successful sync of ``scope``, if any"""
+        state = self.db.get(ScrapeState, (self.source, scope))
+        return state.last_synced_at if state else None
+
+    def set_watermark(self, scope: str, synced_at: datetime, full: bool = False) -> None:
+        """Record a successful sync of ``scope`` that started at ``synced_at``.
+
+        Runs in which any row failed to normalize leave the watermark where
+        it was, so the next incremental sync asks for those rows again.
+        """
+        if self.settings.SCRAPER_OFFLINE:
+            # A replay is only as recent as the cached responses
+            return
+        if self.counts["failed"]:
+            self.logger.warning(
+                f"Keeping the {self.source}/{scope} watermark: {self.counts['failed']} rows failed"
+            )
+            return
+        state = self.db.get(ScrapeState, (self.source, scope))
+        if state is None:
+            state = ScrapeState(source=self.source, scope=scope)
+            self.db.add(state)
+        state.last_synced_at = synced_at
+        if full:
+            state.last_full_sync_at = synced_at
+        self.db.commit()
+
     def save_legislation(self, data: Dict[str, Any]) -> None:
         try:
             # Log the data before saving
@@ -58,19 +264,28 @@ class BaseScraper(ABC):
                 Legislation.id == data['id']
             ).first()
 
+            def dimensions(item):
+                return {"id": item.id, **{name: getattr(item, name) for name in ROLLUP_SOURCE_COLUMNS}}
+
+            previous = {}
             if existing:
+                previous[existing.id] = dimensions(existing)
                 # Update existing record
                 for key, value in data.items():
                     setattr(existing, key, value)
+                legislation = existing
                 self.logger.info(f"Updated legislation: {data['id']}")
             else:
                 # Create new record
                 legislation = Legislation(**data)
                 self.db.add(legislation)
                 self.logger.info(f"Added new legislation: {data['id']}")
+            self._index_search([data], {}, {data['id']} if existing else set())
+            self._apply_rollups(rollup_deltas([dimensions(legislation)], previous))
             
             # Commit and verify
             self.db.commit()
+            self.invalidate_caches()
             
             # Verify the save worked
             saved = self.db.query(Legislation).filter(
@@ -83,12 +298,304 @@ class BaseScraper(ABC):
             self.db.rollback()
             raise
 
+    def upsert_legislation(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Persist normalized legislation rows in batches of ``self.batch_size``.
+
+        Rows are plain dicts keyed by ``UPSERT_COLUMNS``, plus an optional
+        ``full_text`` that is stored compressed in legislation_documents
+        rather than on the row itself, and an optional ``actions`` list
+        (see _action_rows) that replaces the row's timeline in
+        legislative_actions. Rows without ``actions`` leave their stored
+        timeline alone. Each batch costs one
+        SELECT of the stored content hashes and at most one INSERT ... ON
+        CONFLICT statement, and is committed on its own together with the
+        legislation_rollups deltas of the rows it changed. Rows whose hash
+        is unchanged are not written at all. Returns the totals of inserted,
+        updated and unchanged rows across all batches.
+        """
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0}
+        for number, batch in enumerate(chunked(rows, self.batch_size), start=1):
+            counts = self._upsert_batch(batch)
+            for key, value in counts.items():
+                totals[key] += value
+            self.logger.info(
+                f"Batch {number}: {counts['inserted']} inserted, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+            )
+        self.logger.info(
+            f"{totals['inserted'] + totals['updated']} of {sum(totals.values())} rows changed"
+        )
+        return totals
+
+    def _upsert_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, int]:
+        table = Legislation.__table__
+
+        # A statement may not touch the same row twice, so the last
+        # occurrence of an id within the batch wins
+        rows = {}
+        documents = {}
+        actions = {}
+        for data in batch:
+            rows[data["id"]] = self._prepare_row(data)
+            documents[data["id"]] = data.get("full_text")
+            actions[data["id"]] = data.get("actions")
+
+        # The stored rollup dimensions, and what partial rows merge into,
+        # come along so the batch needs no second read. On PostgreSQL the
+        # rows stay locked until the batch commits, so no other writer
+        # changes them in between (SQLite serializes writers and ignores
+        # FOR UPDATE).
+        columns = [table.c.id, table.c.content_hash, *(table.c[name] for name in ROLLUP_SOURCE_COLUMNS)]
+        if self.merge_partial_rows:
+            columns += [table.c.summary, table.c.extra_data]
+        existing = {
+            stored["id"]: stored
+            for stored in self.db.execute(
+                select(*columns).where(
+                    table.c.id.in_(list(rows))
+                ).with_for_update()
+            ).mappings()
+        }
+
+        changed = []
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        for row_id, row in rows.items():
+            if row_id not in existing:
+                counts["inserted"] += 1
+            elif existing[row_id]["content_hash"] != row["content_hash"]:
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
+                continue
+            if self.merge_partial_rows and row_id in existing:
+                row = self._merge_stored(row, existing[row_id])
+            changed.append(row)
+
+        if changed:
+            try:
+                # Rows a concurrent writer already stored with the same hash
+                # are skipped by the statement and must not count twice
+                written = set(self.db.execute(
+                    self._upsert_statement(table).returning(table.c.id), changed
+                ).scalars())
+                changed_documents = [
+                    {
+                        "legislation_id": row["id"],
+                        "body": LegislationDocument.compress(documents[row["id"]]),
+                        "raw_size": len(documents[row["id"]].encode("utf-8")),
+                    }
+                    for row in changed if documents[row["id"]]
+                ]
+                if changed_documents:
+                    self.db.execute(self._document_upsert_statement(), changed_documents)
+                timelines = {row["id"]: actions[row["id"]] for row in changed if actions[row["id"]] is not None}
+                if timelines:
+                    self._replace_actions(timelines)
+                self._index_search(changed, documents, existing)
+                self._apply_rollups(rollup_deltas([row for row in changed if row["id"] in written], existing))
+                self.db.commit()
+                self.invalidate_caches()
+            except Exception as e:
+                self.logger.error(f"Error upserting batch: {str(e)}")
+                self.db.rollback()
+                raise
+        else:
+            # Release the row locks of the SELECT
+            self.db.commit()
+        return counts
+
+    def _action_rows(
+        self,
+        legislation_id: str,
+        actions: List[Dict[str, Any]],
+        synced_at: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """legislative_actions rows of one timeline.
+
+        Scrapers normalize each upstream action to a dict of
+        ``action_date``, ``action_type``, ``description``, ``extra_data``
+        and optionally ``source`` (who reported it, part of the natural
+        key). Undated actions cannot be placed on a timeline and are skipped.
+        """
+        for action in actions:
+            if action.get("action_date") is None:
+                continue
+            yield {
+                "id": LegislativeAction.natural_id(
+                    legislation_id, action["action_date"], action["action_type"],
+                    action.get("description"), action.get("source")
+                ),
+                "legislation_id": legislation_id,
+                "action_date": action["action_date"],
+                "action_type": action["action_type"],
+                "description": action.get("description"),
+                "extra_data": action.get("extra_data") or {},
+                "updated_at": synced_at,
+            }
+
+    def _replace_actions(self, timelines: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Upsert the given timelines and drop actions no longer in them.
+
+        Every action of a timeline is written with the same ``updated_at``,
+        so what is left older on those bills afterwards was removed or
+        reworded upstream. Two executemany statements per batch, however
+        many actions it carries; nothing goes through the ORM.
+        """
+        table = LegislativeAction.__table__
+        synced_at = datetime.utcnow()
+        rows = {}
+        for legislation_id, actions in timelines.items():
+            for row in self._action_rows(legislation_id, actions, synced_at):
+                # Identical actions share a natural key; keep one
+                rows[row["id"]] = row
+        if rows:
+            self.db.execute(self._action_upsert_statement(), list(rows.values()))
+        self.db.execute(delete(table).where(
+            table.c.legislation_id.in_(list(timelines)),
+            table.c.updated_at < synced_at
+        ))
+
+    def _apply_rollups(self, deltas: Dict[tuple, int]) -> None:
+        """Add count deltas to legislation_rollups in the current transaction.
+
+        One executemany upsert adds each delta to its combination's count;
+        combinations that dropped to zero are then deleted so the table
+        only ever holds as many rows as there are non-empty groups.
+        """
+        if not deltas:
+            return
+        table = LegislationRollup.__table__
+        stmt = self._insert()(table)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c[name] for name in ROLLUP_DIMENSIONS],
+                set_={"count": table.c.count + stmt.excluded["count"]}
+            ),
+            [dict(zip(ROLLUP_DIMENSIONS, key), count=delta) for key, delta in deltas.items()]
+        )
+        if any(delta < 0 for delta in deltas.values()):
+            self.db.execute(delete(table).where(table.c.count <= 0))
+
+    def _index_search(
+        self,
+        rows: List[Dict[str, Any]],
+        documents: Dict[str, Optional[str]],
+        existing: Iterable[str]
+    ) -> None:
+        """Replace the full-text index entries of ``rows``.
+
+        Rows that already existed and came without a body keep indexing
+        the one stored in legislation_documents.
+        """
+        ids = [row["id"] for row in rows]
+        bodies = {row_id: documents.get(row_id) for row_id in ids}
+        stored = [row_id for row_id in ids if not bodies[row_id] and row_id in existing]
+        if stored:
+            for document in self.db.query(LegislationDocument).filter(
+                LegislationDocument.legislation_id.in_(stored)
+            ):
+                bodies[document.legislation_id] = document.text
+
+        self.db.execute(delete(search_table).where(search_table.c.id.in_(ids)))
+        self.db.execute(insert(search_table), [
+            {
+                "id": row["id"],
+                "title": row.get("title"),
+                "summary": search_text(row.get("summary")),
+                "body": search_text(bodies[row["id"]]),
+            }
+            for row in rows
+        ])
+
+    def _merge_stored(self, row: Dict[str, Any], stored: Mapping[str, Any]) -> Dict[str, Any]:
+        """``row`` over what is stored for it: top-level extra_data keys
+        replace the stored ones, and a missing summary keeps the stored one.
+
+        The content hash stays that of the incoming row, so the next scrape
+        of the same payload is still recognized as unchanged.
+        """
+        return {
+            **row,
+            "summary": row["summary"] if row["summary"] is not None else stored["summary"],
+            "extra_data": {**(stored["extra_data"] or {}), **(row["extra_data"] or {})},
+        }
+
+    def _prepare_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        row = {name: data.get(name) for name in UPSERT_COLUMNS}
+        if isinstance(row["type"], LegislationType):
+            row["type"] = row["type"].value
+        if isinstance(row["status"], Status):
+            row["status"] = row["status"].value
+        row["content_hash"] = content_hash(row, data.get("full_text"), data.get("actions"))
+        return row
+
+    def _insert(self):
+        """Dialect-specific insert() construct supporting ON CONFLICT"""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            return sqlite.insert
+        elif dialect == "postgresql":
+            return postgresql.insert
+        raise NotImplementedError(f"Batched upsert not supported on {dialect}")
+
+    def _upsert_statement(self, table):
+        """INSERT ... ON CONFLICT for the rows passed alongside it to execute().
+
+        Taking the rows as execute() parameters rather than .values(rows)
+        lets the statement compile once and stay cached; each batch still
+        goes to the database as multi-row INSERTs.
+        """
+        stmt = self._insert()(table)
+        update = {name: stmt.excluded[name] for name in UPSERT_COLUMNS if name != "id"}
+        update["content_hash"] = stmt.excluded.content_hash
+        update["updated_at"] = func.now()
+        # Re-check the hash in the statement itself so a concurrent writer
+        # that already stored the same payload does not cause a rewrite
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_=update,
+            where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        )
+
+    def _document_upsert_statement(self):
+        table = LegislationDocument.__table__
+        stmt = self._insert()(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.legislation_id],
+            set_={
+                "body": stmt.excluded.body,
+                "raw_size": stmt.excluded.raw_size,
+                "updated_at": func.now()
+            }
+        )
+
+    def _action_upsert_statement(self):
+        table = LegislativeAction.__table__
+        stmt = self._insert()(table)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                "action_date": stmt.excluded.action_date,
+                "action_type": stmt.excluded.action_type,
+                "description": stmt.excluded.description,
+                "extra_data": stmt.excluded.extra_data,
+                "updated_at": stmt.excluded.updated_at
+            }
+        )
+
     def clear_existing_data(self) -> None:
         try:
             print("Starting to clear data...")
+            self.db.execute(delete(search_table))
+            self.db.query(LegislationDocument).delete()
+            self.db.query(LegislativeAction).delete()
+            self.db.query(LegislationRollup).delete()
             query = self.db.query(Legislation)
             count = query.delete()
+            # Watermarks would otherwise make the next run skip the cleared rows
+            self.db.query(ScrapeState).delete()
             self.db.commit()
+            self.invalidate_caches()
             print(f"Cleared {count} existing records")
         except Exception as e:
             self.logger.error(f"Error clearing data: {str(e)}")
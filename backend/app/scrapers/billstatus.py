@@ -0,0 +1,196 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import os
+import zipfile
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from lxml import etree, html
+from .base import chunked
+
+# Files handed to a worker process at a time
+SOURCES_PER_TASK = 64
+
+# A bulk file: a path, or a zip archive and the member within it
+Source = Tuple[str, Optional[str]]
+
+def iter_sources(path: str) -> Iterator[Source]:
+    """Every BILLSTATUS XML file in a directory tree, a zip archive, or a single file"""
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                yield from iter_sources(os.path.join(root, name))
+    elif path.lower().endswith(".xml"):
+        yield (path, None)
+    elif zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for member in sorted(archive.namelist()):
+                if member.lower().endswith(".xml"):
+                    yield (path, member)
+
+def _text(element, path: str) -> Optional[str]:
+    value = element.findtext(path)
+    return value.strip() if value else None
+
+def _first_text(element, *paths: str) -> Optional[str]:
+    for path in paths:
+        value = _text(element, path)
+        if value:
+            return value
+    return None
+
+def _sponsor(item) -> Dict[str, Any]:
+    return {
+        "bioguideId": _text(item, "bioguideId"),
+        "fullName": _text(item, "fullName"),
+        "firstName": _text(item, "firstName"),
+        "lastName": _text(item, "lastName"),
+        "party": _text(item, "party"),
+        "state": _text(item, "state"),
+        "district": _text(item, "district"),
+    }
+
+def _committee(item) -> Dict[str, Any]:
+    return {
+        "systemCode": _text(item, "systemCode"),
+        "name": _text(item, "name"),
+        "chamber": _text(item, "chamber"),
+        "type": _text(item, "type"),
+    }
+
+def _action(item) -> Dict[str, Any]:
+    return {
+        "actionDate": _text(item, "actionDate"),
+        "actionTime": _text(item, "actionTime"),
+        "text": _text(item, "text"),
+        "type": _text(item, "type"),
+        "actionCode": _text(item, "actionCode"),
+        "sourceSystem": _text(item, "sourceSystem/name"),
+        "committees": [code.text for code in item.iterfind("committees/item/systemCode") if code.text],
+    }
+
+def _summary_text(bill) -> str:
+    """Plain text of the most recent summary; its body is an HTML fragment"""
+    summaries = (
+        bill.findall("summaries/summary")
+        or bill.findall("summaries/item")
+        or bill.findall("summaries/billSummaries/item")
+    )
+    if not summaries:
+        return ""
+    latest = max(summaries, key=lambda item: _text(item, "updateDate") or "")
+    fragment = _text(latest, "text")
+    if not fragment:
+        return ""
+    return " ".join(" ".join(html.fromstring(fragment).itertext()).split())
+
+def bill_item(bill) -> Dict[str, Any]:
+    """A Congress.gov API-style bill item from a BILLSTATUS <bill> element.
+
+    The bulk record carries what the bill list API leaves out (sponsors,
+    committees, subjects, summaries and every action), in the shape
+    CongressScraper._normalize_bill reads. Both the current (``type``,
+    ``number``) and the pre-2022 (``billType``, ``billNumber``) layouts
+    are understood.
+    """
+    actions = [_action(item) for item in bill.iterfind("actions/item")]
+    latest = bill.find("latestAction")
+    if latest is not None:
+        latest_action = {"actionDate": _text(latest, "actionDate"), "text": _text(latest, "text")}
+    elif actions:
+        newest = max(actions, key=lambda action: (action["actionDate"] or "", action["actionTime"] or ""))
+        latest_action = {"actionDate": newest["actionDate"], "text": newest["text"]}
+    else:
+        latest_action = {}
+
+    subjects = bill.find("subjects/legislativeSubjects")
+    if subjects is None:
+        subjects = bill.find("subjects/billSubjects/legislativeSubjects")
+    return {
+        "congress": _text(bill, "congress"),
+        "type": _first_text(bill, "type", "billType"),
+        "number": _first_text(bill, "number", "billNumber"),
+        "title": _text(bill, "title"),
+        "introducedDate": _text(bill, "introducedDate"),
+        "updateDate": _text(bill, "updateDate"),
+        "latestAction": latest_action,
+        "summary": _summary_text(bill),
+        "sponsors": [_sponsor(item) for item in bill.iterfind("sponsors/item")],
+        "committees": [_committee(item) for item in bill.iterfind("committees/item")]
+            or [_committee(item) for item in bill.iterfind("committees/billCommittees/item")],
+        "subjects": [
+            name.text for name in (subjects.iterfind("item/name") if subjects is not None else []) if name.text
+        ],
+        "policyArea": _first_text(
+            bill, "policyArea/name", "subjects/policyArea/name", "subjects/billSubjects/policyArea/name"
+        ),
+        "laws": [
+            {"type": _text(item, "type"), "number": _text(item, "number")}
+            for item in bill.iterfind("laws/item")
+        ],
+        "actions": actions,
+    }
+
+# Zip archives opened by this process, and the process they belong to: a
+# handle inherited across fork shares its file offset with the parent's
+_archives: Dict[str, zipfile.ZipFile] = {}
+_archives_pid = os.getpid()
+
+def _open(source: Source):
+    global _archives, _archives_pid
+    path, member = source
+    if member is None:
+        return open(path, "rb")
+    if _archives_pid != os.getpid():
+        _archives, _archives_pid = {}, os.getpid()
+    # Kept open, so that an archive's directory is read once per process
+    archive = _archives.get(path)
+    if archive is None:
+        archive = _archives[path] = zipfile.ZipFile(path)
+    return archive.open(member)
+
+def close_archives() -> None:
+    while _archives:
+        _archives.popitem()[1].close()
+
+def parse_source(source: Source) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """The bill items of one file and, when it could not be read, the error"""
+    items = []
+    try:
+        with _open(source) as f:
+            for _, bill in etree.iterparse(f, events=("end",), tag="bill"):
+                items.append(bill_item(bill))
+                # Drop the parsed subtree, and anything before it, as we go
+                bill.clear()
+                while bill.getprevious() is not None:
+                    del bill.getparent()[0]
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        return items, f"{':'.join(part for part in source if part)}: {str(e)}"
+    return items, None
+
+def parse_sources(sources: List[Source]) -> List[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    return [parse_source(source) for source in sources]
+
+def parse_all(sources: Iterator[Source], workers: Optional[int] = None) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Parse every source, in order, on ``workers`` processes (default: one per CPU).
+
+    At most two tasks per worker are in flight, so however large the
+    archive, only a bounded number of parsed bills wait for the consumer.
+    ``workers=0`` parses on the calling thread.
+    """
+    if workers == 0:
+        try:
+            for source in sources:
+                yield parse_source(source)
+        finally:
+            close_archives()
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for batch in chunked(sources, SOURCES_PER_TASK):
+            pending.append(executor.submit(parse_sources, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
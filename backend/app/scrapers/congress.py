@@ -1,39 +1,123 @@
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, Optional
+from urllib.parse import urlparse, parse_qs
 import requests
 from sqlalchemy import text
-from .base import BaseScraper, APIKeyMissingError
-from ..models import Status, LegislationType, Legislation
+from .base import BaseScraper, APIKeyMissingError, parse_date
+from .billstatus import iter_sources, parse_all
+from .json_stream import StreamedPage
+from .throttle import RateLimiter
+from ..models import Status, LegislationType
+
+# Congress.gov allows 5,000 requests per hour per API key
+CALLS_PER_HOUR = 5000
+
+def _close_page(future: Future) -> None:
+    if future.exception() is None:
+        future.result().close()
 
 class CongressScraper(BaseScraper):
+    source = "congress"
+    # API scrapes must not wipe what a bulk load stored
+    merge_partial_rows = True
+    # Congress numbers to scrape (starting from 116th Congress in 2019)
+    congresses = ["118", "117", "116"]
+
     def __init__(self):
         super().__init__()
         self.api_key = self.settings.CONGRESS_API_KEY
         self.base_url = self.settings.CONGRESS_API_BASE_URL
-        self.validate_api_key(self.api_key, "Congress.gov")
-        # Congress numbers to scrape (starting from 116th Congress in 2019)
-        self.congresses = ["118", "117", "116"]
+        self.page_size = self.settings.CONGRESS_PAGE_SIZE
+        self.max_concurrency = self.settings.CONGRESS_MAX_CONCURRENCY
+        # One keep-alive connection per page fetcher thread, plus the page
+        # still being read when its replacement request is submitted
+        self.http_pool_size = self.max_concurrency + 1
+        # Shared by the page fetcher threads and, through Redis, by every worker
+        self.limiter = RateLimiter(self.source, calls=CALLS_PER_HOUR, period=3600)
 
-    def _make_request(self, endpoint: str) -> Dict[str, Any]:
+    def _make_request(self, endpoint: str, offset: int = 0, params: Optional[Dict[str, Any]] = None) -> StreamedPage:
+        """Request one page; its bills are parsed as the body streams in"""
         url = f"{self.base_url}/{endpoint}"
+        response = None
         try:
-            print(f"Making request to: {url}")
-            response = requests.get(url, params={
+            print(f"Making request to: {url} (offset {offset})")
+            response = self.http.get(url, params={
                 "api_key": self.api_key,
                 "format": "json",
-                "limit": 250,  # Request more items per page
-                "offset": 0
-            })
+                "limit": self.page_size,
+                "offset": offset,
+                **(params or {})
+            }, limiter=self.limiter, stream=True)
             response.raise_for_status()
-            data = response.json()
-            print(f"Received response with {len(data.get('bills', []))} bills")
-            return data
+            return StreamedPage.from_response(response, "bills")
         except requests.exceptions.RequestException as e:
             print(f"Request failed: {str(e)}")
             if response is not None:
                 print(f"Response content: {response.text[:500]}")
+                response.close()
             raise
 
+    def _next_offset(self, page: StreamedPage) -> Optional[int]:
+        """Offset of the page linked by ``pagination.next``, if any"""
+        next_url = page.meta.get("pagination", {}).get("next")
+        if not next_url:
+            return None
+        offset = parse_qs(urlparse(next_url).query).get("offset")
+        return int(offset[0]) if offset else None
+
+    def _read_page(self, page: StreamedPage) -> Iterator[Dict[str, Any]]:
+        for item in page:
+            self.counts["fetched"] += 1
+            yield item
+        self.counts["pages"] += 1
+        print(f"Received response with {page.count} bills")
+
+    def _iter_bills(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every bill of a paginated endpoint as it is parsed.
+
+        The first page is read to its end for the total count (Congress.gov
+        puts ``pagination`` after the bills), after which the remaining
+        offsets are requested on a thread pool with at most
+        ``self.max_concurrency`` requests in flight. Pages are consumed as
+        their responses arrive and never decoded as a whole. When the count
+        is missing the ``pagination.next`` links are walked instead.
+        """
+        first = self._make_request(endpoint, 0, params)
+        yield from self._read_page(first)
+
+        count = first.meta.get("pagination", {}).get("count")
+        if count is None:
+            offset = self._next_offset(first)
+            while offset is not None:
+                page = self._make_request(endpoint, offset, params)
+                yield from self._read_page(page)
+                offset = self._next_offset(page)
+            return
+
+        offsets = iter(range(self.page_size, count, self.page_size))
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending = set()
+            try:
+                for offset in offsets:
+                    pending.add(executor.submit(self._make_request, endpoint, offset, params))
+                    if len(pending) >= self.max_concurrency:
+                        break
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        next_offset = next(offsets, None)
+                        if next_offset is not None:
+                            pending.add(executor.submit(self._make_request, endpoint, next_offset, params))
+                        yield from self._read_page(future.result())
+            finally:
+                # Pages that will not be read still hold a connection
+                for future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(_close_page)
+
     def _determine_status(self, item: Dict[str, Any]) -> Status:
         """Determine the current status of a bill based on its history"""
         status_text = item.get('status', '').lower()
@@ -55,107 +139,169 @@ class CongressScraper(BaseScraper):
         else:
             return Status.PENDING
 
-    def scrape(self) -> List[Dict[str, Any]]:
-        try:
-            print("Starting federal legislation scrape...")
-            total_processed = 0
+    def _normalize_bill(self, item: Dict[str, Any], congress: str) -> Dict[str, Any]:
+        """Map a Congress.gov bill item onto a legislation row"""
+        bill_type = (item.get('type') or '').lower()
+        bill_number = item.get('number') or ''
+
+        # Construct source URL for Congress.gov
+        source_url = f"https://www.congress.gov/bill/{congress}th-congress/{bill_type}/{bill_number}"
+
+        # Process dates
+        introduced_date = None
+        if "introducedDate" in item:
+            try:
+                introduced_date = datetime.strptime(item["introducedDate"], "%Y-%m-%d")
+            except ValueError:
+                print(f"Invalid introduced date format for bill {bill_number}")
 
-            for congress in self.congresses:
+        # Process latest action date
+        last_action_date = None
+        if item.get("latestAction", {}).get("actionDate"):
+            try:
+                last_action_date = datetime.strptime(
+                    item["latestAction"]["actionDate"],
+                    "%Y-%m-%d"
+                )
+            except ValueError:
+                print(f"Invalid action date format for bill {bill_number}")
+
+        extra_data = {
+            "congress": congress,
+            "bill_type": bill_type,
+            "bill_number": bill_number,
+            "latest_action": item.get("latestAction", {})
+        }
+        # Bill list API items carry none of these, bulk BILLSTATUS records
+        # most; keys left out keep what a bulk load stored (see merge_partial_rows)
+        for key, name in (
+            ("sponsors", "sponsors"), ("committees", "committees"), ("relatedBills", "related_bills"),
+            ("subjects", "subjects"), ("policyArea", "policy_area"), ("laws", "laws"),
+        ):
+            if item.get(key) is not None:
+                extra_data[name] = item[key]
+
+        row = {
+            "id": f"federal_{congress}_{bill_type}_{bill_number}",
+            "type": LegislationType.FEDERAL.value,
+            "title": item["title"],
+            "summary": item.get("summary") or None,
+            "status": self._determine_status(item).value,
+            "introduced_date": introduced_date,
+            "last_action_date": last_action_date,
+            "source_url": source_url,
+            "congress": congress,
+            "bill_type": bill_type,
+            "bill_number": bill_number,
+            "extra_data": extra_data
+        }
+        # The bill list API has no timeline; without one the stored actions are kept
+        if isinstance(item.get("actions"), list):
+            row["actions"] = [self._normalize_action(action) for action in item["actions"]]
+        return row
+
+    def _normalize_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a BILLSTATUS action onto a legislative_actions row (see BaseScraper._action_rows)"""
+        action_date = parse_date(action.get("actionDate"))
+        if action_date is not None and action.get("actionTime"):
+            action_date = parse_date(f"{action['actionDate']}T{action['actionTime']}") or action_date
+        return {
+            "action_date": action_date,
+            "action_type": action.get("type") or "action",
+            "description": action.get("text"),
+            "source": action.get("sourceSystem"),
+            "extra_data": {
+                "action_code": action.get("actionCode"),
+                "source_system": action.get("sourceSystem"),
+                "committees": action.get("committees") or [],
+            }
+        }
+
+    def _normalize_bills(self, bills: Iterable[Dict[str, Any]], congress: str) -> Iterator[Dict[str, Any]]:
+        for item in bills:
+            try:
+                yield self._normalize_bill(item, congress)
+            except Exception as e:
+                self.counts["failed"] += 1
+                print(f"Error processing bill {item.get('number', '')}: {str(e)}")
+
+    def scrape_congress(self, congress: str, full: bool = False) -> Dict[str, int]:
+        """Sync the bills of one congress; returns the run counts (see track_run).
+
+        By default only bills updated since the last successful sync of the
+        congress are requested; ``full`` ignores the watermark and walks
+        the entire list.
+        """
+        self.validate_api_key(self.api_key, "Congress.gov")
+        with self.track_run(congress, full) as counts:
+            started = datetime.utcnow()
+            since = None if full else self.get_watermark(congress)
+            params = {}
+            if since:
+                params["fromDateTime"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+                print(f"\nScraping {congress}th Congress bills updated since {params['fromDateTime']}...")
+            else:
                 print(f"\nScraping {congress}th Congress...")
+
+            bills = self._iter_bills(f"bill/{congress}", params)
+            counts.update(self.upsert_legislation(self._normalize_bills(bills, congress)))
+            self.set_watermark(congress, started, full=since is None)
+            print(
+                f"Completed {congress}th Congress: {counts['inserted']} added, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+            )
+        return counts
+
+    def _bulk_bills(self, path: str, workers: Optional[int], updated_through: Dict[str, datetime]) -> Iterator[Dict[str, Any]]:
+        sources = iter_sources(path)
+        first = next(sources, None)
+        if first is None:
+            raise FileNotFoundError(f"No BILLSTATUS XML files in {path}")
+        for items, error in parse_all(chain([first], sources), workers):
+            self.counts["pages"] += 1
+            if error:
+                self.counts["failed"] += 1
+                print(f"Error reading {error}")
+            for item in items:
+                self.counts["fetched"] += 1
+                congress = item.get("congress") or ""
+                updated_at = parse_date(item.get("updateDate"))
+                if updated_at is not None and (congress not in updated_through or updated_at > updated_through[congress]):
+                    updated_through[congress] = updated_at
                 try:
-                    data = self._make_request(f"bill/{congress}")
-                    bills = data.get('bills', [])
-                    
-                    for item in bills:
-                        try:
-                            bill_type = item.get('type', '').lower()
-                            bill_number = item.get('number', '')
-                            
-                            # Construct source URL for Congress.gov
-                            source_url = f"https://www.congress.gov/bill/{congress}th-congress/{bill_type}/{bill_number}"
-                            
-                            # Process dates
-                            introduced_date = None
-                            if "introducedDate" in item:
-                                try:
-                                    introduced_date = datetime.strptime(item["introducedDate"], "%Y-%m-%d")
-                                except ValueError:
-                                    print(f"Invalid introduced date format for bill {bill_number}")
-                            
-                            # Process latest action date
-                            last_action_date = None
-                            if item.get("latestAction", {}).get("actionDate"):
-                                try:
-                                    last_action_date = datetime.strptime(
-                                        item["latestAction"]["actionDate"], 
-                                        "%Y-%m-%d"
-                                    )
-                                except ValueError:
-                                    print(f"Invalid action date format for bill {bill_number}")
-
-                            legislation = Legislation(
-                                id=f"federal_{congress}_{bill_type}_{bill_number}",
-                                type=LegislationType.FEDERAL.value,
-                                title=item["title"],
-                                summary=item.get("summary", ""),
-                                status=self._determine_status(item).value,
-                                introduced_date=introduced_date,
-                                last_action_date=last_action_date,
-                                source_url=source_url,
-                                extra_data={
-                                    "congress": congress,
-                                    "bill_type": bill_type,
-                                    "bill_number": bill_number,
-                                    "sponsors": item.get("sponsors", []),
-                                    "committees": item.get("committees", []),
-                                    "latest_action": item.get("latestAction", {}),
-                                    "related_bills": item.get("relatedBills", []),
-                                    "subjects": item.get("subjects", [])
-                                }
-                            )
-                            
-                            # Check for existing record
-                            existing = self.db.query(Legislation).filter(
-                                Legislation.id == legislation.id
-                            ).first()
-                            
-                            if existing:
-                                # Update existing record
-                                for key, value in legislation.__dict__.items():
-                                    if key != '_sa_instance_state':
-                                        setattr(existing, key, value)
-                                print(f"Updated bill {congress} {bill_type} {bill_number}")
-                            else:
-                                # Add new record
-                                self.db.add(legislation)
-                                print(f"Added new bill {congress} {bill_type} {bill_number}")
-                            
-                            total_processed += 1
-                            if total_processed % 10 == 0:
-                                print(f"Processed {total_processed} bills...")
-                                self.db.commit()  # Periodic commit
-                            
-                        except Exception as e:
-                            print(f"Error processing bill {bill_number}: {str(e)}")
-                            continue
-                    
-                    self.db.commit()
-                    print(f"Completed {congress}th Congress")
-                    
+                    yield self._normalize_bill(item, congress)
                 except Exception as e:
-                    print(f"Error processing {congress}th Congress: {str(e)}")
-                    continue
-
-            final_count = self.db.query(Legislation).filter(
-                Legislation.type == LegislationType.FEDERAL.value
-            ).count()
-            print(f"\nFinal federal bill count: {final_count}")
-            
-            return self.db.query(Legislation).filter(
-                Legislation.type == LegislationType.FEDERAL.value
-            ).all()
-            
-        except Exception as e:
-            print(f"Error in scrape: {str(e)}")
-            self.db.rollback()
-            raise
+                    self.counts["failed"] += 1
+                    print(f"Error processing bill {item.get('number', '')}: {str(e)}")
+
+    def ingest_bulk(self, path: str, workers: Optional[int] = None) -> Dict[str, int]:
+        """Load BILLSTATUS bulk XML from a directory, zip archive or file; returns the run counts.
+
+        The files are parsed on ``workers`` processes (see
+        billstatus.parse_all) and the bills go through the same
+        normalization and batched upsert as an API scrape, with their
+        sponsors, committees and subjects, and their full action history
+        written to legislative_actions. No API key
+        or network access is needed. Each congress's watermark moves up to
+        the newest ``updateDate`` loaded, so the next API scrape only asks
+        for what changed since the bulk snapshot.
+        """
+        print(f"\nLoading Congress bulk data from {path}...")
+        updated_through: Dict[str, datetime] = {}
+        with self.track_run("bulk", full=True) as counts:
+            bills = self._bulk_bills(path, workers, updated_through)
+            counts.update(self.upsert_legislation(bills))
+            for congress, synced_at in updated_through.items():
+                watermark = self.get_watermark(congress)
+                if watermark is None or synced_at > watermark:
+                    self.set_watermark(congress, synced_at, full=True)
+            print(
+                f"Loaded {counts['fetched']} bills from {counts['pages']} files: {counts['inserted']} added, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged, {counts['failed']} failed"
+            )
+        return counts
+
+    def scrape(self, full: bool = False) -> Dict[str, Any]:
+        """Scrape bills for each congress in turn (see ``scrape_congress``)"""
+        print("Starting federal legislation scrape...")
+        return self.scrape_scopes(self.congresses, self.scrape_congress, full=full)
@@ -1,14 +1,19 @@
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from ratelimit import limits, sleep_and_retry
-from .base import BaseScraper, RateLimitError
-from ..models import Status, LegislationType, Legislation
+from typing import Dict, Any, Iterator, Optional
+from .base import BaseScraper
+from .json_stream import StreamedPage
+from .throttle import RateLimiter
+from ..models import Status, LegislationType
 
 class FederalRegisterScraper(BaseScraper):
+    source = "federal_register"
+
     def __init__(self):
         super().__init__()
-        self.base_url = "https://www.federalregister.gov/api/v1"
+        self.base_url = self.settings.FEDERAL_REGISTER_API_BASE_URL
+        # 1000 requests per hour, shared by every worker through Redis
+        self.limiter = RateLimiter(self.source, calls=1000, period=3600)
         # Define date ranges for each administration
         self.date_ranges = [
             # Biden Administration
@@ -37,143 +42,146 @@ class FederalRegisterScraper(BaseScraper):
             }
         ]
 
-    @sleep_and_retry
-    @limits(calls=1000, period=3600)  # 1000 requests per hour
-    def _make_request(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make rate-limited API request"""
+    def _make_request(self, params: Dict[str, Any] = None) -> StreamedPage:
+        """Make rate-limited API request; results are parsed as the body streams in"""
         url = f"{self.base_url}/documents"
+        response = None
         
         try:
             print(f"Making request to Federal Register API...")
             print(f"Parameters: {params}")
             
-            response = requests.get(url, params=params)
-            
-            if response.status_code == 429:
-                raise RateLimitError("Federal Register API rate limit exceeded")
-                
+            response = self.http.get(url, params=params, limiter=self.limiter, stream=True)
             response.raise_for_status()
-            data = response.json()
-            
-            print(f"Received {len(data.get('results', []))} executive orders")
-            return data
+            return StreamedPage.from_response(response, "results")
             
         except requests.exceptions.RequestException as e:
             print(f"Error making request to Federal Register: {str(e)}")
             if response is not None:
                 print(f"Response content: {response.text[:500]}")
+                response.close()
             raise
 
-    def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape executive orders from multiple administrations"""
-        try:
-            total_processed = 0
-            current_page = 1
-
-            for date_range in self.date_ranges:
-                print(f"\nScraping executive orders from {date_range['start']} to {date_range['end']}...")
-                print(f"President: {date_range['president']}")
-                
-                while True:  # Handle pagination
-                    params = {
-                        "conditions[type][]": "PRESDOCU",
-                        "conditions[presidential_document_type][]": "executive_order",
-                        "conditions[publication_date][gte]": date_range['start'],
-                        "conditions[publication_date][lte]": date_range['end'],
-                        "per_page": 100,
-                        "page": current_page,
-                        "order": "oldest"
-                    }
-                    
+    def _normalize_order(self, item: Dict[str, Any], president: str) -> Dict[str, Any]:
+        """Map a Federal Register document onto a legislation row"""
+        doc_number = item.get('document_number', '')
+        eo_number = ''.join(filter(str.isdigit, doc_number))
+
+        # Extract signing date if available, otherwise use publication date
+        signing_date = item.get('signing_date')
+        if signing_date:
+            try:
+                date = datetime.strptime(signing_date, "%Y-%m-%d")
+            except ValueError:
+                date = datetime.strptime(item['publication_date'], "%Y-%m-%d")
+        else:
+            date = datetime.strptime(item['publication_date'], "%Y-%m-%d")
+
+        return {
+            "id": f"executive_{eo_number}" if eo_number else f"executive_{doc_number}",
+            "type": LegislationType.EXECUTIVE.value,
+            "title": item.get("title", ""),
+            "summary": item.get("abstract", ""),
+            "status": Status.SIGNED.value,
+            "introduced_date": date,
+            "last_action_date": date,  # For EOs, signing date is the last action
+            "source_url": item.get("html_url", ""),
+            "president": president,
+            # Stored compressed in legislation_documents, not on the row
+            "full_text": item.get("body_html", ""),
+            "extra_data": {
+                "document_number": doc_number,
+                "executive_order_number": eo_number,
+                "president": president,
+                "citation": item.get("citation", ""),
+                "pdf_url": item.get("pdf_url", ""),
+                "publication_date": item['publication_date'],
+                "signing_date": signing_date,
+                "executive_order_notes": item.get("executive_order_notes", []),
+                "cfr_references": item.get("cfr_references", [])
+            }
+        }
+
+    def _iter_orders(self, date_range: Dict[str, str], start: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Walk every results page for a date range, yielding normalized rows.
+
+        ``start`` narrows the lower publication date bound for incremental runs.
+        """
+        current_page = 1
+
+        while True:  # Handle pagination
+            params = {
+                "conditions[type][]": "PRESDOCU",
+                "conditions[presidential_document_type][]": "executive_order",
+                "conditions[publication_date][gte]": start or date_range['start'],
+                "conditions[publication_date][lte]": date_range['end'],
+                "per_page": 100,
+                "page": current_page,
+                "order": "oldest"
+            }
+
+            try:
+                page = self._make_request(params)
+                # Each order is normalized, and its body_html handed on,
+                # before the next one is parsed
+                for item in page:
+                    self.counts["fetched"] += 1
                     try:
-                        data = self._make_request(params)
-                        results = data.get("results", [])
-                        
-                        if not results:
-                            break  # No more results for this date range
-                        
-                        for item in results:
-                            try:
-                                doc_number = item.get('document_number', '')
-                                eo_number = ''.join(filter(str.isdigit, doc_number))
-                                
-                                # Extract signing date if available, otherwise use publication date
-                                signing_date = item.get('signing_date')
-                                if signing_date:
-                                    try:
-                                        date = datetime.strptime(signing_date, "%Y-%m-%d")
-                                    except ValueError:
-                                        date = datetime.strptime(item['publication_date'], "%Y-%m-%d")
-                                else:
-                                    date = datetime.strptime(item['publication_date'], "%Y-%m-%d")
-
-                                legislation = Legislation(
-                                    id=f"executive_{eo_number}" if eo_number else f"executive_{doc_number}",
-                                    type=LegislationType.EXECUTIVE.value,
-                                    title=item.get("title", ""),
-                                    summary=item.get("abstract", ""),
-                                    status=Status.SIGNED.value,
-                                    introduced_date=date,
-                                    last_action_date=date,  # For EOs, signing date is the last action
-                                    source_url=item.get("html_url", ""),
-                                    extra_data={
-                                        "document_number": doc_number,
-                                        "executive_order_number": eo_number,
-                                        "president": date_range['president'],
-                                        "full_text": item.get("body_html", ""),
-                                        "citation": item.get("citation", ""),
-                                        "pdf_url": item.get("pdf_url", ""),
-                                        "publication_date": item['publication_date'],
-                                        "signing_date": signing_date,
-                                        "executive_order_notes": item.get("executive_order_notes", []),
-                                        "cfr_references": item.get("cfr_references", [])
-                                    }
-                                )
-
-                                # Check for existing record
-                                existing = self.db.query(Legislation).filter(
-                                    Legislation.id == legislation.id
-                                ).first()
-                                
-                                if existing:
-                                    # Update existing record
-                                    for key, value in legislation.__dict__.items():
-                                        if key != '_sa_instance_state':
-                                            setattr(existing, key, value)
-                                    print(f"Updated EO {eo_number}")
-                                else:
-                                    # Add new record
-                                    self.db.add(legislation)
-                                    print(f"Added new EO {eo_number}")
-
-                                total_processed += 1
-                                if total_processed % 10 == 0:
-                                    print(f"Processed {total_processed} executive orders...")
-                                    self.db.commit()  # Periodic commit
-
-                            except Exception as e:
-                                print(f"Error processing executive order {doc_number}: {str(e)}")
-                                continue
-
-                        current_page += 1
-                        
+                        yield self._normalize_order(item, date_range['president'])
                     except Exception as e:
-                        print(f"Error processing page {current_page} of {date_range['start']}-{date_range['end']}: {str(e)}")
-                        break
-                
-                current_page = 1  # Reset page counter for next date range
-                self.db.commit()  # Commit after each administration
-
-            final_count = self.db.query(Legislation).filter(
-                Legislation.type == LegislationType.EXECUTIVE.value
-            ).count()
-            print(f"\nFinal executive order count: {final_count}")
-            
-            return self.db.query(Legislation).filter(
-                Legislation.type == LegislationType.EXECUTIVE.value
-            ).all()
-            
-        except Exception as e:
-            print(f"Error in scrape: {str(e)}")
-            self.db.rollback()
-            raise
+                        self.counts["failed"] += 1
+                        print(f"Error processing executive order {item.get('document_number', '')}: {str(e)}")
+            except Exception as e:
+                print(f"Error processing page {current_page} of {date_range['start']}-{date_range['end']}: {str(e)}")
+                raise
+
+            self.counts["pages"] += 1
+            print(f"Received {page.count} executive orders")
+            if not page.count:
+                return  # No more results for this date range
+
+            current_page += 1
+
+    def date_range(self, start: str) -> Dict[str, str]:
+        """The administration date range beginning on ``start``"""
+        for date_range in self.date_ranges:
+            if date_range['start'] == start:
+                return date_range
+        raise ValueError(f"No administration date range starts on {start}")
+
+    def scrape_range(self, date_range: Dict[str, str], full: bool = False) -> Dict[str, int]:
+        """Sync the executive orders of one administration; returns the run counts (see track_run).
+
+        By default the range is only queried for documents published since
+        its last successful sync, and skipped entirely when it ended before
+        that. ``full`` re-reads the whole range.
+        """
+        with self.track_run(date_range['start'], full) as counts:
+            started = datetime.utcnow()
+            since = None if full else self.get_watermark(date_range['start'])
+            start = None
+            if since:
+                # Publication dates have day granularity, so re-read the watermark day
+                start = max(since.strftime("%Y-%m-%d"), date_range['start'])
+                if start > date_range['end']:
+                    print(f"\nSkipping {date_range['president']} ({date_range['start']}), already synced")
+                    return counts
+
+            print(f"\nScraping executive orders from {start or date_range['start']} to {date_range['end']}...")
+            print(f"President: {date_range['president']}")
+
+            counts.update(self.upsert_legislation(self._iter_orders(date_range, start)))
+            self.set_watermark(date_range['start'], started, full=since is None)
+            print(
+                f"Completed {date_range['president']}: {counts['inserted']} added, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+            )
+        return counts
+
+    def scrape(self, full: bool = False) -> Dict[str, Any]:
+        """Scrape executive orders from each administration in turn (see ``scrape_range``)"""
+        return self.scrape_scopes(
+            [date_range['start'] for date_range in self.date_ranges],
+            lambda start, full: self.scrape_range(self.date_range(start), full),
+            full=full
+        )
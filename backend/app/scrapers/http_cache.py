@@ -0,0 +1,228 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Optional
+from urllib.parse import urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that identify the caller rather than the resource
+SECRET_PARAMS = {"api_key", "apikey", "key", "token", "access_token"}
+
+# Response headers kept with a cached body
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+class OfflineCacheMiss(requests.exceptions.ConnectionError):
+    """Offline replay needed a response that was never cached"""
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """SHA-256 of the URL and its sorted parameters, API keys left out"""
+    items = sorted(
+        (name, str(value)) for name, value in (params or {}).items()
+        if name.lower() not in SECRET_PARAMS and value is not None
+    )
+    return hashlib.sha256(f"{url}?{urlencode(items)}".encode("utf-8")).hexdigest()
+
+class HTTPCache:
+    """gzip-compressed upstream responses on disk, one file per request key.
+
+    Entries younger than ``ttl`` are served without a request; older ones
+    are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged page costs a 304 instead of a download. When the files grow
+    past ``max_bytes`` the least recently used are deleted.
+    """
+
+    def __init__(self, directory: str, ttl: float = 86400, max_bytes: int = 2 * 1024 ** 3, clock=time.time):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.gz")
+
+    def _entries(self) -> Iterable[os.DirEntry]:
+        for shard in os.scandir(self.directory):
+            if shard.is_dir():
+                yield from (entry for entry in os.scandir(shard.path) if entry.name.endswith(".gz"))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The stored entry for ``key``: metadata plus ``body`` bytes"""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                meta, _, body = f.read().partition(b"\n")
+            entry = json.loads(meta)
+            # mtime doubles as the last use for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {str(e)}")
+            self.delete(key)
+            return None
+        entry["body"] = body
+        return entry
+
+    def fresh(self, entry: Dict[str, Any]) -> bool:
+        return self.clock() - entry["stored_at"] < self.ttl
+
+    def put(self, key: str, url: str, response: requests.Response) -> None:
+        """Store ``response`` under ``key``.
+
+        A streamed response (``stream=True``) whose body has not been read
+        is not read here: its body is compressed into the entry as the
+        caller consumes it, and the entry only appears once the body has
+        been read to the end. A response closed before then is not stored.
+        """
+        meta = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+            "stored_at": self.clock(),
+        }
+        header = json.dumps(meta).encode("utf-8") + b"\n"
+        if not response._content_consumed:
+            response.raw = _CachingBody(response.raw, self, key, header)
+            return
+        self._write(key, gzip.compress(header + response.content, 6))
+
+    def touch(self, key: str, entry: Dict[str, Any]) -> None:
+        """Mark a revalidated entry as fresh again"""
+        meta = {name: value for name, value in entry.items() if name != "body"}
+        meta["stored_at"] = self.clock()
+        self._write(key, gzip.compress(json.dumps(meta).encode("utf-8") + b"\n" + entry["body"], 6))
+
+    def _write(self, key: str, data: bytes) -> None:
+        fd, tmp = self._temp_file(key)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        self._commit(key, tmp)
+
+    def _temp_file(self, key: str):
+        """A temporary file next to ``key``'s entry, as (fd, path)"""
+        directory = os.path.dirname(self._path(key))
+        os.makedirs(directory, exist_ok=True)
+        return tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    def _commit(self, key: str, tmp: str) -> None:
+        """Make a complete temporary file ``key``'s entry.
+
+        Write then rename, so concurrent readers never see a partial file.
+        """
+        path = self._path(key)
+        with self._lock:
+            try:
+                self._size -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(tmp, path)
+            self._size += os.path.getsize(path)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to 90% of max_bytes"""
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._size <= target:
+                break
+            size = entry.stat().st_size
+            os.remove(entry.path)
+            self._size -= size
+
+    @staticmethod
+    def to_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        # Lets iter_content, and so streamed parsing, read the stored body
+        response._content_consumed = True
+        response.url = url
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
+
+class _CachingBody:
+    """A streamed response's raw body that writes what is read into a cache entry.
+
+    requests reads it through ``stream``, exactly like the urllib3
+    response it wraps, so iter_content and the streamed parsers built on
+    it see the same chunks and errors with or without a cache.
+    """
+
+    def __init__(self, raw, cache: HTTPCache, key: str, header: bytes):
+        self._raw = raw
+        self._cache = cache
+        self._key = key
+        fd, self._tmp = cache._temp_file(key)
+        self._out = os.fdopen(fd, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._out, mode="wb", compresslevel=6)
+        self._gzip.write(header)
+
+    def stream(self, amt: int = 2 ** 16, decode_content: Optional[bool] = None):
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            if self._gzip is not None:
+                self._gzip.write(chunk)
+            yield chunk
+        self._finish()
+
+    def read(self, amt: Optional[int] = None, decode_content: Optional[bool] = None) -> bytes:
+        data = self._raw.read(amt, decode_content=decode_content)
+        if self._gzip is not None:
+            if data:
+                self._gzip.write(data)
+            else:
+                self._finish()
+        return data
+
+    def _finish(self) -> None:
+        if self._gzip is None:
+            return
+        self._gzip.close()
+        self._out.close()
+        self._gzip = None
+        self._cache._commit(self._key, self._tmp)
+
+    def close(self) -> None:
+        if self._gzip is not None:
+            # Only a complete body becomes an entry
+            self._gzip.close()
+            self._out.close()
+            self._gzip = None
+            os.remove(self._tmp)
+        self._raw.close()
+
+    def release_conn(self) -> None:
+        self._raw.release_conn()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+@lru_cache()
+def open_cache(directory: str, ttl: float, max_bytes: int) -> HTTPCache:
+    """One HTTPCache per directory, so scrapers in a process share its size accounting"""
+    return HTTPCache(directory, ttl=ttl, max_bytes=max_bytes)
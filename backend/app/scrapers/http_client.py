@@ -0,0 +1,128 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .http_cache import HTTPCache, OfflineCacheMiss, cache_key
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+USER_AGENT = "legislation-tracker/1.0 (+https://github.com/GlavaNet/legislation-tracker)"
+
+# Statuses retried by the transport. 429 and 503 are left to the source's
+# RateLimiter, which honours Retry-After across every worker.
+RETRY_STATUSES = (500, 502, 504)
+
+class HTTPClient:
+    """Keep-alive sessions for the upstream APIs, one connection pool per host.
+
+    Every request gets the configured (connect, read) timeout, compressed
+    responses and transport-level retries of connection errors and
+    transient 5xx responses with exponential backoff. Sessions are created
+    on first use and closed together by ``close``.
+
+    With a ``cache``, responses are served from and stored in it (see
+    HTTPCache). ``offline`` answers every request from the cache, whatever
+    its age, and raises OfflineCacheMiss for anything not in it.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 1,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        cache: Optional[HTTPCache] = None,
+        offline: bool = False
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.offline = offline
+        if offline and cache is None:
+            raise ValueError("Offline mode needs a response cache")
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _retry(self) -> Retry:
+        return Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+            respect_retry_after_header=False
+        )
+
+    def session(self, url: str) -> requests.Session:
+        """The pooled session for ``url``'s scheme and host"""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is None:
+                session = requests.Session()
+                session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "User-Agent": USER_AGENT})
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_size, max_retries=self._retry()
+                )
+                session.mount(f"{origin}/", adapter)
+                self._sessions[origin] = session
+            return session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        limiter=None,
+        timeout: Optional[Tuple[float, float]] = None,
+        **kwargs
+    ) -> requests.Response:
+        """GET ``url``, through ``limiter`` (a RateLimiter) when it goes to the network.
+
+        Cache hits, including 304 revalidations' stored bodies, never take
+        a rate limit token.
+        """
+        entry = key = None
+        if self.cache is not None:
+            key = cache_key(url, params)
+            entry = self.cache.get(key)
+            if entry is not None and (self.offline or self.cache.fresh(entry)):
+                return HTTPCache.to_response(url, entry)
+            if self.offline:
+                raise OfflineCacheMiss(f"No cached response for {url} {params or ''}")
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if "ETag" in entry["headers"]:
+                headers["If-None-Match"] = entry["headers"]["ETag"]
+            if "Last-Modified" in entry["headers"]:
+                headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+        def send():
+            return self.session(url).get(
+                url, params=params, headers=headers, timeout=timeout or self.timeout, **kwargs
+            )
+
+        response = limiter.call(send) if limiter is not None else send()
+        if key is not None:
+            if response.status_code == 304 and entry is not None:
+                self.cache.touch(key, entry)
+                return HTTPCache.to_response(url, entry)
+            if response.status_code == 200:
+                self.cache.put(key, url, response)
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,133 @@
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+import requests
+
+# Bytes read from the response body at a time
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+class StreamedPage:
+    """A JSON object read from a byte stream, one item of its ``key`` array at a time.
+
+    Iterating yields the items of the top-level ``key`` array as soon as
+    each one has arrived, so a page is never decoded as a whole; only the
+    item being parsed and the unread tail of the current chunk are held.
+    Every other top-level member is decoded into ``meta`` when the parser
+    reaches it, which for members after the array (Congress.gov puts
+    ``pagination`` there) means once iteration is done. ``count`` is the
+    number of items yielded so far.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str, close: Optional[Callable[[], None]] = None):
+        self.key = key
+        self.meta: Dict[str, Any] = {}
+        self.count = 0
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._close = close
+
+    @classmethod
+    def from_response(cls, response: requests.Response, key: str) -> "StreamedPage":
+        """Parse a response opened with ``stream=True``; the connection is released when done"""
+        return cls(response.iter_content(CHUNK_SIZE), key, close=response.close)
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            yield from self._items()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def _fill(self, minimum: int = 1) -> bool:
+        """Buffer at least ``minimum`` more characters; False once the stream is exhausted"""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        target = len(self._buffer) + minimum
+        while len(self._buffer) < target:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer += self._text.decode(b"", final=True)
+                self._eof = True
+                break
+            self._buffer += self._text.decode(chunk)
+        return True
+
+    def _peek(self) -> str:
+        """The next non-whitespace character, left unconsumed"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of JSON stream", self._buffer, self._pos)
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading as much of the stream as it needs"""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete so far. Read at least as much again before
+                # retrying, so a value spanning many chunks is decoded a
+                # logarithmic rather than linear number of times.
+                if not self._fill(max(len(self._buffer) - self._pos, 1)):
+                    raise
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number or literal at the very end may continue in the next chunk
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def _items(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._value()
+            if not isinstance(name, str):
+                raise json.JSONDecodeError("Expected a member name", self._buffer, self._pos)
+            self._expect(":")
+            if name == self.key and self._peek() == "[":
+                self._pos += 1
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        item = self._value()
+                        self.count += 1
+                        yield item
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self.meta[name] = self._value()
+            if self._expect(",}") == "}":
+                # Read the (empty) rest of the body, which completes a
+                # response cache entry being written as the page streams
+                for _ in self._chunks:
+                    pass
+                return
@@ -0,0 +1,173 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import logging
+import time
+from ..config import get_settings
+from .base import RUN_COUNTERS, empty_counts
+from .congress import CongressScraper
+from .federal_register import FederalRegisterScraper
+from .state import StateLegislatureScraper
+from .state_adapters import supported_states
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ScrapeUnit:
+    """An independent piece of a scrape: one congress, administration or state"""
+    source: str
+    scope: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.source}:{self.scope}"
+
+@dataclass
+class UnitResult:
+    unit: ScrapeUnit
+    seconds: float
+    counts: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UnitResult":
+        return cls(**{**data, "unit": ScrapeUnit(**data["unit"])})
+
+def _scrape_congress(scope: str, full: bool) -> Dict[str, int]:
+    with CongressScraper() as scraper:
+        return scraper.scrape_congress(scope, full=full)
+
+def _scrape_administration(scope: str, full: bool) -> Dict[str, int]:
+    with FederalRegisterScraper() as scraper:
+        return scraper.scrape_range(scraper.date_range(scope), full=full)
+
+def _scrape_state(scope: str, full: bool) -> Dict[str, int]:
+    with StateLegislatureScraper(scope) as scraper:
+        return scraper.scrape_state(full=full)
+
+# Source -> callable scraping one scope of it through its own session
+RUNNERS: Dict[str, Callable[[str, bool], Dict[str, int]]] = {
+    CongressScraper.source: _scrape_congress,
+    FederalRegisterScraper.source: _scrape_administration,
+    "state": _scrape_state,
+}
+
+def plan_units(sources: Optional[Iterable[str]] = None) -> List[ScrapeUnit]:
+    """Every unit of ``sources`` (default: all), grouped by source"""
+    settings = get_settings()
+    sources = set(sources or RUNNERS)
+    units = []
+    if CongressScraper.source in sources:
+        units += [ScrapeUnit(CongressScraper.source, congress) for congress in CongressScraper.congresses]
+    if FederalRegisterScraper.source in sources:
+        units += [
+            ScrapeUnit(FederalRegisterScraper.source, date_range["start"])
+            for date_range in FederalRegisterScraper().date_ranges
+        ]
+    if "state" in sources:
+        states = [state.strip().upper() for state in settings.SCRAPER_STATES.split(",") if state.strip()]
+        if states == ["ALL"]:
+            states = supported_states(settings)
+        units += [ScrapeUnit("state", state) for state in states]
+    return units
+
+def plan_lanes(units: List[ScrapeUnit], concurrency: Optional[Dict[str, int]] = None) -> List[List[ScrapeUnit]]:
+    """Split units into lanes that run side by side, each working through its units in order.
+
+    A source capped at N gets at most N lanes, so no more than N of its
+    units are ever in flight, locally or across Celery workers.
+    """
+    if concurrency is None:
+        concurrency = get_settings().SCRAPER_CONCURRENCY
+    by_source: Dict[str, List[ScrapeUnit]] = {}
+    for unit in units:
+        by_source.setdefault(unit.source, []).append(unit)
+
+    lanes = []
+    for source, source_units in by_source.items():
+        count = max(1, min(concurrency.get(source, 1), len(source_units)))
+        lanes += [source_units[index::count] for index in range(count)]
+    return lanes
+
+def run_unit(unit: ScrapeUnit, full: bool = False) -> UnitResult:
+    """Scrape one unit, recording its wall time; failures are reported, not raised"""
+    started = time.perf_counter()
+    try:
+        counts = RUNNERS[unit.source](unit.scope, full)
+        return UnitResult(unit, time.perf_counter() - started, counts)
+    except Exception as e:
+        logger.error(f"Error scraping {unit.label}: {str(e)}")
+        return UnitResult(unit, time.perf_counter() - started, error=str(e))
+
+def run_lane(lane: List[ScrapeUnit], full: bool = False) -> List[UnitResult]:
+    return [run_unit(unit, full) for unit in lane]
+
+def run_units(
+    units: List[ScrapeUnit],
+    full: bool = False,
+    concurrency: Optional[Dict[str, int]] = None
+) -> List[UnitResult]:
+    """Run units on a thread pool with one thread per lane; results in unit order"""
+    lanes = plan_lanes(units, concurrency)
+    if not lanes:
+        return []
+    with ThreadPoolExecutor(max_workers=len(lanes), thread_name_prefix="scrape") as executor:
+        results = [
+            result
+            for lane_results in executor.map(lambda lane: run_lane(lane, full), lanes)
+            for result in lane_results
+        ]
+    order = {unit: index for index, unit in enumerate(units)}
+    return sorted(results, key=lambda result: order[result.unit])
+
+def summarize(results: List[UnitResult], wall_seconds: float) -> Dict[str, Any]:
+    """Totals plus the speedup of the run over doing every unit back to back"""
+    totals = empty_counts()
+    for result in results:
+        for key, value in result.counts.items():
+            totals[key] = totals.get(key, 0) + value
+    serial_seconds = sum(result.seconds for result in results)
+    return {
+        "units": [result.as_dict() for result in results],
+        "failed": [result.unit.label for result in results if result.error],
+        "totals": totals,
+        "wall_seconds": wall_seconds,
+        "serial_seconds": serial_seconds,
+        "speedup": serial_seconds / wall_seconds if wall_seconds else None,
+    }
+
+def format_report(summary: Dict[str, Any]) -> str:
+    lines = [f"{'unit':<28} {'seconds':>8}" + "".join(f" {name:>9}" for name in RUN_COUNTERS)]
+    for data in summary["units"]:
+        result = UnitResult.from_dict(data)
+        if result.error:
+            lines.append(f"{result.unit.label:<28} {result.seconds:8.1f}  failed: {result.error}")
+            continue
+        lines.append(
+            f"{result.unit.label:<28} {result.seconds:8.1f}"
+            + "".join(f" {result.counts.get(name, 0):9d}" for name in RUN_COUNTERS)
+        )
+    speedup = f" ({summary['speedup']:.2f}x speedup)" if summary["speedup"] else ""
+    lines.append(
+        f"Wall time {summary['wall_seconds']:.1f}s for {summary['serial_seconds']:.1f}s "
+        f"of unit work{speedup}"
+    )
+    return "\n".join(lines)
+
+def run_all(
+    sources: Optional[Iterable[str]] = None,
+    full: bool = False,
+    concurrency: Optional[Dict[str, int]] = None,
+    serial: bool = False
+) -> Dict[str, Any]:
+    """Plan, run and summarize a scrape of ``sources`` (default: all).
+
+    ``serial`` runs every unit back to back on the calling thread.
+    """
+    started = time.perf_counter()
+    units = plan_units(sources)
+    results = run_lane(units, full) if serial else run_units(units, full, concurrency)
+    return summarize(results, time.perf_counter() - started)
@@ -1,4 +1,3 @@
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
@@ -15,7 +14,7 @@ class CongressScraper(BaseScraper):
         url = f"{settings.CONGRESS_API_BASE_URL}/bills"
         headers = {"X-API-Key": settings.CONGRESS_API_KEY} if settings.CONGRESS_API_KEY else {}
         
-        response = requests.get(url, headers=headers)
+        response = self.http.get(url, headers=headers)
         response.raise_for_status()
         data = response.json()
 
@@ -62,7 +61,7 @@ class FederalRegisterScraper(BaseScraper):
             "per_page": 100
         }
 
-        response = requests.get(url, params=params)
+        response = self.http.get(url, params=params)
         response.raise_for_status()
         data = response.json()
 
@@ -1,103 +1,53 @@
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import requests
-from bs4 import BeautifulSoup
-from ratelimit import limits, sleep_and_retry
-from .base import BaseScraper, APIKeyMissingError
-from ..models import Status, LegislationType
+from typing import Dict, Any, Iterator, Optional
+from .base import BaseScraper
+from .state_adapters import adapter_for
+from .throttle import RateLimiter
 
 class StateLegislatureScraper(BaseScraper):
+    """One state's bills, through the adapter registered for it (see state_adapters)"""
+
+    source = "state"
+
     def __init__(self, state: str):
         super().__init__()
         self.state = state.upper()
-        self.api_key = self._get_state_api_key()
-        self.config = self._get_state_config()
-
-    def _get_state_api_key(self) -> Optional[str]:
-        """Get API key for specific state if required"""
-        key_mapping = {
-            'NY': self.settings.NY_LEGISLATURE_API_KEY,
-            'CA': self.settings.CA_LEGISLATURE_API_KEY,
-        }
-        return key_mapping.get(self.state)
-
-    def _get_state_config(self) -> Dict[str, Any]:
-        configs = {
-            'NY': {
-                'requires_key': True,
-                'base_url': 'https://legislation.nysenate.gov/api/v1',
-                'rate_limit': {'calls': 1000, 'period': 3600}
-            },
-            'CA': {
-                'requires_key': False,
-                'base_url': 'https://leginfo.legislature.ca.gov/faces/billSearchClient.xhtml',
-                'rate_limit': {'calls': 100, 'period': 3600}
-            }
-        }
-        
-        config = configs.get(self.state)
-        if not config:
-            raise ValueError(f"State {self.state} not supported")
-            
-        if config['requires_key'] and not self.api_key:
-            raise APIKeyMissingError(f"API key required for {self.state} legislature")
-            
-        return config
-
-    def _make_request(self, endpoint: str) -> Dict[str, Any]:
-        url = f"{self.config['base_url']}/{endpoint}"
-        headers = {}
-        if self.api_key:
-            headers['Authorization'] = f'Bearer {self.api_key}'
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-
-    def scrape(self) -> List[Dict[str, Any]]:
+        self.adapter = adapter_for(self.state, self.settings)(self)
+        # Each state draws on its own upstream budget
+        self.limiter = RateLimiter(f"state_{self.state.lower()}", **self.adapter.rate_limit)
+
+    def _normalize_bills(self, bills: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for item in bills:
+            self.counts["fetched"] += 1
+            try:
+                yield self.adapter.normalize(item)
+            except Exception as e:
+                self.counts["failed"] += 1
+                print(f"Error processing {self.state} bill {item.get('identifier') or item.get('printNo', '')}: {str(e)}")
+
+    def scrape(self, full: bool = False) -> Dict[str, Any]:
+        return self.scrape_scopes([self.state], lambda state, full: self.scrape_state(full), full=full)
+
+    def scrape_state(self, full: bool = False) -> Dict[str, int]:
+        """Sync this state's bills; returns the run counts (see track_run).
+
+        Rows are upserted, never deleted, so states can be scraped side by
+        side. By default adapters that know when a bill last changed skip
+        everything up to the state's watermark; ``full`` reads it all.
+        """
         try:
-            if self.state == 'NY':
-                return self._scrape_ny()
-            elif self.state == 'CA':
-                return self._scrape_ca()
-            else:
-                raise ValueError(f"Scraping not implemented for state: {self.state}")
+            with self.track_run(self.state, full) as counts:
+                started = datetime.utcnow()
+                since: Optional[datetime] = None if full else self.get_watermark(self.state)
+                print(f"\nScraping {self.state} legislature" + (f" changes since {since}..." if since else "..."))
+
+                counts.update(self.upsert_legislation(self._normalize_bills(self.adapter.iter_bills(since))))
+                self.set_watermark(self.state, self.adapter.updated_through or started, full=since is None)
+                print(
+                    f"Completed {self.state}: {counts['inserted']} added, "
+                    f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+                )
         except Exception as e:
             self.logger.error(f"Error scraping {self.state} legislature: {str(e)}")
             raise
-
-    def _scrape_ny(self) -> List[Dict[str, Any]]:
-        self.db.query(Legislation).filter(
-            Legislation.type == LegislationType.STATE
-        ).delete()
-        self.db.commit()
-
-        data = self._make_request("bills/current")
-        legislation_list = []
-        
-        for item in data.get("bills", []):
-            legislation = Legislation(
-                id=f"state_ny_{item['printNo']}",
-                type=LegislationType.STATE.value,
-                title=item["title"],
-                summary=item.get("summary", ""),
-                status=Status.ACTIVE.value,
-                introduced_date=datetime.strptime(
-                    item["publishedDate"], "%Y-%m-%d"
-                ) if "publishedDate" in item else None,
-                source_url=item.get("url", ""),
-                extra_data={
-                    "state": "NY",
-                    "bill_id": item.get("printNo"),
-                    "session": item.get("session")
-                }
-            )
-            self.db.add(legislation)
-            legislation_list.append(legislation)
-        
-        self.db.commit()
-        return legislation_list
-
-    def _scrape_ca(self) -> List[Dict[str, Any]]:
-        """Scrape California state legislation"""
-        pass
+        return counts
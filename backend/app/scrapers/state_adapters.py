@@ -0,0 +1,357 @@
+from abc import ABC, abstractmethod
+import ast
+import csv
+from datetime import datetime
+from functools import partial
+import glob
+import json
+import os
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+from urllib.parse import urlsplit
+from .base import APIKeyMissingError, parse_date
+from .json_stream import CHUNK_SIZE, StreamedPage
+from ..models import LegislationType, Status
+
+if TYPE_CHECKING:
+    from .state import StateLegislatureScraper
+
+US_STATES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+)
+
+# Bulk dump formats by file extension
+BULK_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json", ".csv": "csv"}
+
+# Open States action classifications, most final first
+ACTION_STATUSES = [
+    ("became-law", Status.SIGNED),
+    ("executive-signature", Status.SIGNED),
+    ("executive-veto", Status.VETOED),
+    ("failure", Status.FAILED),
+    ("passage", Status.PASSED),
+    ("referral-committee", Status.ACTIVE),
+    ("introduction", Status.ACTIVE),
+]
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decoded lines, endings kept, from a stream of byte chunks"""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8") + "\n"
+    if pending:
+        yield pending.decode("utf-8")
+
+def list_field(value: Any, separator: Optional[str] = ";") -> List[Any]:
+    """A list member of a bulk record, however the dump rendered it.
+
+    JSON dumps carry real lists. CSV exports flatten them to strings:
+    JSON-encoded (or Python-repr) lists and objects, or values joined by
+    ``separator``, which come back as lists of strings. Without a
+    separator a plain string is the single item.
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        return [value]
+    text = str(value).strip()
+    if not text:
+        return []
+    if text[0] in "[{":
+        for decode in (json.loads, ast.literal_eval):
+            try:
+                decoded = decode(text)
+            except (ValueError, SyntaxError):
+                continue
+            return decoded if isinstance(decoded, list) else [decoded]
+    if separator is None:
+        return [text]
+    return [part.strip() for part in text.split(separator) if part.strip()]
+
+class StateAdapter(ABC):
+    """Fetches and normalizes one state's bills for StateLegislatureScraper.
+
+    Adapters yield raw upstream items from ``iter_bills`` and map each one
+    onto a legislation row in ``normalize``; the scraper counts, batches
+    and upserts them. Register an adapter for the states it serves with
+    ``register_adapter``.
+    """
+
+    # Upstream budget, as RateLimiter(calls=, period=) arguments
+    rate_limit: Dict[str, int] = {"calls": 1000, "period": 3600}
+
+    def __init__(self, scraper: "StateLegislatureScraper"):
+        self.scraper = scraper
+        self.state = scraper.state
+        self.settings = scraper.settings
+        # Newest upstream update seen, used as the next run's watermark
+        self.updated_through: Optional[datetime] = None
+
+    @classmethod
+    def available(cls, settings) -> bool:
+        """Whether the adapter is configured well enough to run"""
+        return True
+
+    @abstractmethod
+    def iter_bills(self, since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Raw bills, ideally only those updated after ``since``"""
+        pass
+
+    @abstractmethod
+    def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        pass
+
+# State -> adapter for states with a dedicated upstream API
+STATE_ADAPTERS: Dict[str, Type[StateAdapter]] = {}
+
+def register_adapter(*states: str) -> Callable[[Type[StateAdapter]], Type[StateAdapter]]:
+    def register(cls: Type[StateAdapter]) -> Type[StateAdapter]:
+        for state in states:
+            STATE_ADAPTERS[state.upper()] = cls
+        return cls
+    return register
+
+def adapter_for(state: str, settings) -> Type[StateAdapter]:
+    """The adapter scraping ``state``.
+
+    A registered adapter wins when it is configured (has its API key);
+    otherwise the Open States bulk data is used when STATE_BULK_DATA_URL is
+    set. An unconfigured registered adapter is still returned so that its
+    own error says what is missing.
+    """
+    registered = STATE_ADAPTERS.get(state)
+    if registered is not None and registered.available(settings):
+        return registered
+    if OpenStatesBulkAdapter.available(settings) and state in US_STATES:
+        return OpenStatesBulkAdapter
+    if registered is not None:
+        return registered
+    raise ValueError(f"State {state} not supported")
+
+def supported_states(settings) -> List[str]:
+    """Every state some adapter can scrape with the current settings"""
+    bulk = OpenStatesBulkAdapter.available(settings)
+    return [
+        state for state in US_STATES
+        if bulk or (state in STATE_ADAPTERS and STATE_ADAPTERS[state].available(settings))
+    ]
+
+@register_adapter("NY")
+class NYSenateAdapter(StateAdapter):
+    """New York bills from the NY Senate Open Legislation API"""
+
+    rate_limit = {"calls": 1000, "period": 3600}
+    base_url = "https://legislation.nysenate.gov/api/v1"
+    page_size = 1000
+
+    def __init__(self, scraper: "StateLegislatureScraper"):
+        super().__init__(scraper)
+        self.api_key = self.settings.NY_LEGISLATURE_API_KEY
+        if not self.api_key:
+            raise APIKeyMissingError(f"API key required for {self.state} legislature")
+
+    @classmethod
+    def available(cls, settings) -> bool:
+        return bool(settings.NY_LEGISLATURE_API_KEY)
+
+    def iter_bills(self, since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        # The listing has no change filter; unchanged bills are skipped by content hash
+        offset = 0
+        while True:
+            response = self.scraper.http.get(
+                f"{self.base_url}/bills/current",
+                params={"limit": self.page_size, "offset": offset},
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                limiter=self.scraper.limiter
+            )
+            response.raise_for_status()
+            bills = response.json().get("bills", [])
+            self.scraper.counts["pages"] += 1
+            yield from bills
+            if len(bills) < self.page_size:
+                return
+            offset += len(bills)
+
+    def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": f"state_ny_{item['printNo']}",
+            "type": LegislationType.STATE.value,
+            "title": item["title"],
+            "summary": item.get("summary", ""),
+            "status": Status.ACTIVE.value,
+            "introduced_date": parse_date(item.get("publishedDate")),
+            "last_action_date": None,
+            "source_url": item.get("url", ""),
+            "state": "NY",
+            "bill_number": item.get("printNo"),
+            "extra_data": {
+                "state": "NY",
+                "bill_id": item.get("printNo"),
+                "session": item.get("session")
+            }
+        }
+
+class OpenStatesBulkAdapter(StateAdapter):
+    """Bills of any state from Open States-style bulk dumps.
+
+    STATE_BULK_DATA_URL is either a local directory or a URL template
+    containing ``{state}``. A directory is searched for ``{st}.*`` and
+    ``{st}_*`` files and for anything under an ``{st}/`` subdirectory (st
+    in either case), so the per-session files of the Open States dumps can
+    be dropped in as they are. Each file is JSON Lines (one bill per line),
+    JSON (``{"results": [...]}``, as the Open States API pages) or CSV
+    with bill fields as columns, told apart by extension. Files are
+    streamed, so a state's size is bounded only by the database.
+    """
+
+    rate_limit = {"calls": 3600, "period": 3600}
+
+    @classmethod
+    def available(cls, settings) -> bool:
+        return bool(settings.STATE_BULK_DATA_URL)
+
+    def _remote(self) -> bool:
+        return urlsplit(self.settings.STATE_BULK_DATA_URL).scheme in ("http", "https")
+
+    def _sources(self) -> List[str]:
+        location = self.settings.STATE_BULK_DATA_URL
+        if self._remote():
+            return [location.format(state=self.state.lower())]
+        paths = set()
+        for code in (self.state.lower(), self.state):
+            paths.update(glob.glob(os.path.join(location, f"{code}.*")))
+            paths.update(glob.glob(os.path.join(location, f"{code}_*")))
+            paths.update(glob.glob(os.path.join(location, code, "**", "*"), recursive=True))
+        return sorted(path for path in paths if os.path.splitext(path)[1].lower() in BULK_FORMATS)
+
+    def _chunks(self, source: str) -> Iterator[bytes]:
+        if self._remote():
+            response = self.scraper.http.get(source, limiter=self.scraper.limiter, stream=True)
+            try:
+                response.raise_for_status()
+                yield from response.iter_content(CHUNK_SIZE)
+            finally:
+                response.close()
+            return
+        with open(source, "rb") as f:
+            yield from iter(partial(f.read, CHUNK_SIZE), b"")
+
+    def _records(self, source: str) -> Iterator[Dict[str, Any]]:
+        extension = os.path.splitext(urlsplit(source).path)[1].lower()
+        format = BULK_FORMATS.get(extension)
+        if format is None:
+            raise ValueError(f"Unknown bulk data format: {source}")
+        chunks = self._chunks(source)
+        if format == "json":
+            yield from StreamedPage(chunks, "results")
+        elif format == "csv":
+            yield from csv.DictReader(iter_lines(chunks))
+        else:
+            for line in iter_lines(chunks):
+                if line.strip():
+                    yield json.loads(line)
+
+    def iter_bills(self, since: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        self.updated_through = since
+        sources = self._sources()
+        if not sources:
+            raise FileNotFoundError(f"No bulk data for {self.state} in {self.settings.STATE_BULK_DATA_URL}")
+        for source in sources:
+            print(f"Reading {self.state} bills from {source}")
+            for item in self._records(source):
+                updated_at = parse_date(item.get("updated_at"))
+                if updated_at is not None:
+                    if since is not None and updated_at <= since:
+                        continue
+                    if self.updated_through is None or updated_at > self.updated_through:
+                        self.updated_through = updated_at
+                yield item
+            self.scraper.counts["pages"] += 1
+
+    def _status(self, item: Dict[str, Any]) -> Status:
+        classifications = set(list_field(item.get("latest_action_classification")))
+        for action in item.get("actions") or []:
+            classifications.update(action.get("classification") or [])
+        for classification, status in ACTION_STATUSES:
+            if classification in classifications:
+                return status
+        description = (item.get("latest_action_description") or "").lower()
+        if "signed" in description or "chaptered" in description:
+            return Status.SIGNED
+        if "veto" in description:
+            return Status.VETOED
+        if "passed" in description:
+            return Status.PASSED
+        return Status.ACTIVE if description else Status.PENDING
+
+    def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        identifier = item["identifier"].strip()
+        session = item.get("session") or item.get("legislative_session") or item.get("session_identifier") or ""
+        # CSV exports flatten these to strings; plain ones hold the text or URL itself
+        abstracts = [
+            abstract if isinstance(abstract, dict) else {"abstract": abstract}
+            for abstract in list_field(item.get("abstracts"), separator=None)
+        ]
+        sources = [
+            source if isinstance(source, dict) else {"url": source}
+            for source in list_field(item.get("sources"))
+        ]
+        subjects = list_field(item.get("subject"))
+        source_url = item.get("openstates_url") or (sources[0].get("url", "") if sources else "")
+        key = re.sub(r"[^a-z0-9]+", "", identifier.lower())
+        prefix = re.match(r"[A-Za-z]*", identifier).group().lower()
+
+        row = {
+            "id": f"state_{self.state.lower()}_{re.sub(r'[^a-z0-9]+', '', session.lower())}_{key}",
+            "type": LegislationType.STATE.value,
+            "title": item["title"],
+            "summary": abstracts[0].get("abstract", "") if abstracts else "",
+            "status": self._status(item).value,
+            "introduced_date": parse_date(item.get("first_action_date")),
+            "last_action_date": parse_date(item.get("latest_action_date")),
+            "source_url": source_url,
+            "state": self.state,
+            "bill_type": prefix or None,
+            "bill_number": identifier,
+            "extra_data": {
+                "state": self.state,
+                "session": session,
+                "openstates_id": item.get("id"),
+                "classification": list_field(item.get("classification")),
+                "subjects": subjects,
+                "latest_action": item.get("latest_action_description"),
+                "updated_at": item.get("updated_at"),
+            }
+        }
+        # JSON dumps carry the timeline; CSV bill rows do not
+        if isinstance(item.get("actions"), list):
+            row["actions"] = [self._normalize_action(action) for action in item["actions"]]
+        return row
+
+    def _normalize_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        organization = action.get("organization") or {}
+        if isinstance(organization, str):
+            organization = {"name": organization}
+        classification = action.get("classification") or []
+        chamber = organization.get("classification") or action.get("chamber")
+        return {
+            "action_date": parse_date(action.get("date")),
+            "action_type": classification[0] if classification else "action",
+            "description": action.get("description"),
+            "source": organization.get("name") or chamber,
+            "extra_data": {
+                "classification": classification,
+                "chamber": chamber,
+                "order": action.get("order"),
+            }
+        }
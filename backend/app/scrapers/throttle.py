@@ -0,0 +1,226 @@
+import logging
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+import requests
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "slow down" rather than "this request is wrong"
+THROTTLED_STATUSES = {429, 503}
+
+# Refill arithmetic is in floating point; a token this close to whole counts
+EPSILON = 1e-9
+# Shortest sleep between attempts, so rounding can never make a caller spin
+MIN_WAIT = 0.001
+
+class RateLimitError(Exception):
+    pass
+
+class Clock:
+    """Wall-clock time, shared by every process using the same Redis"""
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+class MemoryBucketStore:
+    """Token buckets held in this process; budgets are not shared with other workers"""
+
+    def __init__(self):
+        # key -> (tokens, updated_at, blocked_until)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> float:
+        """Take one token if available; otherwise seconds until one will be"""
+        with self._lock:
+            tokens, updated, blocked = self._buckets.get(key, (capacity, now, 0.0))
+            if blocked > now:
+                return blocked - now
+            tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+            wait = 0.0
+            if tokens >= 1 - EPSILON:
+                tokens = max(0.0, tokens - 1)
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now, blocked)
+            return wait
+
+    def block(self, key: str, until: float, capacity: float, now: float) -> None:
+        """Refuse every token until ``until``"""
+        with self._lock:
+            tokens, updated, blocked = self._buckets.get(key, (capacity, now, 0.0))
+            self._buckets[key] = (tokens, updated, max(blocked, until))
+
+# Both scripts take the caller's clock so every worker agrees with its fake
+# clock in tests; hosts are expected to be NTP-synchronized in production.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'blocked')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+local blocked = tonumber(state[3]) or 0
+if blocked > now then
+    return tostring(blocked - now)
+end
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 - tonumber(ARGV[4]) then
+    tokens = math.max(0, tokens - 1)
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""
+
+BLOCK_SCRIPT = """
+local until = tonumber(ARGV[1])
+local blocked = tonumber(redis.call('HGET', KEYS[1], 'blocked')) or 0
+if until > blocked then
+    redis.call('HSET', KEYS[1], 'blocked', tostring(until))
+end
+redis.call('EXPIRE', KEYS[1], math.ceil(until - tonumber(ARGV[2])) + 60)
+return 1
+"""
+
+class RedisBucketStore:
+    """Token buckets in Redis, so every worker draws on one budget per source.
+
+    Each take is a single atomic script. When Redis is unreachable the
+    store falls back to per-process buckets instead of failing the scrape.
+    """
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._take = self._client.register_script(TAKE_SCRIPT)
+        self._block = self._client.register_script(BLOCK_SCRIPT)
+        self._fallback = MemoryBucketStore()
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> float:
+        try:
+            return float(self._take(keys=[key], args=[rate, capacity, now, EPSILON]))
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable for {key}, using local budget: {str(e)}")
+            return self._fallback.take(key, rate, capacity, now)
+
+    def block(self, key: str, until: float, capacity: float, now: float) -> None:
+        try:
+            self._block(keys=[key], args=[until, now])
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable for {key}, blocking locally: {str(e)}")
+        self._fallback.block(key, until, capacity, now)
+
+@lru_cache()
+def get_bucket_store():
+    url = get_settings().RATELIMIT_STORAGE_URL
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBucketStore(url)
+    return MemoryBucketStore()
+
+def parse_retry_after(value: Optional[str], now: float) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - now)
+
+class RateLimiter:
+    """Token bucket for one upstream's quota of ``calls`` per ``period`` seconds.
+
+    The bucket holds ``burst`` tokens (a minute's worth of the quota by
+    default) and refills at (calls - burst) / period, so no window of
+    ``period`` seconds ever exceeds ``calls`` while callers can still go
+    flat out until the burst is spent. Budgets live in the bucket store,
+    which is shared through Redis when RATELIMIT_STORAGE_URL points at one.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        calls: int,
+        period: float,
+        burst: Optional[int] = None,
+        store=None,
+        clock: Optional[Clock] = None,
+        max_attempts: int = 5,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 300.0,
+        rng: Optional[random.Random] = None
+    ):
+        self.key = f"ratelimit:{source}"
+        self.burst = max(1, burst if burst is not None else calls // 60)
+        self.rate = max(calls - self.burst, 1) / period
+        self.store = store if store is not None else get_bucket_store()
+        self.clock = clock or Clock()
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rng = rng or random.Random()
+
+    def acquire(self) -> float:
+        """Block until a token is granted; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            wait = self.store.take(self.key, self.rate, self.burst, self.clock.now())
+            if wait <= 0:
+                return waited
+            wait = max(wait, MIN_WAIT)
+            self.clock.sleep(wait)
+            waited += wait
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the ``attempt``-th retry (from 0)"""
+        return self.rng.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def penalize(self, seconds: float) -> None:
+        """Pause every caller of this source, in every worker, for ``seconds``"""
+        now = self.clock.now()
+        self.store.block(self.key, now + seconds, self.burst, now)
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send a request within the budget, retrying throttled responses.
+
+        ``send`` returns a requests-style response. A 429 or 503 pauses the
+        whole source for its Retry-After, or a jittered exponential backoff
+        when the header is missing, and the request is retried up to
+        ``max_attempts`` times in all.
+        """
+        for attempt in range(self.max_attempts):
+            self.acquire()
+            response = send()
+            if response.status_code not in THROTTLED_STATUSES:
+                return response
+            delay = parse_retry_after(response.headers.get("Retry-After"), self.clock.now())
+            if delay is None:
+                delay = self.backoff(attempt)
+            # A streamed response holds its connection until closed
+            response.close()
+            logger.warning(
+                f"{self.key} throttled with {response.status_code}, "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1} of {self.max_attempts})"
+            )
+            self.penalize(delay)
+        raise RateLimitError(f"{self.key} still throttled after {self.max_attempts} attempts")
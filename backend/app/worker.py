@@ -1,23 +1,82 @@
-from celery import Celery
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from celery import Celery, chord
 from celery.schedules import crontab
+from .cache import BREAKDOWN_KEY, STATS_KEY, bump_data_version, invalidate
+from .database import SessionLocal
+from .models import rebuild_rollups
 from .scrapers.congress import CongressScraper
 from .scrapers.federal_register import FederalRegisterScraper
+from .scrapers.orchestrator import (
+    ScrapeUnit, UnitResult, format_report, plan_lanes, plan_units, run_lane, summarize
+)
+
+logger = logging.getLogger(__name__)
 
 celery = Celery('legislation_tracker',
                 broker='redis://redis:6379/0',
                 backend='redis://redis:6379/0')
 
 @celery.task
-def scrape_federal_legislation():
+def scrape_federal_legislation(full: bool = False):
     with CongressScraper() as scraper:
-        return scraper.scrape()
+        return scraper.scrape(full=full)
 
 @celery.task
-def scrape_executive_orders():
+def scrape_executive_orders(full: bool = False):
     with FederalRegisterScraper() as scraper:
-        return scraper.scrape()
+        return scraper.scrape(full=full)
+
+@celery.task
+def scrape_lane(units: List[Dict[str, str]], full: bool = False):
+    """Scrape a lane of units one after another; see plan_lanes"""
+    results = run_lane([ScrapeUnit(**unit) for unit in units], full)
+    return [result.as_dict() for result in results]
+
+@celery.task
+def summarize_scrape(lane_results: List[List[Dict[str, Any]]], started_at: float, full: bool = False):
+    results = [UnitResult.from_dict(data) for lane in lane_results for data in lane]
+    summary = summarize(results, time.time() - started_at)
+    logger.info("Scrape finished\n%s", format_report(summary))
+    if full:
+        rebuild_dashboard_rollups()
+    return summary
+
+@celery.task
+def rebuild_dashboard_rollups():
+    """Recompute legislation_rollups from scratch.
+
+    Batches keep the rollups current on their own; this repairs whatever
+    drift concurrent writers inserting the same new rows could leave, and
+    runs after every full re-sync.
+    """
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db)
+        db.commit()
+    finally:
+        db.close()
+    invalidate(STATS_KEY)
+    invalidate(BREAKDOWN_KEY)
+    bump_data_version()
+
+@celery.task
+def scrape_all(full: bool = False, sources: Optional[List[str]] = None):
+    """Fan every unit out across the workers as a chord of lanes.
+
+    Each source gets at most SCRAPER_CONCURRENCY[source] lanes, which caps
+    how many of its units run at once however many workers there are.
+    """
+    lanes = plan_lanes(plan_units(sources))
+    header = [
+        scrape_lane.s([{"source": unit.source, "scope": unit.scope} for unit in lane], full)
+        for lane in lanes
+    ]
+    return chord(header)(summarize_scrape.s(time.time(), full)).id
 
-# Schedule tasks
+# Schedule tasks. Hourly runs are incremental from each source's sync
+# watermark; the full re-syncs re-read everything once a week.
 celery.conf.beat_schedule = {
     'scrape-federal-every-hour': {
         'task': 'app.worker.scrape_federal_legislation',
@@ -26,5 +85,11 @@ celery.conf.beat_schedule = {
     'scrape-executive-every-hour': {
         'task': 'app.worker.scrape_executive_orders',
         'schedule': crontab(minute=30)  # Run every hour at :30
+    },
+    # Full re-syncs fan out per congress and administration
+    'resync-all-weekly': {
+        'task': 'app.worker.scrape_all',
+        'schedule': crontab(minute=15, hour=3, day_of_week='sunday'),
+        'kwargs': {'full': True, 'sources': ['congress', 'federal_register']}
     }
 }
@@ -0,0 +1,116 @@
+"""Compare writing action timelines through Legislation.add_action with the batched upsert.
+
+The ORM path appends one LegislativeAction per action to its bill's
+relationship and commits per bill, the way a scraper would have used
+add_action; the batched path hands each bill's timeline to
+upsert_legislation. Both then re-ingest the same timelines with one new
+action per bill.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_actions --bills 2000 --actions 25
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Legislation, LegislationType, LegislativeAction, Status
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_bills(count, actions, revision=0):
+    start = datetime(2023, 1, 9)
+    for n in range(count):
+        yield {
+            "id": f"federal_118_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"Bill {n}",
+            "status": Status.ACTIVE.value,
+            "introduced_date": start,
+            "congress": "118",
+            "actions": [
+                {
+                    "action_date": start + timedelta(days=step),
+                    "action_type": "Committee",
+                    "description": f"Committee Consideration and Mark-up Session Held (step {step}).",
+                    "source": "House committee actions",
+                    "extra_data": {"action_code": f"H1900{step}"},
+                }
+                for step in range(actions + revision)
+            ],
+        }
+
+
+def orm(db, bills):
+    """Per-object inserts through the relationship, skipping actions already stored"""
+    for data in bills:
+        actions = data.pop("actions")
+        item = db.get(Legislation, data["id"])
+        if item is None:
+            item = Legislation(**data)
+            db.add(item)
+        stored = {action.id for action in item.actions}
+        for action in actions:
+            action_id = LegislativeAction.natural_id(
+                item.id, action["action_date"], action["action_type"], action["description"], action["source"]
+            )
+            if action_id not in stored:
+                item.add_action(
+                    action["action_type"], action["description"], action["extra_data"],
+                    action["action_date"], action["source"]
+                )
+        db.commit()
+
+
+def batched(db, bills):
+    scraper = BenchScraper()
+    scraper._db = db
+    scraper.batch_size = 500
+    scraper.upsert_legislation(bills)
+
+
+def run(label, path, fn, bills, actions):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    results = []
+    for phase, revision in (("initial load", 0), ("one new each", 1)):
+        db = Session()
+        started = time.perf_counter()
+        fn(db, make_bills(bills, actions, revision))
+        elapsed = time.perf_counter() - started
+        stored = db.execute(select(func.count()).select_from(LegislativeAction.__table__)).scalar()
+        db.close()
+        results.append((phase, elapsed))
+        print(f"{label:>8} {phase:>13}: {elapsed:7.2f}s  {stored / elapsed:9.0f} actions/s  {stored} stored")
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bills", type=int, default=2000)
+    parser.add_argument("--actions", type=int, default=25, help="actions per bill")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        slow = run("orm", os.path.join(tmp, "orm.db"), orm, args.bills, args.actions)
+        fast = run("batched", os.path.join(tmp, "batched.db"), batched, args.bills, args.actions)
+
+    for (phase, old), (_, new) in zip(slow, fast):
+        print(f"{phase}: {old / new:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
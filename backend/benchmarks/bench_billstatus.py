@@ -0,0 +1,98 @@
+"""Time to load a synthetic congress of BILLSTATUS XML from a zip, by worker count.
+
+Writes one archive of BILLSTATUS files (each with sponsors, committees,
+subjects, a summary and a run of actions, like a bill that got through
+committee) and loads it with CongressScraper.ingest_bulk into a fresh
+SQLite file per run, parsing in-process and then on process pools of
+increasing size. No network access is involved.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_billstatus --bills 15000 --workers 0,1,2,4
+"""
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import Base, connect_args
+from app.scrapers.congress import CongressScraper
+
+ACTION = """      <item>
+        <actionDate>2023-{month:02d}-{day:02d}</actionDate>
+        <text>Committee Consideration and Mark-up Session Held (step {step}).</text>
+        <type>Committee</type>
+        <actionCode>H1900{step}</actionCode>
+        <sourceSystem><code>1</code><name>House committee actions</name></sourceSystem>
+        <committees><item><systemCode>hswm00</systemCode><name>Ways and Means Committee</name></item></committees>
+      </item>
+"""
+
+
+def billstatus(number, actions):
+    steps = "".join(ACTION.format(month=step % 12 + 1, day=step % 28 + 1, step=step) for step in range(actions))
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<billStatus>
+  <bill>
+    <number>{number}</number>
+    <updateDate>2024-02-01T12:00:00Z</updateDate>
+    <type>HR</type>
+    <introducedDate>2023-01-09</introducedDate>
+    <congress>118</congress>
+    <committees><item><systemCode>hswm00</systemCode><name>Ways and Means Committee</name>
+      <chamber>House</chamber><type>Standing</type></item></committees>
+    <actions>
+{steps}    </actions>
+    <sponsors><item><bioguideId>S{number:06d}</bioguideId><fullName>Rep. Smith, Jane [R-TX-1]</fullName>
+      <party>R</party><state>TX</state><district>1</district></item></sponsors>
+    <subjects><legislativeSubjects><item><name>Income tax credits</name></item>
+      <item><name>Small business</name></item></legislativeSubjects>
+      <policyArea><name>Taxation</name></policyArea></subjects>
+    <summaries><summary><updateDate>2023-02-01T10:00:00Z</updateDate>
+      <text><![CDATA[<p><strong>Small Business Tax Relief Act</strong></p><p>{"This bill expands a credit. " * 20}</p>]]></text>
+    </summary></summaries>
+    <title>Small Business Tax Relief Act {number}</title>
+    <latestAction><actionDate>2023-03-01</actionDate><text>Ordered to be Reported.</text></latestAction>
+  </bill>
+</billStatus>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bills", type=int, default=15000)
+    parser.add_argument("--actions", type=int, default=12, help="actions per bill")
+    parser.add_argument("--workers", default="0,1,2,4", help="comma-separated worker counts; 0 parses in-process")
+    args = parser.parse_args()
+
+    get_settings().SCRAPER_BATCH_SIZE = 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "BILLSTATUS-118-hr.zip")
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as f:
+            for number in range(args.bills):
+                f.writestr(f"BILLSTATUS-118hr{number}.xml", billstatus(number, args.actions))
+        print(f"{args.bills} bills x {args.actions} actions, {os.path.getsize(archive) / 1024 ** 2:.1f} MiB zipped, "
+              f"{os.cpu_count()} CPUs")
+
+        for workers in (int(value) for value in args.workers.split(",")):
+            url = f"sqlite:///{os.path.join(tmp, f'bench-{workers}.db')}"
+            engine = create_engine(url, connect_args=connect_args(url))
+            Base.metadata.create_all(bind=engine)
+            with CongressScraper() as scraper:
+                scraper._db = sessionmaker(bind=engine)()
+                started = time.perf_counter()
+                counts = scraper.ingest_bulk(archive, workers=workers)
+                elapsed = time.perf_counter() - started
+            engine.dispose()
+            label = "in-process" if workers == 0 else f"{workers} workers"
+            print(f"{label:>12}: {elapsed:7.1f}s  {counts['inserted'] / elapsed:7.0f} bills/s  "
+                  f"{counts['inserted']} inserted  {counts['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Throughput of /federal under 50-200 concurrent clients, sync vs async sessions.
+
+"sync" serves the route the way it was written before the async engine:
+an ``async def`` handler calling the blocking Session, so every query runs
+on the event loop. "async" is the current route on AsyncSession. Both run
+in one uvicorn worker against the same SQLite file.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_concurrency --rows 50000 --clients 50 100 200
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.api.queries import filter_legislation, paginate
+from app.database import Base, get_async_db
+from app.main import app
+from app.models import LegislationType, Status
+from app.schemas import LegislationPage, SUMMARY_COLUMNS
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count):
+    start = datetime(2009, 1, 6)
+    for n in range(count):
+        yield {
+            "id": f"federal_{116 + n % 3}_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"Bill {n}",
+            "summary": "",
+            "status": Status.ACTIVE.value,
+            "introduced_date": start + timedelta(hours=n * 3),
+            "source_url": f"https://www.congress.gov/bill/118th-congress/hr/{n}",
+            "congress": str(116 + n % 3),
+        }
+
+
+def sync_app(SessionLocal):
+    """The pre-async handler shape: async def + blocking Session"""
+    legacy = FastAPI()
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @legacy.get("/api/v1/federal", response_model=LegislationPage)
+    async def get_federal_legislation(
+        page: int = Query(1, ge=1),
+        limit: int = Query(20, ge=1, le=100),
+        include_total: bool = None,
+        db: Session = Depends(get_db)
+    ):
+        query = filter_legislation(db.query(*SUMMARY_COLUMNS), LegislationType.FEDERAL)
+        return paginate(query, page, limit, include_total=include_total)
+
+    return legacy
+
+
+def run_server(label, path, port, pool_size):
+    """Serve one variant in its own process so the load generator does not share its GIL"""
+    pool = {"pool_size": pool_size, "max_overflow": 2 * pool_size}
+    if label == "sync":
+        engine = create_engine(f"sqlite:///{path}", **pool)
+        application = sync_app(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    else:
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, **pool
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSessionLocal() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        application = app
+    uvicorn.run(application, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+
+
+def serve(label, path, port, pool_size):
+    server = multiprocessing.Process(target=run_server, args=(label, path, port, pool_size))
+    server.start()
+    for _ in range(200):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/v1/federal", params={"limit": 1})
+            return server
+        except httpx.TransportError:
+            time.sleep(0.05)
+    server.terminate()
+    raise RuntimeError(f"{label} server did not start")
+
+
+async def load(port, clients, duration, pages, timeout):
+    """Requests completed per second, p50/p99 latency and failed requests"""
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=timeout
+    ) as http:
+        async def client(seed):
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                params = {"page": rng.randint(1, pages), "limit": 20, "include_total": False}
+                started = time.perf_counter()
+                try:
+                    response = await http.get("/api/v1/federal", params=params)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(client(n) for n in range(clients)))
+    elapsed = duration + max(0.0, time.perf_counter() - deadline)
+    if not latencies:
+        return 0.0, float("nan"), float("nan"), errors
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return len(ordered) / elapsed, statistics.median(ordered) * 1000, p99 * 1000, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--variants", nargs="+", choices=["sync", "async"], default=["sync", "async"])
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        scraper = BenchScraper()
+        scraper._db = SessionLocal()
+        scraper.batch_size = 2000
+        scraper.upsert_legislation(make_rows(args.rows))
+        scraper._db.close()
+
+        engine.dispose()
+        pages = args.rows // 20
+
+        print(f"{args.rows} rows, {args.duration:.0f}s per run, random pages of 20")
+        results = {}
+        for label in args.variants:
+            server = serve(label, path, args.port, args.pool_size)
+            for clients in args.clients:
+                rps, p50, p99, errors = asyncio.run(
+                    load(args.port, clients, args.duration, pages, args.timeout)
+                )
+                results[label, clients] = rps
+                print(f"{label:>5} {clients:>4} clients: {rps:8.0f} req/s  "
+                      f"p50 {p50:7.1f} ms  p99 {p99:7.1f} ms  {errors} failed", flush=True)
+            # A blocked event loop never handles SIGTERM
+            server.kill()
+            server.join()
+
+        for clients in args.clients if len(args.variants) == 2 else []:
+            sync, concurrent = results["sync", clients], results["async", clients]
+            ratio = f"{concurrent / sync:.2f}x" if sync else "sync served nothing"
+            print(f"{clients:>4} clients: {ratio} throughput")
+
+
+if __name__ == "__main__":
+    main()
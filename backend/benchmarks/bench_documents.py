@@ -0,0 +1,140 @@
+"""Row size and /executive list latency with full text inline vs in legislation_documents.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_documents --orders 4000 --body-kb 40
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.api import queries
+from app.database import Base
+from app.models import Legislation, LegislationDocument, LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+WORDS = "order agency federal policy section secretary shall national program report".split()
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_body(size):
+    rng = random.Random(size)
+    paragraphs = []
+    while sum(map(len, paragraphs)) < size:
+        paragraphs.append("<p>" + " ".join(rng.choice(WORDS) for _ in range(60)) + "</p>")
+    return "\n".join(paragraphs)
+
+
+def make_rows(count, body):
+    start = datetime(2009, 1, 20)
+    for n in range(count):
+        yield {
+            "id": f"executive_{13489 + n}",
+            "type": LegislationType.EXECUTIVE.value,
+            "title": f"Executive Order {13489 + n}",
+            "summary": "",
+            "status": Status.SIGNED.value,
+            "introduced_date": start + timedelta(days=n),
+            "last_action_date": start + timedelta(days=n),
+            "source_url": f"https://www.federalregister.gov/d/{n}",
+            "president": "Barack Obama",
+            "full_text": body,
+            "extra_data": {"executive_order_number": str(13489 + n)},
+        }
+
+
+def build(path, count, body, inline):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    scraper = BenchScraper()
+    scraper._db = Session()
+    scraper.batch_size = 500
+    scraper.upsert_legislation(make_rows(count, body))
+    if inline:
+        # Recreate the previous layout: body inside extra_data, no side table
+        db = scraper._db
+        for item in db.query(Legislation):
+            item.extra_data = {**item.extra_data, "full_text": body}
+        db.query(LegislationDocument).delete()
+        db.commit()
+    scraper._db.close()
+    return engine, Session
+
+
+def average_row_bytes(Session):
+    db = Session()
+    try:
+        return db.execute(select(func.avg(
+            func.length(Legislation.title) + func.length(Legislation.extra_data)
+        ))).scalar()
+    finally:
+        db.close()
+
+
+def list_latency(Session, repeat):
+    """p50 of what /executive does per request: filtered page query plus JSON encoding.
+
+    Like timeit, the garbage collector is paused while timing and run
+    between requests instead.
+    """
+    samples = []
+    for n in range(repeat):
+        db = Session()
+        queries._count_cache.clear()
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            query = queries.filter_legislation(db.query(Legislation), LegislationType.EXECUTIVE)
+            jsonable_encoder(queries.paginate(query, n % 20 + 1, 100))
+            samples.append(time.perf_counter() - started)
+            db.close()
+        finally:
+            gc.enable()
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=4000)
+    parser.add_argument("--body-kb", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    body = make_body(args.body_kb * 1024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, inline in (("inline", True), ("side table", False)):
+            path = os.path.join(tmp, f"{label.replace(' ', '_')}.db")
+            engine, Session = build(path, args.orders, body, inline)
+            results[label] = (
+                average_row_bytes(Session),
+                os.path.getsize(path),
+                list_latency(Session, args.repeat),
+            )
+            engine.dispose()
+
+    for label, (row_bytes, file_bytes, latency) in results.items():
+        print(f"{label:>10}: avg row {row_bytes:9.0f} B  db file {file_bytes / 2**20:7.1f} MiB  "
+              f"p50 list (100 items) {latency:7.2f} ms")
+    inline, side = results["inline"], results["side table"]
+    print(f"row size cut {inline[0] / side[0]:.0f}x, list latency cut {inline[2] / side[2]:.1f}x, "
+          f"db file {inline[1] / side[1]:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
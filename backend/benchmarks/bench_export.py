@@ -0,0 +1,117 @@
+"""Peak Python memory of a full-corpus export as the corpus grows.
+
+Compares the streaming export (server-side cursor, one batch in memory)
+with loading the whole result first. Chunks are written to /dev/null so
+only the export itself is measured; peaks come from tracemalloc.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_export --rows 100000 1000000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.export import ENCODERS, export_statement, iter_batches, stream_export, write_columnar
+from app.database import Base
+from app.models import LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(start, count):
+    base = datetime(2009, 1, 6)
+    for n in range(start, start + count):
+        yield {
+            "id": f"federal_{116 + n % 3}_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"To amend title {n % 50} of the United States Code, and for other purposes",
+            "summary": "",
+            "status": Status.ACTIVE.value,
+            "introduced_date": base + timedelta(minutes=n * 5),
+            "source_url": f"https://www.congress.gov/bill/118th-congress/house-bill/{n}",
+            "congress": str(116 + n % 3),
+        }
+
+
+def measure(run):
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--skip-eager", action="store_true", help="skip the load-everything baseline")
+    args = parser.parse_args()
+    statement = export_statement(LegislationType.FEDERAL)
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as sink:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        scraper = BenchScraper()
+        scraper._db = SessionLocal()
+        scraper.batch_size = 5000
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+        def eager():
+            with SessionLocal() as db:
+                rows = db.execute(statement).all()
+                sink.write(ENCODERS[args.format](rows))
+                return len(rows)
+
+        def streamed_api():
+            async def drain():
+                async with AsyncSession(async_engine) as db:
+                    async for chunk in stream_export(db, statement, args.format):
+                        sink.write(chunk)
+            asyncio.run(drain())
+
+        def streamed_parquet():
+            with SessionLocal() as db:
+                return write_columnar(iter_batches(db, statement), "parquet", os.path.join(tmp, "out.parquet"))
+
+        variants = {"api stream": streamed_api}
+        try:
+            import pyarrow  # noqa: F401
+            variants["parquet"] = streamed_parquet
+        except ImportError:
+            print("pyarrow not installed; skipping parquet")
+        if not args.skip_eager:
+            variants["load all"] = eager
+
+        loaded = 0
+        for total in sorted(args.rows):
+            scraper.upsert_legislation(make_rows(loaded, total - loaded))
+            loaded = total
+            for label, run in variants.items():
+                _, elapsed, peak = measure(run)
+                print(f"{total:>8} rows {label:>10}: peak {peak / 2**20:8.1f} MiB  "
+                      f"{total / elapsed:9.0f} rows/s", flush=True)
+
+        scraper._db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Per-request latency of bare requests.get vs the pooled scraper HTTP client.
+
+A local HTTP/1.1 server (TLS with a throwaway self-signed certificate by
+default) answers a JSON page like an API listing. Bare calls pay a TCP
+and TLS handshake each time; the pooled client keeps the connection
+alive. Bytes on the wire are reported with and without gzip.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_http --requests 300
+"""
+import argparse
+import gzip
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.scrapers.http_client import HTTPClient
+
+PAGE = json.dumps({"bills": [
+    {"number": str(n), "title": f"To amend title {n % 50} of the United States Code", "type": "HR"}
+    for n in range(250)
+]}).encode()
+COMPRESSED = gzip.compress(PAGE)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY a
+    # reused connection stalls on delayed ACKs
+    disable_nagle_algorithm = True
+    sent = 0
+
+    def do_GET(self):
+        body = PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = COMPRESSED
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        Handler.sent += len(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def self_signed(directory):
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+        "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+        "-keyout", key, "-out", cert,
+    ], check=True, capture_output=True)
+    return cert, key
+
+
+def timed(get, url, count):
+    Handler.sent = 0
+    latencies = []
+    for _ in range(count):
+        started = time.perf_counter()
+        get(url).raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return latencies, Handler.sent / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--plain", action="store_true", help="plain HTTP instead of TLS")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        scheme, verify = "http", True
+        if not args.plain:
+            cert, key = self_signed(tmp)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert, key)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            scheme, verify = "https", cert
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"{scheme}://127.0.0.1:{server.server_port}/v3/bill/118"
+
+        client = HTTPClient()
+        runs = {
+            "requests.get": lambda u: requests.get(u, verify=verify, headers={"Accept-Encoding": "identity"}),
+            "requests.get + gzip": lambda u: requests.get(u, verify=verify),
+            "pooled client": lambda u: client.get(u, verify=verify),
+        }
+        results = {label: timed(get, url, args.requests) for label, get in runs.items()}
+        client.close()
+        server.shutdown()
+
+    print(f"{args.requests} {scheme.upper()} requests of a {len(PAGE) / 1024:.0f} KiB page")
+    baseline = statistics.mean(results["requests.get + gzip"][0])
+    for label, (latencies, size) in results.items():
+        mean = statistics.mean(latencies)
+        print(f"{label:>20}: mean {mean * 1000:6.2f} ms  p50 {statistics.median(latencies) * 1000:6.2f} ms  "
+              f"{size / 1024:6.1f} KiB/response  {(baseline - mean) * 1000:+6.2f} ms saved vs bare")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Peak RSS per page of decoding API pages whole vs streaming their items.
+
+A local stub serves Federal Register-style pages whose results carry a
+``body_html`` of the given size. Each mode runs in a fresh child process,
+since peak RSS only grows; the child reports how far its peak rose above
+the RSS it had after imports and a warm-up request. Every item goes
+through FederalRegisterScraper._normalize_order and is then dropped, as it
+would be after the batch upsert.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_json_stream --pages 5 --results 100 --body-kib 64
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def page_body(results, body_kib):
+    paragraph = "<p>By the authority vested in me as President by the Constitution and the laws.</p>"
+    body_html = paragraph * (body_kib * 1024 // len(paragraph))
+    return json.dumps({
+        "count": results,
+        "results": [
+            {
+                "document_number": f"2021-{n:05d}",
+                "title": f"Executive Order {n}",
+                "publication_date": "2021-06-01",
+                "body_html": body_html,
+            }
+            for n in range(results)
+        ],
+    }).encode()
+
+
+def serve(body):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            payload = body if self.path.startswith("/documents") else b'{"results": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def child(mode, url, pages):
+    from app.scrapers.federal_register import FederalRegisterScraper
+    from app.scrapers.json_stream import StreamedPage
+
+    scraper = FederalRegisterScraper()
+    scraper.http.get(url.replace("/documents", "/warmup")).json()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    for _ in range(pages):
+        if mode == "json":
+            items = scraper.http.get(url).json()["results"]
+        else:
+            items = StreamedPage.from_response(scraper.http.get(url, stream=True), "results")
+        for item in items:
+            scraper._normalize_order(item, "Joseph R. Biden")
+        del items
+    elapsed = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"peak_kib": peak - baseline, "seconds": elapsed / pages}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--results", type=int, default=100, help="results per page")
+    parser.add_argument("--body-kib", type=int, default=64, help="body_html size per result")
+    parser.add_argument("--child", choices=["json", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.url, args.pages)
+        return
+
+    body = page_body(args.results, args.body_kib)
+    server = serve(body)
+    url = f"http://127.0.0.1:{server.server_port}/documents"
+    print(f"{args.pages} pages of {args.results} results, {len(body) / 1024 ** 2:.1f} MiB each")
+    for mode, label in (("json", "response.json()"), ("stream", "StreamedPage")):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_json_stream", "--child", mode, "--url", url,
+             "--pages", str(args.pages)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{label:>16}: peak RSS +{result['peak_kib'] / 1024:6.1f} MiB  "
+              f"{result['seconds'] * 1000:6.1f} ms/page")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
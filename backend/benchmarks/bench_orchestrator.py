@@ -0,0 +1,121 @@
+"""Wall time of a full scrape, one unit at a time vs fanned out per unit.
+
+A local stub serves Congress.gov and Federal Register pages with a fixed
+latency per request. Every unit writes through its own session into the
+same SQLite file. Both runs are full syncs into an empty database.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_orchestrator --latency 0.1 --pages 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import Base
+from app.models import Legislation, LegislationDocument, ScrapeState, search_table
+from app.scrapers import base
+from app.scrapers.orchestrator import format_report, run_all
+
+
+def stub_handler(latency, pages, page_size):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path.startswith("/v3/bill/"):
+                offset = int(query["offset"][0])
+                limit = int(query["limit"][0])
+                total = pages * limit
+                body = {
+                    "bills": [
+                        {
+                            "type": "HR", "number": str(n), "title": f"Bill {n}",
+                            "introducedDate": "2023-01-09",
+                            "latestAction": {"actionDate": "2023-01-10", "text": "Referred to committee"},
+                        }
+                        for n in range(offset, min(offset + limit, total))
+                    ],
+                    "pagination": {"count": total},
+                }
+            else:
+                page = int(query["page"][0])
+                start = query["conditions[publication_date][gte]"][0][:4]
+                body = {"results": [
+                    {
+                        "document_number": f"{start}-{page:03d}{n:03d}",
+                        "title": f"Executive Order {start}-{page}-{n}",
+                        "publication_date": f"{start}-06-01",
+                        "body_html": "<p>" + "By the authority vested in me as President. " * 40 + "</p>",
+                    }
+                    for n in range(page_size)
+                ] if page <= pages else []}
+            encoded = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def reset(session_factory):
+    with session_factory() as db:
+        for table in (search_table, LegislationDocument.__table__, Legislation.__table__, ScrapeState.__table__):
+            db.execute(delete(table))
+        db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds per upstream request")
+    parser.add_argument("--pages", type=int, default=8, help="pages per unit")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), stub_handler(args.latency, args.pages, args.page_size))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_port}"
+
+    settings = get_settings()
+    settings.CONGRESS_API_KEY = "bench"
+    settings.CONGRESS_API_BASE_URL = f"{root}/v3"
+    settings.CONGRESS_PAGE_SIZE = args.page_size
+    settings.FEDERAL_REGISTER_API_BASE_URL = f"{root}/v1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        base.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        sources = ["congress", "federal_register"]
+
+        reset(base.SessionLocal)
+        serial = run_all(sources, full=True, serial=True)
+        reset(base.SessionLocal)
+        parallel = run_all(sources, full=True)
+        engine.dispose()
+    server.shutdown()
+
+    for label, summary in (("one unit at a time", serial), ("fanned out", parallel)):
+        print(f"\n{label}:")
+        print(format_report(summary))
+    print(f"\nOverall: {serial['wall_seconds']:.1f}s -> {parallel['wall_seconds']:.1f}s "
+          f"({serial['wall_seconds'] / parallel['wall_seconds']:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
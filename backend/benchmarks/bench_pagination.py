@@ -0,0 +1,120 @@
+"""p50/p99 latency of /federal for page 1 and a deep page, offset vs cursor.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_pagination --rows 50000 --deep-page 500
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import queries
+from app.database import Base, get_async_db
+from app.main import app
+from app.models import LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count):
+    start = datetime(2009, 1, 6)
+    for n in range(count):
+        yield {
+            "id": f"federal_{116 + n % 3}_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"Bill {n}",
+            "summary": "",
+            "status": Status.ACTIVE.value,
+            "introduced_date": start + timedelta(hours=n * 3),
+            "source_url": f"https://www.congress.gov/bill/118th-congress/hr/{n}",
+            "congress": str(116 + n % 3),
+            "extra_data": {"latest_action": {"text": "Referred to committee"}},
+        }
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return statistics.median(ordered) * 1000, p99 * 1000
+
+
+def measure(client, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        # Counts are cached per filter; clear so every page-mode call pays for it
+        queries._count_cache.clear()
+        started = time.perf_counter()
+        response = client.get("/api/v1/federal", params=params)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+    return percentiles(samples)
+
+
+def cursor_for_page(client, page, limit):
+    """Walk the cursor chain to the start of ``page``"""
+    cursor = None
+    for _ in range(page - 1):
+        params = {"limit": limit, "include_total": False}
+        if cursor:
+            params["cursor"] = cursor
+        cursor = client.get("/api/v1/federal", params=params).json()["next_cursor"]
+    return cursor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--deep-page", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        scraper = BenchScraper()
+        scraper._db = Session()
+        scraper.batch_size = 2000
+        scraper.upsert_legislation(make_rows(args.rows))
+        scraper._db.close()
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSession() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        with TestClient(app) as client:
+            deep_cursor = cursor_for_page(client, args.deep_page, args.limit)
+            cases = [
+                ("offset", 1, {"page": 1, "limit": args.limit}),
+                ("offset", args.deep_page, {"page": args.deep_page, "limit": args.limit}),
+                ("cursor", 1, {"limit": args.limit, "include_total": False}),
+                ("cursor", args.deep_page, {"cursor": deep_cursor, "limit": args.limit}),
+            ]
+            print(f"{args.rows} rows, limit {args.limit}, {args.repeat} requests per case")
+            for mode, page, params in cases:
+                p50, p99 = measure(client, params, args.repeat)
+                print(f"{mode:>6} page {page:>4}: p50 {p50:7.2f} ms  p99 {p99:7.2f} ms")
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
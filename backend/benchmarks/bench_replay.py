@@ -0,0 +1,77 @@
+"""Wall time of a full scrape over the network vs replayed from the response cache.
+
+Reuses the latency stub of bench_orchestrator. The first run fills an
+on-disk cache while scraping; the offline run replays the same scrape
+into an empty database from the cache alone, so only normalization and
+persistence are left.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_replay --latency 0.1 --pages 8
+"""
+import argparse
+import os
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import Base
+from app.scrapers import base
+from app.scrapers.orchestrator import run_all
+from benchmarks.bench_orchestrator import reset, stub_handler
+
+
+def cache_size(directory):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(directory) for name in names
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds per upstream request")
+    parser.add_argument("--pages", type=int, default=8, help="pages per unit")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    handler = stub_handler(args.latency, args.pages, args.page_size)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_port}"
+
+    settings = get_settings()
+    settings.CONGRESS_API_KEY = "bench"
+    settings.CONGRESS_API_BASE_URL = f"{root}/v3"
+    settings.CONGRESS_PAGE_SIZE = args.page_size
+    settings.FEDERAL_REGISTER_API_BASE_URL = f"{root}/v1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.SCRAPER_CACHE_DIR = os.path.join(tmp, "responses")
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        base.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        sources = ["congress", "federal_register"]
+
+        reset(base.SessionLocal)
+        online = run_all(sources, full=True)
+        reset(base.SessionLocal)
+        settings.SCRAPER_OFFLINE = True
+        server.shutdown()
+        offline = run_all(sources, full=True)
+        stored = cache_size(settings.SCRAPER_CACHE_DIR)
+        engine.dispose()
+
+    for label, summary in (("online", online), ("offline replay", offline)):
+        print(f"{label:>15}: {summary['wall_seconds']:6.2f}s  {summary['totals']['inserted']} inserted  "
+              f"{len(summary['failed'])} failed units")
+    print(f"Cache on disk: {stored / 1024:.0f} KiB  "
+          f"({online['wall_seconds'] / offline['wall_seconds']:.1f}x faster offline)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Dashboard-style traffic against the response cache: hit ratio and latency.
+
+Simulated clients switch between the federal and executive tabs, page
+through results and open details, revalidating with If-None-Match like a
+browser honouring ``Cache-Control: no-cache``. A scrape commit lands
+halfway through.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_response_cache --rows 20000 --requests 5000 --clients 20
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, get_async_db
+from app.main import app
+from app.models import LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count, revision=0):
+    start = datetime(2009, 1, 6)
+    for n in range(count):
+        executive = n % 4 == 0
+        yield {
+            "id": f"executive_{n}" if executive else f"federal_118_hr_{n}",
+            "type": (LegislationType.EXECUTIVE if executive else LegislationType.FEDERAL).value,
+            "title": f"Item {n}" + (f" (rev {revision})" if revision and n % 50 == 0 else ""),
+            "summary": "",
+            "status": (Status.SIGNED if executive else Status.ACTIVE).value,
+            "introduced_date": start + timedelta(hours=n * 3),
+            "congress": None if executive else "118",
+        }
+
+
+def next_request(rng, rows):
+    roll = rng.random()
+    if roll < 0.4:
+        return f"/api/v1/federal?page={rng.randint(1, 5)}"
+    if roll < 0.7:
+        return f"/api/v1/executive?page={rng.randint(1, 3)}"
+    if roll < 0.8:
+        return "/api/v1/stats"
+    n = rng.randrange(0, min(rows, 200))
+    return f"/api/v1/legislation/{'executive' if n % 4 == 0 else 'federal_118_hr'}_{n}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        scraper = BenchScraper()
+        scraper._db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        scraper.batch_size = 2000
+        scraper.upsert_legislation(make_rows(args.rows))
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSession() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        etags = {}
+        samples = {"miss": [], "hit": [], "not_modified": []}
+        with TestClient(app) as client:
+            for number in range(args.requests):
+                if number == args.requests // 2:
+                    scraper.upsert_legislation(make_rows(args.rows, revision=1))
+                # Each simulated browser keeps its own ETags
+                url = next_request(rng, args.rows)
+                seen = (rng.randrange(args.clients), url)
+                headers = {"If-None-Match": etags[seen]} if seen in etags else {}
+                started = time.perf_counter()
+                response = client.get(url, headers=headers)
+                elapsed = time.perf_counter() - started
+                if response.status_code == 304:
+                    samples["not_modified"].append(elapsed)
+                else:
+                    response.raise_for_status()
+                    samples[response.headers["X-Cache"].lower()].append(elapsed)
+                    etags[seen] = response.headers["ETag"]
+        app.dependency_overrides.clear()
+        scraper._db.close()
+        engine.dispose()
+
+    total = sum(len(values) for values in samples.values())
+    served = len(samples["hit"]) + len(samples["not_modified"])
+    print(f"{total} requests, {served / total:.1%} answered without running the route")
+    for result, values in samples.items():
+        if values:
+            print(f"{result:>12}: {len(values):6d}  p50 {statistics.median(values) * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
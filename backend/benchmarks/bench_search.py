@@ -0,0 +1,115 @@
+"""/search latency on a synthetic corpus, FTS5 index vs a LIKE scan.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_search --docs 50000 --body-words 300
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+
+from app.api.search import search_legislation
+from app.database import Base
+from app.models import Legislation, LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+COMMON = "order agency federal policy section secretary shall national program report".split()
+TOPICS = "climate energy health tariff immigration cybersecurity housing veterans broadband water".split()
+QUERIES = ["climate", "national policy", "cybersecurity report", "broadband water", "immig", "nonexistent"]
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count, body_words):
+    rng = random.Random(count)
+    # A long tail of rare words keeps the vocabulary realistic
+    rare = [f"term{n}" for n in range(20000)]
+    start = datetime(2009, 1, 20)
+    for n in range(count):
+        topic = rng.choice(TOPICS)
+        words = [
+            rng.choice(COMMON) if roll < 0.7 else topic if roll < 0.75 else rng.choice(rare)
+            for roll in (rng.random() for _ in range(body_words))
+        ]
+        yield {
+            "id": f"executive_{n}",
+            "type": LegislationType.EXECUTIVE.value,
+            "title": f"Executive Order on {topic.title()} {n}",
+            "summary": "",
+            "status": Status.SIGNED.value,
+            "introduced_date": start + timedelta(hours=n),
+            "president": "Barack Obama",
+            "full_text": "<p>" + " ".join(words) + "</p>",
+        }
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return statistics.median(ordered) * 1000, p99 * 1000
+
+
+def like_scan(db, q, limit=20):
+    """What a search without the index would cost: LIKE over title and summary"""
+    pattern = f"%{q}%"
+    query = db.query(Legislation.id).filter(
+        or_(Legislation.title.ilike(pattern), Legislation.summary.ilike(pattern))
+    )
+    query.count()
+    query.limit(limit).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50000)
+    parser.add_argument("--body-words", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        scraper = BenchScraper()
+        scraper._db = Session()
+        scraper.batch_size = 1000
+        started = time.perf_counter()
+        scraper.upsert_legislation(make_rows(args.docs, args.body_words))
+        print(f"indexed {args.docs} documents in {time.perf_counter() - started:.1f}s")
+        scraper._db.close()
+
+        db = Session()
+        print(f"{'query':>22}  {'hits':>6}  {'fts p50':>8}  {'fts p99':>8}  {'LIKE p50':>9}")
+        for q in QUERIES:
+            hits = search_legislation(db, q, limit=20)["total"]
+            fts_p50, fts_p99 = timed(lambda: search_legislation(db, q, limit=20), args.repeat)
+            like_p50, _ = timed(lambda: like_scan(db, q), max(1, args.repeat // 5))
+            print(f"{q:>22}  {hits:>6}  {fts_p50:6.2f}ms  {fts_p99:6.2f}ms  {like_p50:7.2f}ms")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time to load and serialize a 100-item list page: ORM entities vs summary rows.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_serialization --rows 5000 --page-size 100
+"""
+import argparse
+import os
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.queries import filter_legislation, paginate
+from app.database import Base
+from app.models import Legislation, LegislationType, Status
+from app.schemas import LegislationPage, SUMMARY_COLUMNS
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count):
+    start = datetime(2019, 1, 3)
+    for n in range(count):
+        yield {
+            "id": f"federal_118_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"To amend title {n % 50} of the United States Code, and for other purposes",
+            "summary": "",
+            "status": Status.ACTIVE.value,
+            "introduced_date": start + timedelta(hours=n),
+            "last_action_date": start + timedelta(hours=n + 48),
+            "source_url": f"https://www.congress.gov/bill/118th-congress/hr/{n}",
+            "congress": "118",
+            "bill_type": "hr",
+            "bill_number": str(n),
+            "extra_data": {
+                "congress": "118",
+                "bill_type": "hr",
+                "bill_number": str(n),
+                "sponsors": [{"name": "Rep. Example", "party": "D", "state": "CA"}] * 3,
+                "latest_action": {"actionDate": "2023-02-01", "text": "Referred to the Committee on Ways and Means."},
+                "subjects": ["Taxation", "Health", "Economics and Public Finance"],
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        scraper = BenchScraper()
+        scraper._db = Session()
+        scraper.upsert_legislation(make_rows(args.rows))
+        scraper._db.close()
+
+        def entities():
+            # Previous behaviour: full ORM rows through jsonable_encoder
+            db = Session()
+            query = filter_legislation(db.query(Legislation), LegislationType.FEDERAL)
+            jsonable_encoder(paginate(query, 1, args.page_size, include_total=False))
+            db.close()
+
+        def projection():
+            db = Session()
+            query = filter_legislation(db.query(*SUMMARY_COLUMNS), LegislationType.FEDERAL)
+            page = LegislationPage.model_validate(
+                paginate(query, 1, args.page_size, include_total=False), from_attributes=True
+            )
+            page.model_dump_json()
+            db.close()
+
+        # timeit pauses the garbage collector while timing
+        for label, fn in (("ORM + jsonable_encoder", entities), ("summary rows + pydantic", projection)):
+            samples = sorted(timeit.repeat(fn, number=1, repeat=args.repeat))
+            best, median = samples[0], samples[len(samples) // 2]
+            print(f"{label:>24}: best {best * 1000:6.2f} ms  median {median * 1000:6.2f} ms "
+                  f"per {args.page_size}-item page")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Ingest time of Open States-style bulk dumps for many states, full and incremental.
+
+Writes one JSON Lines dump per state into a temporary directory and runs
+the state units through the orchestrator into a SQLite file: a first full
+ingest, a re-run with nothing changed, and a re-run after a fraction of
+every state's bills were updated upstream.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_state_ingest --states 10 --bills 20000 --changed 0.01
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import Base, connect_args
+from app.models import Legislation
+from app.scrapers import base
+from app.scrapers.orchestrator import run_all
+from app.scrapers.state_adapters import US_STATES
+
+
+def bill(state, number, updated_at):
+    return {
+        "id": f"ocd-bill/{state}-{number}",
+        "identifier": f"HB {number}",
+        "title": f"Relating to the {state} code, chapter {number % 400}",
+        "session": "2023-2024",
+        "classification": ["bill"],
+        "subject": ["Education", "Taxation"],
+        "abstracts": [{"abstract": "An act relating to public school finance and property tax relief."}],
+        "first_action_date": "2023-01-10",
+        "latest_action_date": "2023-03-01",
+        "latest_action_description": "Referred to Committee on Education",
+        "updated_at": updated_at,
+    }
+
+
+def write_dumps(directory, states, bills, changed=None, rng=None):
+    for state in states:
+        with open(os.path.join(directory, f"{state.lower()}.jsonl"), "w") as f:
+            for number in range(bills):
+                updated_at = "2024-03-01T00:00:00Z"
+                if changed and rng.random() < changed:
+                    updated_at = "2024-03-02T00:00:00Z"
+                f.write(json.dumps(bill(state, number, updated_at)) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=10)
+    parser.add_argument("--bills", type=int, default=20000, help="bills per state")
+    parser.add_argument("--changed", type=float, default=0.01, help="fraction updated before the last run")
+    parser.add_argument("--concurrency", type=int, default=4, help="states ingested at once")
+    args = parser.parse_args()
+
+    states = US_STATES[:args.states]
+    settings = get_settings()
+    settings.SCRAPER_STATES = ",".join(states)
+    settings.SCRAPER_CONCURRENCY = {**settings.SCRAPER_CONCURRENCY, "state": args.concurrency}
+    settings.SCRAPER_BATCH_SIZE = 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.STATE_BULK_DATA_URL = os.path.join(tmp, "dumps")
+        os.mkdir(settings.STATE_BULK_DATA_URL)
+        write_dumps(settings.STATE_BULK_DATA_URL, states, args.bills)
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_engine(url, connect_args=connect_args(url))
+        Base.metadata.create_all(bind=engine)
+        base.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        runs = [("full ingest", run_all(["state"]))]
+        runs.append(("nothing changed", run_all(["state"])))
+        write_dumps(settings.STATE_BULK_DATA_URL, states, args.bills, args.changed, random.Random(7))
+        runs.append((f"{args.changed:.0%} changed", run_all(["state"])))
+        with engine.connect() as connection:
+            stored = connection.execute(select(func.count()).select_from(Legislation.__table__)).scalar()
+        engine.dispose()
+
+    total = args.states * args.bills
+    print(f"\n{args.states} states x {args.bills} bills ({total} rows, {stored} stored), "
+          f"{args.concurrency} states at a time")
+    for label, summary in runs:
+        totals = summary["totals"]
+        print(f"{label:>16}: {summary['wall_seconds']:7.1f}s  {totals['fetched']:7d} read  "
+              f"{totals['inserted']:7d} inserted  {totals['updated']:6d} updated  "
+              f"{totals['fetched'] / summary['wall_seconds']:8.0f} rows/s read  "
+              f"{len(summary['failed'])} failed")
+        for unit in summary["units"]:
+            if unit["error"]:
+                print(f"{'':>18}{unit['unit']['scope']} failed: {unit['error']}")
+
+
+if __name__ == "__main__":
+    main()
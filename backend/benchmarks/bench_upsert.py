@@ -0,0 +1,109 @@
+"""Compare the legacy per-row save path with the batched upsert stage.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_upsert --rows 20000 --batch-size 500
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Legislation, LegislationType, Status
+from app.scrapers.base import BaseScraper
+
+
+class BenchScraper(BaseScraper):
+    def scrape(self):
+        return []
+
+
+def make_rows(count, revision=0):
+    start = datetime(2019, 1, 3)
+    for n in range(count):
+        yield {
+            "id": f"federal_118_hr_{n}",
+            "type": LegislationType.FEDERAL.value,
+            "title": f"Bill {n}" + (f" (rev {revision})" if n % 10 == 0 and revision else ""),
+            "summary": "",
+            "status": Status.ACTIVE.value,
+            "introduced_date": start + timedelta(days=n % 1500),
+            "last_action_date": start + timedelta(days=n % 1500 + 30),
+            "source_url": f"https://www.congress.gov/bill/118th-congress/hr/{n}",
+            "extra_data": {
+                "congress": "118",
+                "bill_type": "hr",
+                "bill_number": str(n),
+                "latest_action": {"text": "Referred to committee"},
+            },
+        }
+
+
+def per_row(db, rows):
+    """The original scraper loop: point SELECT, setattr copy, commit every 10"""
+    processed = 0
+    for data in rows:
+        legislation = Legislation(**data)
+        existing = db.query(Legislation).filter(Legislation.id == legislation.id).first()
+        if existing:
+            for key, value in legislation.__dict__.items():
+                if key != '_sa_instance_state':
+                    setattr(existing, key, value)
+        else:
+            db.add(legislation)
+        processed += 1
+        if processed % 10 == 0:
+            db.commit()
+    db.commit()
+
+
+def batched(db, rows, batch_size):
+    scraper = BenchScraper()
+    scraper._db = db
+    scraper.batch_size = batch_size
+    return scraper.upsert_legislation(rows)
+
+
+def run(label, path, fn, count):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    results = []
+    for phase, revision in (("initial load", 0), ("re-scrape", 1)):
+        db = Session()
+        started = time.perf_counter()
+        fn(db, make_rows(count, revision))
+        elapsed = time.perf_counter() - started
+        db.close()
+        results.append((phase, elapsed))
+        print(f"{label:>10} {phase:>13}: {elapsed:7.2f}s  {count / elapsed:10.0f} rows/sec")
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = run("per-row", os.path.join(tmp, "per_row.db"), per_row, args.rows)
+        bulk = run(
+            "batched",
+            os.path.join(tmp, "batched.db"),
+            lambda db, rows: batched(db, rows, args.batch_size),
+            args.rows,
+        )
+
+    for (phase, old), (_, new) in zip(legacy, bulk):
+        print(f"{phase}: {old / new:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
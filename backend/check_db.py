@@ -1,28 +1,23 @@
+from app.api.queries import legislation_stats
 from app.database import SessionLocal
 from app.models import Legislation, LegislationType
 
 def main():
     db = SessionLocal()
     try:
-        federal_count = db.query(Legislation).filter(
-            Legislation.type == LegislationType.FEDERAL.value
-        ).count()
-        
-        state_count = db.query(Legislation).filter(
-            Legislation.type == LegislationType.STATE.value
-        ).count()
-        
-        exec_count = db.query(Legislation).filter(
-            Legislation.type == LegislationType.EXECUTIVE.value
-        ).count()
-        
+        stats = legislation_stats(db)
+
         print("\nDatabase Contents:")
-        print(f"Federal Bills: {federal_count}")
-        print(f"State Bills: {state_count}")
-        print(f"Executive Orders: {exec_count}")
-        
+        print(f"Federal Bills: {stats['federal_count']}")
+        print(f"State Bills: {stats['state_count']}")
+        print(f"Executive Orders: {stats['executive_count']}")
+
+        print("\nBy Status:")
+        for status, count in stats["by_status"].items():
+            print(f"- {status}: {count}")
+
         for type_ in [LegislationType.FEDERAL.value, LegislationType.STATE.value, LegislationType.EXECUTIVE.value]:
-            items = db.query(Legislation).filter(
+            items = db.query(Legislation.title).filter(
                 Legislation.type == type_
             ).limit(3).all()
             if items:
@@ -0,0 +1,63 @@
+"""Export legislation list rows as NDJSON, CSV, Parquet or Arrow.
+
+    python export_data.py federal --format csv --year 2023 > federal-2023.csv
+    python export_data.py executive --format parquet --output executive.parquet
+
+Rows are read through a server-side cursor and written batch by batch,
+so memory use does not grow with the size of the export. Parquet and
+Arrow need the optional pyarrow package.
+"""
+from app.api.export import EXPORT_BATCH_SIZE, export_statement, iter_batches, write_columnar, write_text
+from app.database import SessionLocal
+from app.models import LegislationType
+from datetime import datetime
+import argparse
+import sys
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("type", choices=["federal", "executive", "state"])
+    parser.add_argument("--format", choices=["ndjson", "csv", "parquet", "arrow"], default="ndjson")
+    parser.add_argument("--output", "-o", help="File to write; NDJSON and CSV default to stdout")
+    parser.add_argument("--status")
+    parser.add_argument("--year", type=int)
+    parser.add_argument("--start-date", type=datetime.fromisoformat)
+    parser.add_argument("--end-date", type=datetime.fromisoformat)
+    parser.add_argument("--congress")
+    parser.add_argument("--president")
+    parser.add_argument("--state")
+    parser.add_argument("--stale-days", type=int, help="only bills with no action in this many days")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    columnar = args.format in ("parquet", "arrow")
+    if columnar and not args.output:
+        parser.error(f"--output is required for {args.format}")
+
+    statement = export_statement(
+        LegislationType(args.type.upper()), status=args.status, year=args.year,
+        start_date=args.start_date, end_date=args.end_date,
+        congress=args.congress, president=args.president, state=args.state,
+        stale_days=args.stale_days
+    )
+
+    db = SessionLocal()
+    try:
+        batches = iter_batches(db, statement, args.batch_size)
+        if columnar:
+            count = write_columnar(batches, args.format, args.output)
+        elif args.output:
+            with open(args.output, "w", newline="", encoding="utf-8") as out:
+                count = write_text(batches, args.format, out)
+        else:
+            count = write_text(batches, args.format, sys.stdout)
+    except RuntimeError as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"Exported {count} {args.type} items", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import your models
-from app.models import Base
+from app.models import Base, SEARCH_TABLE
 from app.config import get_settings
 
 settings = get_settings()
@@ -28,6 +28,12 @@ config.set_main_option('sqlalchemy.url', str(settings.DATABASE_URL))
 # Add your model's MetaData object here for autogenerate support
 target_metadata = Base.metadata
 
+def include_name(name, type_, parent_names):
+    # legislation_search (and its FTS5 shadow tables) is managed by raw DDL
+    if type_ == "table":
+        return not name.startswith(SEARCH_TABLE)
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -36,6 +42,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -52,7 +59,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_name=include_name
         )
 
         with context.begin_transaction():
@@ -0,0 +1,90 @@
+"""promote congress, president, state and bill fields to columns
+
+Revision ID: 0fcde85e67bf
+Revises: 53ac6ccb6d17
+Create Date: 2026-10-18 12:41:18.902356
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0fcde85e67bf'
+down_revision: Union[str, None] = '53ac6ccb6d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROMOTED = ['congress', 'president', 'state', 'bill_type', 'bill_number']
+BATCH_SIZE = 1000
+
+
+def backfill() -> None:
+    """Copy the promoted keys out of extra_data in batches.
+
+    Done in Python rather than with JSON operators so it runs the same
+    on SQLite and PostgreSQL.
+    """
+    legislation = sa.table(
+        'legislation',
+        sa.column('id', sa.String),
+        sa.column('extra_data', sa.JSON),
+        *[sa.column(name, sa.String) for name in PROMOTED]
+    )
+    bind = op.get_bind()
+    update = legislation.update().where(
+        legislation.c.id == sa.bindparam('_id')
+    ).values({name: sa.bindparam(name) for name in PROMOTED})
+
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(legislation.c.id, legislation.c.extra_data)
+            .where(legislation.c.id > last_id)
+            .order_by(legislation.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for row_id, extra_data in rows:
+            extra_data = extra_data or {}
+            values = {
+                name: str(extra_data[name]) if extra_data.get(name) not in (None, '') else None
+                for name in PROMOTED
+            }
+            if values['bill_number'] is None and extra_data.get('bill_id'):
+                values['bill_number'] = str(extra_data['bill_id'])
+            params.append({'_id': row_id, **values})
+        bind.execute(update, params)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('legislation') as batch_op:
+        batch_op.add_column(sa.Column('congress', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('president', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('state', sa.String(length=2), nullable=True))
+        batch_op.add_column(sa.Column('bill_type', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('bill_number', sa.String(), nullable=True))
+
+    backfill()
+
+    op.create_index('ix_legislation_type_congress_introduced', 'legislation', ['type', 'congress', 'introduced_date', 'id'], unique=False)
+    op.create_index('ix_legislation_type_president_introduced', 'legislation', ['type', 'president', 'introduced_date', 'id'], unique=False)
+    op.create_index('ix_legislation_type_state_introduced', 'legislation', ['type', 'state', 'introduced_date', 'id'], unique=False)
+    op.create_index('ix_legislation_bill', 'legislation', ['congress', 'bill_type', 'bill_number'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legislation_bill', table_name='legislation')
+    op.drop_index('ix_legislation_type_state_introduced', table_name='legislation')
+    op.drop_index('ix_legislation_type_president_introduced', table_name='legislation')
+    op.drop_index('ix_legislation_type_congress_introduced', table_name='legislation')
+    with op.batch_alter_table('legislation') as batch_op:
+        batch_op.drop_column('bill_number')
+        batch_op.drop_column('bill_type')
+        batch_op.drop_column('state')
+        batch_op.drop_column('president')
+        batch_op.drop_column('congress')
@@ -0,0 +1,93 @@
+"""move full text into compressed legislation_documents
+
+Revision ID: 16689b434b59
+Revises: 0fcde85e67bf
+Create Date: 2026-10-18 14:05:31.550827
+
+"""
+from typing import Sequence, Union
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '16689b434b59'
+down_revision: Union[str, None] = '0fcde85e67bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+legislation = sa.table(
+    'legislation',
+    sa.column('id', sa.String),
+    sa.column('extra_data', sa.JSON),
+)
+documents = sa.table(
+    'legislation_documents',
+    sa.column('legislation_id', sa.String),
+    sa.column('body', sa.LargeBinary),
+    sa.column('raw_size', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    op.create_table('legislation_documents',
+    sa.Column('legislation_id', sa.String(), nullable=False),
+    sa.Column('content_type', sa.String(), server_default='text/html', nullable=False),
+    sa.Column('body', sa.LargeBinary(), nullable=False),
+    sa.Column('raw_size', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['legislation_id'], ['legislation.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('legislation_id')
+    )
+
+    # Move extra_data["full_text"] into the new table, keyset-batched by id
+    bind = op.get_bind()
+    strip = legislation.update().where(
+        legislation.c.id == sa.bindparam('_id')
+    ).values(extra_data=sa.bindparam('extra_data'))
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(legislation.c.id, legislation.c.extra_data)
+            .where(legislation.c.id > last_id)
+            .order_by(legislation.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        moved, stripped = [], []
+        for row_id, extra_data in rows:
+            if not extra_data or 'full_text' not in extra_data:
+                continue
+            extra_data = dict(extra_data)
+            text = extra_data.pop('full_text') or ''
+            if text:
+                raw = text.encode('utf-8')
+                moved.append({'legislation_id': row_id, 'body': zlib.compress(raw, 6), 'raw_size': len(raw)})
+            stripped.append({'_id': row_id, 'extra_data': extra_data})
+        if moved:
+            bind.execute(documents.insert(), moved)
+        if stripped:
+            bind.execute(strip, stripped)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(documents.c.legislation_id, documents.c.body, legislation.c.extra_data)
+        .join(legislation, legislation.c.id == documents.c.legislation_id)
+    ).all()
+    restore = legislation.update().where(
+        legislation.c.id == sa.bindparam('_id')
+    ).values(extra_data=sa.bindparam('extra_data'))
+    params = [
+        {'_id': row_id, 'extra_data': {**(extra_data or {}), 'full_text': zlib.decompress(body).decode('utf-8')}}
+        for row_id, body, extra_data in rows
+    ]
+    if params:
+        bind.execute(restore, params)
+    op.drop_table('legislation_documents')
@@ -0,0 +1,65 @@
+"""dashboard rollups
+
+Revision ID: 3f6b8d2c1a94
+Revises: e2a94c07d1f3
+Create Date: 2026-10-18 22:14:51.337208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f6b8d2c1a94'
+down_revision: Union[str, None] = 'e2a94c07d1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DIMENSIONS = ['type', 'status', 'year', 'congress', 'president', 'state']
+
+legislation = sa.table(
+    'legislation',
+    sa.column('type', sa.String),
+    sa.column('status', sa.String),
+    sa.column('introduced_date', sa.DateTime),
+    sa.column('congress', sa.String),
+    sa.column('president', sa.String),
+    sa.column('state', sa.String),
+)
+rollups = sa.table(
+    'legislation_rollups',
+    *[sa.column(name) for name in DIMENSIONS],
+    sa.column('count', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    op.create_table('legislation_rollups',
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('congress', sa.String(), nullable=False),
+    sa.Column('president', sa.String(), nullable=False),
+    sa.Column('state', sa.String(length=2), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('type', 'status', 'year', 'congress', 'president', 'state')
+    )
+    # Backfill with one INSERT ... SELECT; from here on the scrapers
+    # maintain it incrementally. Missing dimensions count under 0 or ''.
+    dimensions = [
+        legislation.c.type,
+        legislation.c.status,
+        sa.func.coalesce(sa.cast(sa.extract('year', legislation.c.introduced_date), sa.Integer), 0),
+        sa.func.coalesce(legislation.c.congress, ''),
+        sa.func.coalesce(legislation.c.president, ''),
+        sa.func.coalesce(legislation.c.state, ''),
+    ]
+    op.execute(rollups.insert().from_select(
+        [*DIMENSIONS, 'count'],
+        sa.select(*dimensions, sa.func.count()).group_by(*dimensions)
+    ))
+
+
+def downgrade() -> None:
+    op.drop_table('legislation_rollups')
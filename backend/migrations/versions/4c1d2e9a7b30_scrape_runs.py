@@ -0,0 +1,43 @@
+"""scrape run summaries
+
+Revision ID: 4c1d2e9a7b30
+Revises: 98c757c7351b
+Create Date: 2026-10-18 18:04:51.302117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '4c1d2e9a7b30'
+down_revision: Union[str, None] = '98c757c7351b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scrape_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('full', sa.Boolean(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=False),
+    sa.Column('duration_seconds', sa.Float(), nullable=False),
+    sa.Column('pages', sa.Integer(), nullable=False),
+    sa.Column('fetched', sa.Integer(), nullable=False),
+    sa.Column('inserted', sa.Integer(), nullable=False),
+    sa.Column('updated', sa.Integer(), nullable=False),
+    sa.Column('unchanged', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scrape_runs_source_started_at', 'scrape_runs', ['source', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scrape_runs_source_started_at', table_name='scrape_runs')
+    op.drop_table('scrape_runs')
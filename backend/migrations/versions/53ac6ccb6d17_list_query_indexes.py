@@ -0,0 +1,28 @@
+"""indexes for list query shapes
+
+Revision ID: 53ac6ccb6d17
+Revises: d58abdb012b1
+Create Date: 2026-10-18 11:20:07.634519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '53ac6ccb6d17'
+down_revision: Union[str, None] = 'd58abdb012b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_legislation_type_introduced', 'legislation', ['type', 'introduced_date', 'id'], unique=False)
+    op.create_index('ix_legislation_type_status_introduced', 'legislation', ['type', 'status', 'introduced_date', 'id'], unique=False)
+    op.create_index('ix_legislative_actions_legislation_date', 'legislative_actions', ['legislation_id', 'action_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legislative_actions_legislation_date', table_name='legislative_actions')
+    op.drop_index('ix_legislation_type_status_introduced', table_name='legislation')
+    op.drop_index('ix_legislation_type_introduced', table_name='legislation')
@@ -0,0 +1,104 @@
+"""full-text search index
+
+Revision ID: 98c757c7351b
+Revises: 16689b434b59
+Create Date: 2026-10-18 16:22:08.904117
+
+"""
+from typing import Sequence, Union
+import html
+import re
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '98c757c7351b'
+down_revision: Union[str, None] = '16689b434b59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+# The index as this revision creates it, frozen from app.models.search
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS legislation_search USING fts5("
+    "id UNINDEXED, title, summary, body, tokenize='porter unicode61')",
+]
+POSTGRESQL_DDL = [
+    "CREATE TABLE IF NOT EXISTS legislation_search ("
+    "id VARCHAR PRIMARY KEY REFERENCES legislation (id) ON DELETE CASCADE, "
+    "title TEXT, summary TEXT, body TEXT, "
+    "document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(body, '')), 'C')"
+    ") STORED)",
+    "CREATE INDEX IF NOT EXISTS ix_legislation_search_document ON legislation_search USING GIN (document)",
+]
+DROP_DDL = "DROP TABLE IF EXISTS legislation_search"
+
+_TAG = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+
+search_table = sa.table(
+    'legislation_search',
+    sa.column('id', sa.String),
+    sa.column('title', sa.String),
+    sa.column('summary', sa.String),
+    sa.column('body', sa.String),
+)
+
+legislation = sa.table(
+    'legislation',
+    sa.column('id', sa.String),
+    sa.column('title', sa.String),
+    sa.column('summary', sa.String),
+)
+documents = sa.table(
+    'legislation_documents',
+    sa.column('legislation_id', sa.String),
+    sa.column('body', sa.LargeBinary),
+)
+
+
+def search_text(body):
+    """Plain text of an HTML document body, for indexing"""
+    if not body:
+        return None
+    return _SPACE.sub(" ", html.unescape(_TAG.sub(" ", body))).strip()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    statements = POSTGRESQL_DDL if bind.dialect.name == 'postgresql' else SQLITE_DDL
+    for statement in statements:
+        op.execute(statement)
+
+    # Index existing rows, keyset-batched by id
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(legislation.c.id, legislation.c.title, legislation.c.summary, documents.c.body)
+            .outerjoin(documents, documents.c.legislation_id == legislation.c.id)
+            .where(legislation.c.id > last_id)
+            .order_by(legislation.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(search_table.insert(), [
+            {
+                'id': row_id,
+                'title': title,
+                'summary': search_text(summary),
+                'body': search_text(zlib.decompress(body).decode('utf-8')) if body else None,
+            }
+            for row_id, title, summary, body in rows
+        ])
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.execute(DROP_DDL)
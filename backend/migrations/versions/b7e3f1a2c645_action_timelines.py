@@ -0,0 +1,33 @@
+"""action timelines
+
+Revision ID: b7e3f1a2c645
+Revises: 4c1d2e9a7b30
+Create Date: 2026-10-18 19:37:12.845310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b7e3f1a2c645'
+down_revision: Union[str, None] = '4c1d2e9a7b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # id joins the index as the keyset tie-breaker of /legislation/{id}/actions
+    op.drop_index('ix_legislative_actions_legislation_date', table_name='legislative_actions')
+    # SQLite cannot ADD COLUMN with a CURRENT_TIMESTAMP default; batch mode rebuilds the table
+    with op.batch_alter_table('legislative_actions') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True))
+    op.create_index('ix_legislative_actions_legislation_date', 'legislative_actions', ['legislation_id', 'action_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legislative_actions_legislation_date', table_name='legislative_actions')
+    op.create_index('ix_legislative_actions_legislation_date', 'legislative_actions', ['legislation_id', 'action_date'], unique=False)
+    with op.batch_alter_table('legislative_actions') as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,28 @@
+"""legislation content hash
+
+Revision ID: d58abdb012b1
+Revises: f8a0ad500146
+Create Date: 2026-10-18 10:03:55.472091
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd58abdb012b1'
+down_revision: Union[str, None] = 'f8a0ad500146'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows keep a NULL hash and are rewritten once on their next scrape
+    with op.batch_alter_table('legislation') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('legislation') as batch_op:
+        batch_op.drop_column('content_hash')
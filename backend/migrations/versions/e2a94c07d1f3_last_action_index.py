@@ -0,0 +1,24 @@
+"""stale bill index
+
+Revision ID: e2a94c07d1f3
+Revises: b7e3f1a2c645
+Create Date: 2026-10-18 21:02:44.193086
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e2a94c07d1f3'
+down_revision: Union[str, None] = 'b7e3f1a2c645'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_legislation_type_last_action', 'legislation', ['type', 'last_action_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legislation_type_last_action', table_name='legislation')
@@ -0,0 +1,32 @@
+"""scrape state watermarks
+
+Revision ID: f8a0ad500146
+Revises: 855df3f183f2
+Create Date: 2026-10-18 09:12:40.118214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'f8a0ad500146'
+down_revision: Union[str, None] = '855df3f183f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scrape_state',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('scope', sa.String(), nullable=False),
+    sa.Column('last_synced_at', sa.DateTime(), nullable=False),
+    sa.Column('last_full_sync_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('source', 'scope')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scrape_state')
@@ -1,50 +1,55 @@
+from app.config import get_settings
 from app.scrapers.congress import CongressScraper
 from app.scrapers.federal_register import FederalRegisterScraper
-from app.scrapers.state import StateLegislatureScraper
-from app.scrapers.base import APIKeyMissingError
-import sys
+from app.scrapers.orchestrator import RUNNERS, format_report, run_all
+import argparse
 
 def main():
-    clear_existing = "--clear" in sys.argv
+    parser = argparse.ArgumentParser(description="Scrape every source, fanning units out in parallel")
+    parser.add_argument("--clear", action="store_true", help="delete all stored legislation first")
+    parser.add_argument("--full", action="store_true", help="ignore sync watermarks")
+    parser.add_argument("--source", action="append", choices=sorted(RUNNERS),
+                        help="only scrape this source (repeatable)")
+    parser.add_argument("--states", metavar="CODES",
+                        help="comma-separated states to scrape, or ALL (default: SCRAPER_STATES)")
+    parser.add_argument("--serial", action="store_true",
+                        help="run one unit at a time, for comparison")
+    parser.add_argument("--cache", metavar="DIR",
+                        help="cache upstream responses in DIR (default: SCRAPER_CACHE_DIR)")
+    parser.add_argument("--offline", action="store_true",
+                        help="replay every request from the response cache, never the network")
+    parser.add_argument("--bulk", metavar="PATH",
+                        help="load Congress BILLSTATUS XML from a directory or zip instead of scraping")
+    parser.add_argument("--workers", type=int,
+                        help="processes parsing --bulk files (default: one per CPU)")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if args.states:
+        settings.SCRAPER_STATES = args.states
+    if args.cache:
+        settings.SCRAPER_CACHE_DIR = args.cache
+    if args.offline:
+        if not settings.SCRAPER_CACHE_DIR:
+            parser.error("--offline needs --cache or SCRAPER_CACHE_DIR")
+        settings.SCRAPER_OFFLINE = True
+    # A cleared database has nothing to be incremental against
+    full_sync = args.full or args.clear
 
     try:
-        if clear_existing:
+        if args.clear:
             print("Clearing existing data...")
-            with CongressScraper() as scraper:
-                scraper.clear_existing_data()
             with FederalRegisterScraper() as scraper:
                 scraper.clear_existing_data()
 
-        # Scrape federal legislation
-        print("Scraping federal legislation...")
-        try:
+        if args.bulk:
             with CongressScraper() as scraper:
-                federal_data = scraper.scrape()
-                print(f"Found {len(federal_data)} federal items")
-        except APIKeyMissingError as e:
-            print(f"Skipping federal legislation: {e}")
-        except Exception as e:
-            print(f"Error scraping federal legislation: {e}")
-
-        # Scrape executive orders
-        print("\nScraping executive orders...")
-        try:
-            with FederalRegisterScraper() as scraper:
-                executive_data = scraper.scrape()
-                print(f"Found {len(executive_data)} executive orders")
-        except Exception as e:
-            print(f"Error scraping executive orders: {e}")
+                scraper.ingest_bulk(args.bulk, workers=args.workers)
+            return
 
-        # Scrape state legislation
-        print("\nScraping state legislation...")
-        try:
-            with StateLegislatureScraper('NY') as scraper:
-                state_data = scraper.scrape()
-                print(f"Found {len(state_data)} state items")
-        except APIKeyMissingError as e:
-            print(f"Skipping state legislation: {e}")
-        except Exception as e:
-            print(f"Error scraping state legislation: {e}")
+        summary = run_all(args.source, full=full_sync, serial=args.serial)
+        print()
+        print(format_report(summary))
 
     except Exception as e:
         print(f"Unexpected error: {e}")
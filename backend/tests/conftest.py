@@ -0,0 +1,173 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api.queries import _count_cache
+from app.cache import get_cache, get_response_cache
+from app.config import get_settings
+from app.database import Base, get_async_db
+from app.main import app
+from app.scrapers.base import BaseScraper
+from app.scrapers.congress import CongressScraper
+from app.scrapers.throttle import get_bucket_store
+
+
+class StubScraper(BaseScraper):
+    """Scraper with no upstream source, used to drive the persistence stage"""
+
+    def scrape(self):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    # Caches and rate limit buckets are process-wide; start every test from fresh ones
+    get_cache.cache_clear()
+    get_response_cache.cache_clear()
+    get_bucket_store.cache_clear()
+    _count_cache.clear()
+    yield
+    get_cache.cache_clear()
+    get_response_cache.cache_clear()
+    get_bucket_store.cache_clear()
+    _count_cache.clear()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def scraper(db):
+    with StubScraper() as scraper:
+        scraper._db = db
+        yield scraper
+
+
+@pytest.fixture
+def async_engine(engine):
+    # The API reads through an async engine on the same file. NullPool
+    # leaves no aiosqlite connections behind once the client exits.
+    return create_async_engine(
+        engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool
+    )
+
+
+@pytest.fixture
+def client(async_engine):
+    session_factory = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+TOTAL_BILLS = 7
+
+
+def stub_bill(number):
+    return {
+        "type": "HR",
+        "number": str(number),
+        "title": f"Bill {number}",
+        "introducedDate": "2023-01-09",
+        "latestAction": {"actionDate": "2023-01-10", "text": "Referred to committee"},
+    }
+
+
+class StubCongressHandler(BaseHTTPRequestHandler):
+    """Serves canned /bill/{congress} pages with Congress.gov pagination"""
+
+    # Keep-alive, like the real API, so connection reuse can be observed
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+    queries_seen = []
+    include_count = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        offset = int(query["offset"][0])
+        limit = int(query["limit"][0])
+        self.requests_seen.append((url.path, offset))
+        self.queries_seen.append(query)
+
+        pagination = {}
+        if self.include_count:
+            pagination["count"] = TOTAL_BILLS
+        if offset + limit < TOTAL_BILLS:
+            pagination["next"] = (
+                f"http://stub{url.path}?offset={offset + limit}&limit={limit}&format=json"
+            )
+        body = json.dumps({
+            "bills": [stub_bill(n) for n in range(offset, min(offset + limit, TOTAL_BILLS))],
+            "pagination": pagination,
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubCongressHandler.requests_seen = []
+    StubCongressHandler.queries_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCongressHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v3"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def congress_scraper(monkeypatch, stub_server, db):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "CONGRESS_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "CONGRESS_API_BASE_URL", stub_server)
+    monkeypatch.setattr(settings, "CONGRESS_PAGE_SIZE", 2)
+    monkeypatch.setattr(settings, "CONGRESS_MAX_CONCURRENCY", 2)
+    with CongressScraper() as scraper:
+        scraper._db = db
+        scraper.congresses = ["118"]
+        yield scraper
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Legislation, LegislationType, LegislativeAction, Status
+
+
+def bill(actions=None, **fields):
+    row = {
+        "id": "federal_118_hr_1",
+        "type": LegislationType.FEDERAL,
+        "title": "Bill 1",
+        "status": Status.ACTIVE,
+        "introduced_date": datetime(2023, 1, 9),
+        "congress": "118",
+        **fields,
+    }
+    if actions is not None:
+        row["actions"] = actions
+    return row
+
+
+def action(day, description, action_type="IntroReferral", source="House floor actions"):
+    return {
+        "action_date": datetime(2023, 1, 9) + timedelta(days=day),
+        "action_type": action_type,
+        "description": description,
+        "source": source,
+        "extra_data": {"source_system": source},
+    }
+
+
+def timeline(db, legislation_id="federal_118_hr_1"):
+    return [
+        action.description for action in db.query(LegislativeAction).filter(
+            LegislativeAction.legislation_id == legislation_id
+        ).order_by(LegislativeAction.action_date, LegislativeAction.id)
+    ]
+
+
+def test_timelines_are_upserted_by_natural_key(scraper, db):
+    actions = [action(0, "Introduced in House"), action(0, "Introduced in House"), action(2, "Referred")]
+    assert scraper.upsert_legislation([bill(actions)])["inserted"] == 1
+    assert timeline(db) == ["Introduced in House", "Referred"]
+    ids = {row.id for row in db.query(LegislativeAction)}
+
+    # Same timeline: nothing is rewritten, and ids are stable
+    assert scraper.upsert_legislation([bill(actions)])["unchanged"] == 1
+    assert {row.id for row in db.query(LegislativeAction)} == ids
+
+    # A reworded action replaces the old one; the rest keep their rows
+    actions[2] = action(2, "Referred to the Committee on Ways and Means")
+    actions.append(action(5, "Reported"))
+    assert scraper.upsert_legislation([bill(actions)])["updated"] == 1
+    assert timeline(db) == ["Introduced in House", "Referred to the Committee on Ways and Means", "Reported"]
+    assert len(ids & {row.id for row in db.query(LegislativeAction)}) == 1
+
+
+def test_rows_without_a_timeline_keep_the_stored_one(scraper, db):
+    scraper.upsert_legislation([bill([action(0, "Introduced in House")])])
+
+    assert scraper.upsert_legislation([bill(title="Bill 1 (retitled)")])["updated"] == 1
+    assert timeline(db) == ["Introduced in House"]
+
+    # An explicitly empty timeline does clear it; undated actions are never stored
+    scraper.upsert_legislation([bill([{"action_date": None, "action_type": "action", "description": "?"}])])
+    assert timeline(db) == []
+
+
+def test_update_status_records_a_dated_action(scraper, db):
+    scraper.upsert_legislation([bill()])
+    item = db.get(Legislation, "federal_118_hr_1")
+
+    item.update_status(Status.PASSED)
+    db.commit()
+
+    [recorded] = db.query(LegislativeAction).all()
+    assert recorded.id.startswith("federal_118_hr_1:")
+    assert recorded.action_type == "status_change"
+    assert item.last_action_date == recorded.action_date
+
+
+@pytest.fixture
+def long_timeline(scraper):
+    # Three actions a day exercise the id tie-breaker within a date
+    actions = [action(n // 3, f"Step {n}", source=f"system {n % 3}") for n in range(23)]
+    scraper.upsert_legislation([bill(actions), bill(id="federal_118_hr_2", actions=[])])
+    return actions
+
+
+def test_actions_endpoint_walks_the_timeline(client, db, long_timeline):
+    expected = timeline(db)
+    seen = []
+    response = client.get("/api/v1/legislation/federal_118_hr_1/actions", params={"limit": 5}).json()
+    while True:
+        assert len(response["data"]) <= 5
+        seen += [item["description"] for item in response["data"]]
+        if not response["next_cursor"]:
+            break
+        response = client.get(
+            "/api/v1/legislation/federal_118_hr_1/actions",
+            params={"limit": 5, "cursor": response["next_cursor"]}
+        ).json()
+
+    assert seen == expected and len(seen) == 23
+    dates = [item["action_date"] for item in client.get(
+        "/api/v1/legislation/federal_118_hr_1/actions", params={"limit": 500}
+    ).json()["data"]]
+    assert dates == sorted(dates)
+
+
+def test_actions_endpoint_errors(client, long_timeline):
+    assert client.get("/api/v1/legislation/federal_118_hr_2/actions").json()["data"] == []
+    assert client.get("/api/v1/legislation/federal_118_hr_404/actions").status_code == 404
+    assert client.get(
+        "/api/v1/legislation/federal_118_hr_1/actions", params={"cursor": "not-a-cursor"}
+    ).status_code == 400
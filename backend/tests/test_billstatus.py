@@ -0,0 +1,239 @@
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from app.config import get_settings
+from app.models import Legislation, LegislativeAction, ScrapeRun, ScrapeState
+from app.scrapers.billstatus import iter_sources, parse_source
+from app.scrapers.congress import CongressScraper
+
+
+def billstatus(number, update_date="2024-02-01T12:00:00Z", congress="118"):
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<billStatus>
+  <version>3.0.0</version>
+  <bill>
+    <number>{number}</number>
+    <updateDate>{update_date}</updateDate>
+    <type>HR</type>
+    <introducedDate>2023-01-09</introducedDate>
+    <congress>{congress}</congress>
+    <committees>
+      <item>
+        <systemCode>hswm00</systemCode>
+        <name>Ways and Means Committee</name>
+        <chamber>House</chamber>
+        <type>Standing</type>
+      </item>
+    </committees>
+    <actions>
+      <item>
+        <actionDate>2023-01-09</actionDate>
+        <text>Introduced in House</text>
+        <type>IntroReferral</type>
+        <actionCode>Intro-H</actionCode>
+        <sourceSystem><code>9</code><name>Library of Congress</name></sourceSystem>
+      </item>
+      <item>
+        <actionDate>2023-01-09</actionDate>
+        <text>Referred to the House Committee on Ways and Means.</text>
+        <type>IntroReferral</type>
+        <actionCode>H11100</actionCode>
+        <sourceSystem><code>2</code><name>House floor actions</name></sourceSystem>
+        <committees><item><systemCode>hswm00</systemCode><name>Ways and Means Committee</name></item></committees>
+      </item>
+    </actions>
+    <sponsors>
+      <item>
+        <bioguideId>S000001</bioguideId>
+        <fullName>Rep. Smith, Jane [R-TX-1]</fullName>
+        <firstName>Jane</firstName>
+        <lastName>Smith</lastName>
+        <party>R</party>
+        <state>TX</state>
+        <district>1</district>
+      </item>
+    </sponsors>
+    <subjects>
+      <legislativeSubjects>
+        <item><name>Income tax credits</name></item>
+        <item><name>Small business</name></item>
+      </legislativeSubjects>
+      <policyArea><name>Taxation</name></policyArea>
+    </subjects>
+    <summaries>
+      <summary>
+        <versionCode>00</versionCode>
+        <actionDate>2023-01-09</actionDate>
+        <updateDate>2023-02-01T10:00:00Z</updateDate>
+        <text><![CDATA[<p><strong>Small Business Tax Relief Act</strong></p><p>This bill expands a credit.</p>]]></text>
+      </summary>
+    </summaries>
+    <title>Small Business Tax Relief Act {number}</title>
+    <latestAction>
+      <actionDate>2023-01-09</actionDate>
+      <text>Referred to the House Committee on Ways and Means.</text>
+    </latestAction>
+  </bill>
+</billStatus>
+"""
+
+
+# The pre-2022 layout: billType/billNumber, billSubjects and billSummaries
+LEGACY_BILLSTATUS = """<?xml version="1.0" encoding="utf-8"?>
+<billStatus>
+  <bill>
+    <billType>S</billType>
+    <billNumber>12</billNumber>
+    <congress>116</congress>
+    <updateDate>2021-01-05T08:00:00Z</updateDate>
+    <introducedDate>2019-01-03</introducedDate>
+    <title>A bill to amend title 5</title>
+    <actions>
+      <item>
+        <actionDate>2019-12-20</actionDate>
+        <text>Became Public Law No: 116-94.</text>
+        <type>BecameLaw</type>
+      </item>
+    </actions>
+    <subjects>
+      <billSubjects>
+        <legislativeSubjects><item><name>Federal employees</name></item></legislativeSubjects>
+        <policyArea><name>Government Operations and Politics</name></policyArea>
+      </billSubjects>
+    </subjects>
+    <summaries>
+      <billSummaries>
+        <item>
+          <updateDate>2019-02-01T00:00:00Z</updateDate>
+          <text>&lt;p&gt;Amends title 5.&lt;/p&gt;</text>
+        </item>
+      </billSummaries>
+    </summaries>
+  </bill>
+</billStatus>
+"""
+
+
+@pytest.fixture
+def scraper(db, monkeypatch):
+    monkeypatch.setattr(get_settings(), "CONGRESS_API_KEY", None)
+    with CongressScraper() as scraper:
+        scraper._db = db
+        yield scraper
+
+
+def write_bills(directory, numbers, **kwargs):
+    directory.mkdir(parents=True, exist_ok=True)
+    for number in numbers:
+        (directory / f"BILLSTATUS-118hr{number}.xml").write_text(billstatus(number, **kwargs))
+
+
+def test_bill_record_is_parsed(tmp_path):
+    write_bills(tmp_path, [1])
+
+    [(items, error)] = [parse_source(source) for source in iter_sources(str(tmp_path))]
+
+    assert error is None
+    [item] = items
+    assert (item["congress"], item["type"], item["number"]) == ("118", "HR", "1")
+    assert item["summary"] == "Small Business Tax Relief Act This bill expands a credit."
+    assert item["sponsors"][0]["bioguideId"] == "S000001"
+    assert item["committees"][0]["systemCode"] == "hswm00"
+    assert item["subjects"] == ["Income tax credits", "Small business"]
+    assert item["policyArea"] == "Taxation"
+    assert [action["actionCode"] for action in item["actions"]] == ["Intro-H", "H11100"]
+    assert item["actions"][1]["committees"] == ["hswm00"]
+
+
+def test_legacy_layout_is_parsed(tmp_path):
+    (tmp_path / "BILLSTATUS-116s12.xml").write_text(LEGACY_BILLSTATUS)
+
+    [item], error = parse_source((str(tmp_path / "BILLSTATUS-116s12.xml"), None))
+
+    assert (item["type"], item["number"], item["summary"]) == ("S", "12", "Amends title 5.")
+    assert item["subjects"] == ["Federal employees"]
+    assert item["policyArea"] == "Government Operations and Politics"
+    # No latestAction element: the newest action stands in
+    assert item["latestAction"]["text"] == "Became Public Law No: 116-94."
+
+
+def test_directory_is_ingested_without_an_api_key(tmp_path, scraper, db):
+    write_bills(tmp_path / "118" / "hr", range(5))
+    (tmp_path / "116").mkdir()
+    (tmp_path / "116" / "BILLSTATUS-116s12.xml").write_text(LEGACY_BILLSTATUS)
+
+    counts = scraper.ingest_bulk(str(tmp_path), workers=0)
+
+    assert (counts["pages"], counts["fetched"], counts["inserted"], counts["failed"]) == (6, 6, 6, 0)
+    bill = db.get(Legislation, "federal_118_hr_3")
+    assert bill.title == "Small Business Tax Relief Act 3"
+    assert bill.introduced_date == datetime(2023, 1, 9)
+    assert bill.extra_data["subjects"] == ["Income tax credits", "Small business"]
+    actions = db.query(LegislativeAction).filter(LegislativeAction.legislation_id == bill.id).all()
+    assert sorted(action.extra_data["action_code"] for action in actions) == ["H11100", "Intro-H"]
+    assert db.get(Legislation, "federal_116_s_12").last_action_date == datetime(2019, 12, 20)
+
+    assert db.get(ScrapeState, ("congress", "118")).last_synced_at == datetime(2024, 2, 1, 12)
+    assert db.get(ScrapeState, ("congress", "116")).last_full_sync_at == datetime(2021, 1, 5, 8)
+    run = db.query(ScrapeRun).one()
+    assert (run.source, run.scope, run.full, run.inserted) == ("congress", "bulk", True, 6)
+
+
+def test_api_scrape_keeps_bulk_only_fields(tmp_path, congress_scraper, db):
+    write_bills(tmp_path, [1])
+    congress_scraper.ingest_bulk(str(tmp_path), workers=0)
+
+    # The bill list API knows nothing of sponsors, subjects or summaries
+    congress_scraper.scrape(full=True)
+
+    bill = db.get(Legislation, "federal_118_hr_1")
+    assert bill.title == "Bill 1"
+    assert bill.summary == "Small Business Tax Relief Act This bill expands a credit."
+    assert bill.extra_data["sponsors"][0]["bioguideId"] == "S000001"
+    assert bill.extra_data["subjects"] == ["Income tax credits", "Small business"]
+    assert bill.extra_data["policy_area"] == "Taxation"
+    assert bill.extra_data["latest_action"]["text"] == "Referred to committee"
+
+
+def test_api_scrape_keeps_bulk_summary_searchable(tmp_path, congress_scraper, client):
+    write_bills(tmp_path, [1])
+    congress_scraper.ingest_bulk(str(tmp_path), workers=0)
+    assert client.get("/api/v1/search", params={"q": "expands"}).json()["total"] == 1
+
+    congress_scraper.scrape(full=True)
+
+    [hit] = client.get("/api/v1/search", params={"q": "expands"}).json()["data"]
+    assert hit["id"] == "federal_118_hr_1"
+
+
+def test_zip_is_ingested_on_a_process_pool(tmp_path, scraper, db):
+    archive = tmp_path / "BILLSTATUS-118-hr.zip"
+    with zipfile.ZipFile(archive, "w") as f:
+        for number in range(150):
+            f.writestr(f"BILLSTATUS-118hr{number}.xml", billstatus(number))
+        f.writestr("BILLSTATUS-118hr999.xml", "<billStatus><bill><number>999")
+
+    counts = scraper.ingest_bulk(str(archive), workers=2)
+
+    assert (counts["pages"], counts["inserted"], counts["failed"]) == (151, 150, 1)
+    assert db.query(Legislation).count() == 150
+
+    # The unreadable file keeps the watermark back, so the next API sync still reads everything
+    assert db.get(ScrapeState, ("congress", "118")) is None
+
+    # Reloading the same snapshot writes nothing; a clean load sets the
+    # watermark and an older one never moves it back
+    write_bills(tmp_path / "clean", [1])
+    write_bills(tmp_path / "older", [1], update_date="2023-06-01T00:00:00Z")
+    assert scraper.ingest_bulk(str(archive), workers=0)["unchanged"] == 150
+    assert scraper.ingest_bulk(str(tmp_path / "clean"), workers=0)["unchanged"] == 1
+    assert scraper.ingest_bulk(str(tmp_path / "older"), workers=0)["updated"] == 0
+    assert db.get(ScrapeState, ("congress", "118")).last_synced_at == datetime(2024, 2, 1, 12)
+
+
+def test_empty_path_fails_the_run(tmp_path, scraper, db):
+    with pytest.raises(FileNotFoundError):
+        scraper.ingest_bulk(str(tmp_path))
+    assert db.query(ScrapeRun).one().error.startswith("No BILLSTATUS XML files")
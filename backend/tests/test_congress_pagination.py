@@ -0,0 +1,110 @@
+import json
+import logging
+
+from app.models import Legislation, ScrapeRun, ScrapeState
+from tests import conftest
+from tests.conftest import TOTAL_BILLS, StubCongressHandler
+
+
+def test_iter_bills_fetches_every_offset(congress_scraper):
+    bills = list(congress_scraper._iter_bills("bill/118"))
+
+    assert sorted(int(item["number"]) for item in bills) == list(range(TOTAL_BILLS))
+    assert sorted(offset for _, offset in StubCongressHandler.requests_seen) == [0, 2, 4, 6]
+
+
+def test_iter_bills_follows_next_links(congress_scraper, monkeypatch):
+    monkeypatch.setattr(StubCongressHandler, "include_count", False)
+
+    bills = list(congress_scraper._iter_bills("bill/118"))
+
+    assert [offset for _, offset in StubCongressHandler.requests_seen] == [0, 2, 4, 6]
+    assert [int(item["number"]) for item in bills] == list(range(TOTAL_BILLS))
+
+
+def test_scrape_persists_all_pages(congress_scraper, db):
+    congress_scraper.scrape()
+
+    assert db.query(Legislation).count() == TOTAL_BILLS
+
+
+def test_incremental_scrape_requests_changes_since_watermark(congress_scraper, db):
+    congress_scraper.scrape()
+    state = db.get(ScrapeState, ("congress", "118"))
+    assert state.last_full_sync_at == state.last_synced_at
+    assert "fromDateTime" not in StubCongressHandler.queries_seen[0]
+    expected = state.last_synced_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    StubCongressHandler.queries_seen.clear()
+    congress_scraper.scrape()
+
+    assert StubCongressHandler.queries_seen[0]["fromDateTime"] == [expected]
+
+
+def test_failed_rows_keep_the_watermark(congress_scraper, db, monkeypatch):
+    normalize = congress_scraper._normalize_bill
+
+    def flaky(item, congress):
+        if item["number"] == "3":
+            raise KeyError("title")
+        return normalize(item, congress)
+
+    monkeypatch.setattr(congress_scraper, "_normalize_bill", flaky)
+    congress_scraper.scrape()
+    assert db.get(ScrapeState, ("congress", "118")) is None
+
+    # The next sync asks for everything again and picks up the failed bill
+    monkeypatch.setattr(congress_scraper, "_normalize_bill", normalize)
+    StubCongressHandler.queries_seen.clear()
+    congress_scraper.scrape()
+
+    assert "fromDateTime" not in StubCongressHandler.queries_seen[0]
+    assert db.query(Legislation).count() == TOTAL_BILLS
+    assert db.get(ScrapeState, ("congress", "118")) is not None
+
+
+def test_scrape_returns_and_records_a_run_summary(congress_scraper, db, monkeypatch):
+    normalize = congress_scraper._normalize_bill
+
+    def flaky(item, congress):
+        if item["number"] == "3":
+            raise KeyError("title")
+        return normalize(item, congress)
+
+    monkeypatch.setattr(congress_scraper, "_normalize_bill", flaky)
+    summary = congress_scraper.scrape(full=True)
+
+    # Small enough for a Celery result, and nothing loaded from the table
+    assert json.loads(json.dumps(summary)) == summary
+    assert {key: summary[key] for key in ("pages", "fetched", "inserted", "updated", "unchanged", "failed")} == {
+        "pages": 4, "fetched": TOTAL_BILLS, "inserted": TOTAL_BILLS - 1, "updated": 0, "unchanged": 0, "failed": 1
+    }
+    assert summary["errors"] == {}
+
+    run = db.query(ScrapeRun).one()
+    assert (run.source, run.scope, run.full, run.error) == ("congress", "118", True, None)
+    assert (run.pages, run.fetched, run.inserted, run.failed) == (4, TOTAL_BILLS, TOTAL_BILLS - 1, 1)
+    assert run.finished_at >= run.started_at
+
+
+def test_failed_scrape_is_recorded_with_its_error(congress_scraper, db, monkeypatch):
+    def broken(rows):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(congress_scraper, "upsert_legislation", broken)
+    summary = congress_scraper.scrape()
+
+    assert summary["errors"] == {"118": "database is locked"}
+    run = db.query(ScrapeRun).one()
+    assert run.error == "database is locked"
+    assert db.get(ScrapeState, ("congress", "118")) is None
+
+
+def test_page_fetcher_fits_the_connection_pool(congress_scraper, caplog, monkeypatch):
+    monkeypatch.setattr(conftest, "TOTAL_BILLS", 41)
+    caplog.set_level(logging.WARNING, logger="urllib3.connectionpool")
+
+    assert len(list(congress_scraper._iter_bills("bill/118"))) == 41
+
+    # A discarded connection means a new socket (and handshake) for the next page
+    assert not [record for record in caplog.records if "pool is full" in record.getMessage()]
@@ -0,0 +1,25 @@
+import pytest
+
+from app.database import async_database_url, pool_options
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./legislation.db", "sqlite+aiosqlite:///./legislation.db"),
+    ("postgresql://user:secret@db:5432/tracker", "postgresql+asyncpg://user:secret@db:5432/tracker"),
+    ("postgresql+psycopg2://user@db/tracker", "postgresql+asyncpg://user@db/tracker"),
+])
+def test_async_database_url(url, expected):
+    assert async_database_url(url) == expected
+
+
+def test_async_database_url_rejects_unknown_backends():
+    with pytest.raises(ValueError):
+        async_database_url("mysql://user@db/tracker")
+
+
+def test_pool_options():
+    assert pool_options("sqlite://") == {}
+    assert pool_options("sqlite:///:memory:") == {}
+    assert pool_options("sqlite+aiosqlite:///./legislation.db")["poolclass"].__name__ == "AsyncAdaptedQueuePool"
+    assert "poolclass" not in pool_options("postgresql+asyncpg://db/tracker")
+    assert pool_options("postgresql://db/tracker")["pool_pre_ping"] is True
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from app.api.export import EXPORT_FIELDS, export_statement, iter_batches, write_columnar, write_text
+from app.models import LegislationType, Status
+
+
+def bill(number, status=Status.ACTIVE, introduced=datetime(2023, 3, 14), title=None):
+    return {
+        "id": f"federal_118_hr_{number}",
+        "type": LegislationType.FEDERAL,
+        "title": title or f"Bill {number}",
+        "status": status,
+        "introduced_date": introduced,
+        "congress": "118",
+        "extra_data": {"sponsor": "Rep. Example"},
+    }
+
+
+@pytest.fixture
+def seeded(scraper):
+    scraper.upsert_legislation([
+        bill(1, introduced=datetime(2023, 1, 9)),
+        bill(2, status=Status.PASSED, introduced=datetime(2023, 5, 2), title='Tariff "Relief", Part 2'),
+        bill(3, introduced=datetime(2022, 7, 1)),
+        bill(4, introduced=None),
+    ])
+    return scraper
+
+
+def test_ndjson_streams_every_row_in_list_order(client, seeded):
+    response = client.get("/api/v1/export", params={"type": "federal"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="federal.ndjson"'
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [
+        "federal_118_hr_2", "federal_118_hr_1", "federal_118_hr_3", "federal_118_hr_4"
+    ]
+    assert list(rows[0]) == EXPORT_FIELDS
+    assert rows[0]["status"] == "PASSED"
+    assert rows[0]["introduced_date"] == "2023-05-02T00:00:00"
+    assert "extra_data" not in rows[0]
+
+
+def test_csv_matches_list_filters(client, seeded):
+    response = client.get("/api/v1/export", params={"type": "federal", "format": "csv", "year": 2023})
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == ["federal_118_hr_2", "federal_118_hr_1"]
+    assert rows[0]["title"] == 'Tariff "Relief", Part 2'
+    assert rows[0]["type"] == "FEDERAL"
+    assert rows[0]["president"] == ""
+
+    filtered = client.get("/api/v1/export", params={"type": "federal", "status": "PASSED"})
+    assert [json.loads(line)["id"] for line in filtered.text.splitlines()] == ["federal_118_hr_2"]
+
+
+def test_export_is_not_response_cached(client, seeded):
+    response = client.get("/api/v1/export", params={"type": "executive"})
+    assert response.status_code == 200
+    assert response.text == ""
+    assert "X-Cache" not in response.headers
+
+
+def test_rejects_unknown_format(client):
+    assert client.get("/api/v1/export", params={"type": "federal", "format": "xml"}).status_code == 422
+
+
+def test_iter_batches_reads_in_partitions(db, seeded):
+    batches = list(iter_batches(db, export_statement(LegislationType.FEDERAL), batch_size=3))
+    assert [len(rows) for rows in batches] == [3, 1]
+
+    out = io.StringIO()
+    assert write_text(iter_batches(db, export_statement(LegislationType.FEDERAL)), "ndjson", out) == 4
+    assert len(out.getvalue().splitlines()) == 4
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_columnar_snapshot(db, seeded, tmp_path, format):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"federal.{format}")
+
+    count = write_columnar(iter_batches(db, export_statement(LegislationType.FEDERAL), batch_size=2), format, path)
+    assert count == 4
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.column_names == EXPORT_FIELDS
+    assert table.column("id").to_pylist()[0] == "federal_118_hr_2"
+    assert table.column("introduced_date").to_pylist()[-1] is None
@@ -0,0 +1,193 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.config import get_settings
+from app.models import Legislation, ScrapeState
+from app.scrapers.http_cache import HTTPCache, OfflineCacheMiss, cache_key
+from app.scrapers.http_client import HTTPClient
+from app.scrapers.throttle import MemoryBucketStore, RateLimiter
+from tests.conftest import TOTAL_BILLS, StubCongressHandler
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a versioned document and answers If-None-Match with 304"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    version = 1
+    seen = []
+
+    def do_GET(self):
+        etag = f'"v{self.version}"'
+        self.seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path, "version": self.version}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Clock:
+    def __init__(self):
+        self.time = 1000.0
+
+    def __call__(self):
+        return self.time
+
+
+@pytest.fixture
+def origin():
+    ETagHandler.version = 1
+    ETagHandler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return HTTPCache(str(tmp_path / "responses"), ttl=60, clock=clock)
+
+
+def test_cache_key_ignores_api_key_and_parameter_order():
+    url = "https://api.congress.gov/v3/bill/118"
+    assert cache_key(url, {"api_key": "one", "offset": 0, "limit": 250}) == \
+        cache_key(url, {"limit": 250, "offset": 0, "api_key": "two"})
+    assert cache_key(url, {"offset": 0}) != cache_key(url, {"offset": 250})
+
+
+def test_fresh_entries_skip_the_network_and_the_rate_limit(origin, cache):
+    client = HTTPClient(cache=cache)
+    limiter = RateLimiter("cached", calls=61, period=60, burst=1, store=MemoryBucketStore())
+
+    first = client.get(f"{origin}/bill/118", params={"api_key": "secret"}, limiter=limiter)
+    second = client.get(f"{origin}/bill/118", params={"api_key": "secret"}, limiter=limiter)
+
+    assert second.json() == first.json()
+    assert second.from_cache
+    assert len(ETagHandler.seen) == 1
+    # Only the network request took the single token
+    assert limiter.store.take(limiter.key, limiter.rate, limiter.burst, limiter.clock.now()) > 0
+
+
+def test_stale_entries_are_revalidated(origin, cache, clock):
+    client = HTTPClient(cache=cache)
+    client.get(f"{origin}/bill/118")
+    clock.time += 120
+
+    unchanged = client.get(f"{origin}/bill/118")
+    assert unchanged.status_code == 200
+    assert unchanged.json()["version"] == 1
+    assert ETagHandler.seen == [None, '"v1"']
+
+    # The 304 made the entry fresh again
+    client.get(f"{origin}/bill/118")
+    assert len(ETagHandler.seen) == 2
+
+    ETagHandler.version = 2
+    clock.time += 120
+    assert client.get(f"{origin}/bill/118").json()["version"] == 2
+
+
+def test_entries_are_compressed_on_disk(origin, cache):
+    HTTPClient(cache=cache).get(f"{origin}/bill/118")
+
+    [path] = [os.path.join(root, name) for root, _, names in os.walk(cache.directory) for name in names]
+    with open(path, "rb") as f:
+        assert f.read(2) == b"\x1f\x8b"
+
+
+def test_streamed_bodies_are_cached_as_they_are_read(origin, cache):
+    key = cache_key(f"{origin}/bill/118")
+    response = HTTPClient(cache=cache).get(f"{origin}/bill/118", stream=True)
+
+    # Nothing is read up front; the entry appears once the body has been
+    assert response._content is False
+    assert cache.get(key) is None
+    body = b"".join(response.iter_content(8))
+    response.close()
+    assert cache.get(key)["body"] == body
+    assert json.loads(body)["version"] == 1
+
+
+def test_streamed_bodies_closed_early_are_not_cached(origin, cache):
+    response = HTTPClient(cache=cache).get(f"{origin}/bill/118", stream=True)
+    next(response.iter_content(8))
+    response.close()
+
+    assert cache.get(cache_key(f"{origin}/bill/118")) is None
+    assert [name for _, _, names in os.walk(cache.directory) for name in names] == []
+    assert cache._size == 0
+
+
+def test_evicts_least_recently_used(origin, tmp_path, clock):
+    cache = HTTPCache(str(tmp_path / "small"), ttl=60, max_bytes=10**6, clock=clock)
+    client = HTTPClient(cache=cache)
+    for n in range(3):
+        client.get(f"{origin}/page/{n}")
+    entry_size = cache._size / 3
+
+    cache.max_bytes = entry_size * 3.5
+    os.utime(cache._path(cache_key(f"{origin}/page/0")), (0, 0))
+    client.get(f"{origin}/page/3")
+
+    assert cache.get(cache_key(f"{origin}/page/0")) is None
+    assert cache.get(cache_key(f"{origin}/page/3")) is not None
+    assert cache._size <= cache.max_bytes
+
+
+def test_offline_replays_only_from_cache(origin, cache, clock):
+    HTTPClient(cache=cache).get(f"{origin}/bill/118")
+    clock.time += 10**6
+    offline = HTTPClient(cache=cache, offline=True)
+
+    assert offline.get(f"{origin}/bill/118").json()["version"] == 1
+    with pytest.raises(OfflineCacheMiss):
+        offline.get(f"{origin}/bill/117")
+    assert len(ETagHandler.seen) == 1
+
+
+def test_offline_scrape_replays_normalization_and_persistence(
+    congress_scraper, db, tmp_path, monkeypatch
+):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "SCRAPER_CACHE_DIR", str(tmp_path / "responses"))
+    congress_scraper._http = None
+    congress_scraper.scrape(full=True)
+    requests_online = len(StubCongressHandler.requests_seen)
+
+    db.query(Legislation).delete()
+    db.query(ScrapeState).delete()
+    db.commit()
+    monkeypatch.setattr(settings, "SCRAPER_OFFLINE", True)
+    congress_scraper._http = None
+    congress_scraper.scrape(full=True)
+
+    assert len(StubCongressHandler.requests_seen) == requests_online
+    assert db.query(Legislation).count() == TOTAL_BILLS
+    # Replays leave sync watermarks alone
+    assert db.query(ScrapeState).count() == 0
@@ -0,0 +1,122 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app.scrapers.http_client import HTTPClient
+from tests.conftest import StubScraper
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 stub recording the client port and headers of every request"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY a
+    # reused connection stalls on delayed ACKs
+    disable_nagle_algorithm = True
+    seen = []
+    # Statuses to answer with before succeeding, per path
+    failures = {}
+    delay = 0.0
+
+    def do_GET(self):
+        self.seen.append((self.client_address[1], self.path, dict(self.headers)))
+        time.sleep(self.delay)
+        pending = self.failures.get(self.path)
+        status = pending.pop(0) if pending else 200
+
+        body = json.dumps({"path": self.path, "padding": "x" * 2000}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    KeepAliveHandler.seen = []
+    KeepAliveHandler.failures = {}
+    KeepAliveHandler.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield server.server_port
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reuses_one_connection_per_host(server):
+    client = HTTPClient(backoff_factor=0)
+    for n in range(5):
+        assert client.get(f"http://127.0.0.1:{server}/page/{n}").json()["path"] == f"/page/{n}"
+    client.get(f"http://localhost:{server}/other")
+    client.close()
+
+    ports = [port for port, _, _ in KeepAliveHandler.seen]
+    assert len(set(ports[:5])) == 1
+    assert ports[5] != ports[0]
+
+
+def test_bare_requests_reconnect_every_time(server):
+    for n in range(3):
+        requests.get(f"http://127.0.0.1:{server}/page/{n}")
+
+    assert len({port for port, _, _ in KeepAliveHandler.seen}) == 3
+
+
+def test_negotiates_compression(server):
+    client = HTTPClient()
+    response = client.get(f"http://127.0.0.1:{server}/compressed")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json()["path"] == "/compressed"
+    headers = KeepAliveHandler.seen[0][2]
+    assert "gzip" in headers["Accept-Encoding"]
+    assert headers["User-Agent"].startswith("legislation-tracker/")
+
+
+def test_retries_transient_server_errors(server):
+    KeepAliveHandler.failures = {"/flaky": [502, 500]}
+    client = HTTPClient(backoff_factor=0)
+
+    assert client.get(f"http://127.0.0.1:{server}/flaky").status_code == 200
+    assert len(KeepAliveHandler.seen) == 3
+
+
+def test_leaves_throttling_to_the_rate_limiter(server):
+    KeepAliveHandler.failures = {"/busy": [429]}
+    client = HTTPClient(backoff_factor=0)
+
+    assert client.get(f"http://127.0.0.1:{server}/busy").status_code == 429
+    assert len(KeepAliveHandler.seen) == 1
+
+
+def test_read_timeout(server):
+    KeepAliveHandler.delay = 0.5
+    client = HTTPClient(timeout=(1.0, 0.1), retries=0)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get(f"http://127.0.0.1:{server}/slow")
+
+
+def test_scraper_closes_sessions_on_exit(server):
+    with StubScraper() as scraper:
+        scraper.http.get(f"http://127.0.0.1:{server}/page")
+        client = scraper.http
+        assert client._sessions
+
+    assert not client._sessions
+    assert scraper._http is None
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from app.scrapers.json_stream import StreamedPage
+
+PAGE = {
+    "count": 3,
+    "results": [
+        {"document_number": "2021-01753", "title": "Tackling the Climate Crisis", "body_html": "<p>" + "é" * 500 + "</p>"},
+        {"document_number": "2021-01765", "title": "Restoring Trust", "page_views": 1234567},
+        {"document_number": "2021-01766", "tags": [], "signed": True, "notes": None},
+    ],
+    "pagination": {"count": 1234, "next": "https://api.congress.gov/v3/bill/118?offset=250"},
+}
+
+
+def chunks(document, size):
+    encoded = json.dumps(document, indent=1, ensure_ascii=False).encode("utf-8")
+    return [encoded[start:start + size] for start in range(0, len(encoded), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 100000])
+def test_items_and_metadata_at_any_chunk_boundary(size):
+    # Chunk edges split strings, numbers, literals and multi-byte characters
+    page = StreamedPage(chunks(PAGE, size), "results")
+
+    assert list(page) == PAGE["results"]
+    assert page.count == 3
+    assert page.meta == {"count": 3, "pagination": PAGE["pagination"]}
+
+
+def test_items_are_yielded_before_the_body_ends():
+    read = []
+
+    def body():
+        for chunk in chunks(PAGE, 16):
+            read.append(chunk)
+            yield chunk
+
+    page = iter(StreamedPage(body(), "results"))
+    first = next(page)
+
+    assert first["document_number"] == "2021-01753"
+    assert sum(map(len, read)) < sum(map(len, chunks(PAGE, 16)))
+
+
+def test_missing_or_empty_array():
+    empty = StreamedPage([b'{"results": [], "count": 0}'], "results")
+    assert list(empty) == [] and empty.meta == {"count": 0}
+
+    absent = StreamedPage([b'{"errors": ["bad request"]}'], "results")
+    assert list(absent) == [] and absent.meta == {"errors": ["bad request"]}
+
+
+def test_truncated_body_raises():
+    body = json.dumps(PAGE).encode()[:-40]
+
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamedPage([body], "results"))
+
+
+def test_closes_when_done_or_abandoned():
+    closed = []
+    list(StreamedPage([json.dumps(PAGE).encode()], "results", close=lambda: closed.append("done")))
+
+    page = iter(StreamedPage([json.dumps(PAGE).encode()], "results", close=lambda: closed.append("abandoned")))
+    next(page)
+    page.close()
+
+    assert closed == ["done", "abandoned"]
@@ -0,0 +1,112 @@
+import threading
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.models import Legislation, ScrapeState
+from app.scrapers import base, orchestrator
+from app.scrapers.orchestrator import (
+    ScrapeUnit, UnitResult, format_report, plan_lanes, plan_units, run_units, summarize
+)
+from tests.conftest import TOTAL_BILLS
+
+
+def units(source, *scopes):
+    return [ScrapeUnit(source, scope) for scope in scopes]
+
+
+def test_plan_lanes_caps_each_source():
+    planned = units("congress", "118", "117", "116") + units("federal_register", "a", "b", "c", "d")
+
+    lanes = plan_lanes(planned, {"congress": 5, "federal_register": 2})
+
+    assert lanes == [
+        units("congress", "118"), units("congress", "117"), units("congress", "116"),
+        units("federal_register", "a", "c"), units("federal_register", "b", "d"),
+    ]
+    assert plan_lanes(planned, {}) == [
+        units("congress", "118", "117", "116"), units("federal_register", "a", "b", "c", "d")
+    ]
+
+
+def test_plan_units_needs_no_api_key(monkeypatch):
+    monkeypatch.setattr(get_settings(), "SCRAPER_STATES", "ny, ca")
+
+    planned = plan_units()
+
+    assert units("congress", "118", "117", "116") == planned[:3]
+    assert [unit.scope for unit in planned if unit.source == "federal_register"][-1] == "2009-01-20"
+    assert planned[-2:] == units("state", "NY", "CA")
+
+
+def test_run_units_respects_caps_and_reports_failures(monkeypatch):
+    running = {"congress": 0, "federal_register": 0}
+    peak = dict(running)
+    lock = threading.Lock()
+
+    def fake_runner(source):
+        def run(scope, full):
+            with lock:
+                running[source] += 1
+                peak[source] = max(peak[source], running[source])
+            time.sleep(0.05)
+            with lock:
+                running[source] -= 1
+            if scope == "bad":
+                raise RuntimeError("upstream returned 500")
+            return {"inserted": 1, "updated": 0, "unchanged": 2}
+        return run
+
+    monkeypatch.setattr(orchestrator, "RUNNERS", {source: fake_runner(source) for source in running})
+    planned = units("congress", "118", "117", "116", "115") + units("federal_register", "a", "bad", "c")
+
+    started = time.perf_counter()
+    results = run_units(planned, concurrency={"congress": 2, "federal_register": 3})
+    summary = summarize(results, time.perf_counter() - started)
+
+    assert peak == {"congress": 2, "federal_register": 3}
+    assert [result.unit for result in results] == planned
+    assert summary["failed"] == ["federal_register:bad"]
+    assert summary["totals"] == {
+        "pages": 0, "fetched": 0, "inserted": 6, "updated": 0, "unchanged": 12, "failed": 0
+    }
+    # 7 units of 50 ms in two batches of congress units
+    assert summary["speedup"] > 2
+    assert "failed: upstream returned 500" in format_report(summary)
+
+
+def test_unit_results_round_trip_through_json():
+    result = UnitResult(ScrapeUnit("congress", "118"), 1.5, {"inserted": 3})
+    assert UnitResult.from_dict(result.as_dict()) == result
+
+
+def test_congress_units_write_through_their_own_sessions(monkeypatch, stub_server, engine, db):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "CONGRESS_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "CONGRESS_API_BASE_URL", stub_server)
+    monkeypatch.setattr(settings, "CONGRESS_PAGE_SIZE", 2)
+    sessions = []
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def session_local():
+        sessions.append(factory())
+        return sessions[-1]
+
+    monkeypatch.setattr(base, "SessionLocal", session_local)
+
+    results = run_units(units("congress", "118", "117"), concurrency={"congress": 2})
+
+    assert [result.error for result in results] == [None, None]
+    assert [result.counts["inserted"] for result in results] == [TOTAL_BILLS, TOTAL_BILLS]
+    assert len(set(map(id, sessions))) == 2
+    assert db.query(Legislation).count() == 2 * TOTAL_BILLS
+    assert {state.scope for state in db.query(ScrapeState)} == {"118", "117"}
+
+
+def test_missing_api_key_fails_the_unit_only(monkeypatch):
+    monkeypatch.setattr(get_settings(), "CONGRESS_API_KEY", None)
+
+    [result] = run_units(units("congress", "118"))
+
+    assert result.error == "API key required for Congress.gov"
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api import queries
+from app.models import LegislationType, Status
+
+
+@pytest.fixture
+def federal_bills(scraper):
+    start = datetime(2023, 1, 3)
+    rows = [
+        {
+            "id": f"federal_118_hr_{n:03d}",
+            "type": LegislationType.FEDERAL,
+            "title": f"Bill {n}",
+            "status": Status.ACTIVE,
+            # Shared dates exercise the id tie-breaker, a few rows are undated
+            "introduced_date": start + timedelta(days=n // 3) if n % 10 else None,
+            "congress": "118",
+        }
+        for n in range(45)
+    ]
+    scraper.upsert_legislation(rows)
+    queries._count_cache.clear()
+    return rows
+
+
+def walk_cursor(client, **params):
+    ids = []
+    response = client.get("/api/v1/federal", params={"limit": 7, **params}).json()
+    while True:
+        ids += [item["id"] for item in response["data"]]
+        if not response["next_cursor"]:
+            return ids
+        response = client.get(
+            "/api/v1/federal",
+            params={"limit": 7, "cursor": response["next_cursor"], **params}
+        ).json()
+
+
+def test_cursor_walk_matches_offset_pages(client, federal_bills):
+    paged = []
+    for page in range(1, 8):
+        response = client.get("/api/v1/federal", params={"page": page, "limit": 7}).json()
+        paged += [item["id"] for item in response["data"]]
+
+    assert walk_cursor(client) == paged
+    assert len(paged) == len(set(paged)) == 45
+
+
+def test_cursor_mode_skips_total_unless_requested(client, federal_bills):
+    first = client.get("/api/v1/federal", params={"limit": 5}).json()
+    assert first["total"] == 45
+
+    second = client.get("/api/v1/federal", params={"cursor": first["next_cursor"]}).json()
+    assert second["total"] is None
+    assert second["page"] is None
+
+    counted = client.get(
+        "/api/v1/federal", params={"cursor": first["next_cursor"], "include_total": True}
+    ).json()
+    assert counted["total"] == 45
+
+
+def test_cursor_respects_filters(client, federal_bills):
+    ids = walk_cursor(client, year=2023, status="ACTIVE")
+
+    assert len(ids) == len([row for row in federal_bills if row["introduced_date"]])
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/v1/federal", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from app.api.queries import (
+    action_page, encode_cursor, filter_legislation, keyset_page, order_legislation, pack_cursor, sort_column
+)
+from app.models import Legislation, LegislationType, LegislativeAction
+
+
+def query_plan(db, query):
+    sql = str(query.statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    ))
+    return [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+def assert_indexed(plan):
+    for step in plan:
+        assert not step.startswith("SCAN legislation"), plan
+        assert not step.startswith("SCAN legislative_actions"), plan
+        assert "TEMP B-TREE" not in step, plan
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"status": "ACTIVE"},
+    {"year": 2023},
+    {"status": "ACTIVE", "year": 2023},
+    {"congress": "118"},
+    {"congress": "118", "year": 2023},
+    {"stale_days": 90},
+])
+def test_list_queries_use_indexes(db, filters):
+    query = filter_legislation(db.query(Legislation), LegislationType.FEDERAL, **filters)
+    column = sort_column(filters.get("stale_days"))
+
+    assert_indexed(query_plan(db, order_legislation(query, column).limit(20)))
+    assert_indexed(query_plan(db, query.with_entities(Legislation.id)))
+
+
+@pytest.mark.parametrize("legislation_type, filters", [
+    (LegislationType.EXECUTIVE, {"president": "Barack Obama"}),
+    (LegislationType.STATE, {"state": "ny"}),
+])
+def test_promoted_column_filters_use_indexes(db, legislation_type, filters):
+    query = filter_legislation(db.query(Legislation), legislation_type, **filters)
+
+    assert_indexed(query_plan(db, order_legislation(query).limit(20)))
+    assert_indexed(query_plan(db, query.with_entities(Legislation.id)))
+
+
+def test_stale_filter_uses_index(db):
+    query = filter_legislation(db.query(Legislation), LegislationType.FEDERAL, stale_days=90)
+
+    plan = query_plan(db, query.with_entities(Legislation.id))
+    assert plan == ["SEARCH legislation USING COVERING INDEX ix_legislation_type_last_action "
+                    "(type=? AND last_action_date<?)"]
+
+
+def test_actions_lookup_uses_index(db):
+    query = db.query(LegislativeAction).filter(
+        LegislativeAction.legislation_id == "federal_118_hr_1"
+    ).order_by(LegislativeAction.action_date)
+
+    assert_indexed(query_plan(db, query))
+
+
+
+def captured_plans(db, run):
+    statements = []
+
+    def capture(conn, dbapi_cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(db.get_bind(), "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", capture)
+
+    assert statements
+    return [
+        [row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+        for statement, parameters in statements
+    ]
+
+
+@pytest.mark.parametrize("introduced_date", [datetime(2023, 5, 1), None])
+def test_keyset_pages_seek_the_index(db, introduced_date):
+    query = filter_legislation(db.query(Legislation), LegislationType.FEDERAL, status="ACTIVE")
+    cursor = encode_cursor(Legislation(id="federal_118_hr_9", introduced_date=introduced_date))
+
+    for plan in captured_plans(db, lambda: keyset_page(query, cursor, 20)):
+        assert_indexed(plan)
+
+
+def test_action_pages_seek_the_index(db):
+    db.add(Legislation(id="federal_118_hr_1", type=LegislationType.FEDERAL, title="Bill 1"))
+    db.commit()
+    cursor = pack_cursor(datetime(2023, 5, 1), "federal_118_hr_1:0123456789abcdef")
+
+    for plan in captured_plans(db, lambda: action_page(db, "federal_118_hr_1", cursor, 50)):
+        assert_indexed(plan)
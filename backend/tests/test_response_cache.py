@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.api.response_cache import cache_key
+from app.models import LegislationType, Status
+
+
+def bill(number, title="Lower Energy Costs Act"):
+    return {
+        "id": f"federal_118_hr_{number}",
+        "type": LegislationType.FEDERAL,
+        "title": title,
+        "status": Status.ACTIVE,
+        "introduced_date": datetime(2023, 3, 14),
+        "congress": "118",
+    }
+
+
+@pytest.fixture
+def seeded(scraper):
+    scraper.upsert_legislation([bill(1), bill(2)])
+    return scraper
+
+
+@pytest.fixture
+def statements(async_engine):
+    captured = []
+
+    def capture(conn, dbapi_cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    return captured
+
+
+def test_second_request_is_a_hit(client, seeded, statements):
+    first = client.get("/api/v1/federal?page=1&limit=20")
+    assert first.headers["X-Cache"] == "MISS"
+    assert first.headers["ETag"]
+    assert first.headers["Last-Modified"].endswith("GMT")
+    queries = len(statements)
+    assert queries > 0
+
+    # Same parameters in another order, plus an empty one
+    second = client.get("/api/v1/federal?limit=20&status=&page=1")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.json() == first.json()
+    assert len(statements) == queries
+
+
+def test_conditional_get_returns_304_without_queries(client, seeded, statements):
+    etag = client.get("/api/v1/legislation/federal_118_hr_1").headers["ETag"]
+    statements.clear()
+
+    response = client.get("/api/v1/legislation/federal_118_hr_1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert statements == []
+
+
+def test_if_modified_since(client, seeded):
+    last_modified = client.get("/api/v1/stats").headers["Last-Modified"]
+
+    response = client.get("/api/v1/stats", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+def test_scrape_commit_invalidates(client, seeded):
+    first = client.get("/api/v1/federal")
+    etag = first.headers["ETag"]
+
+    seeded.upsert_legislation([bill(1, title="Lower Energy Costs Act (amended)")])
+
+    response = client.get("/api/v1/federal", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.headers["ETag"] != etag
+    assert "Lower Energy Costs Act (amended)" in {item["title"] for item in response.json()["data"]}
+
+
+def test_scrape_commit_refreshes_totals(client, seeded):
+    assert client.get("/api/v1/federal").json()["total"] == 2
+
+    seeded.upsert_legislation([bill(3)])
+
+    # The re-rendered page must not reuse the count taken before the commit
+    for _ in range(2):
+        response = client.get("/api/v1/federal").json()
+        assert len(response["data"]) == 3
+        assert response["total"] == 3
+
+
+def test_unchanged_scrape_keeps_entries(client, seeded):
+    etag = client.get("/api/v1/federal").headers["ETag"]
+
+    seeded.upsert_legislation([bill(1), bill(2)])
+
+    assert client.get("/api/v1/federal", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_errors_and_other_routes_are_not_cached(client, seeded):
+    missing = client.get("/api/v1/legislation/missing")
+    assert missing.status_code == 404
+    assert "ETag" not in missing.headers
+
+    search = client.get("/api/v1/search", params={"q": "energy"})
+    assert "X-Cache" not in search.headers
+
+    # Stale filters move with the clock, not the data version
+    stale = client.get("/api/v1/federal", params={"stale_days": 90})
+    assert stale.status_code == 200 and "ETag" not in stale.headers
+
+
+def test_metrics_report_hits_and_latency(client, seeded):
+    client.get("/api/v1/executive")
+    client.get("/api/v1/executive")
+
+    metrics = client.get("/metrics/").text
+    assert 'response_cache_requests_total{result="hit",route="executive"}' in metrics
+    assert 'response_cache_latency_seconds_count{result="miss"}' in metrics
+
+
+def test_cache_key_normalizes_query():
+    assert cache_key("/api/v1/federal", "page=2&limit=20&status=") == "/api/v1/federal?limit=20&page=2"
+    assert cache_key("/api/v1/stats", "") == "/api/v1/stats"
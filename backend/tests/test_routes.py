@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.queries import _count_cache
+from app.models import Legislation, LegislationType, Status
+
+
+@pytest.fixture
+def executive_order(scraper):
+    scraper.upsert_legislation([{
+        "id": "executive_14008",
+        "type": LegislationType.EXECUTIVE,
+        "title": "Tackling the Climate Crisis at Home and Abroad",
+        "status": Status.SIGNED,
+        "introduced_date": datetime(2021, 1, 27),
+        "president": "Joseph R. Biden",
+        "full_text": "<p>By the authority vested in me</p>",
+        "extra_data": {"executive_order_number": "14008"},
+    }])
+
+
+def test_list_omits_document_body(client, executive_order):
+    item = client.get("/api/v1/executive").json()["data"][0]
+
+    assert item["id"] == "executive_14008"
+    assert item["president"] == "Joseph R. Biden"
+    assert "full_text" not in item
+    assert "extra_data" not in item
+
+
+def test_detail_includes_document_body(client, executive_order):
+    item = client.get("/api/v1/legislation/executive_14008").json()
+
+    assert item["full_text"] == "<p>By the authority vested in me</p>"
+    assert item["extra_data"] == {"executive_order_number": "14008"}
+
+
+def test_detail_missing_returns_404(client):
+    assert client.get("/api/v1/legislation/missing").status_code == 404
+
+
+@pytest.fixture
+def aging_bills(scraper):
+    now = datetime.utcnow()
+    scraper.upsert_legislation([
+        {
+            "id": f"federal_118_hr_{days}",
+            "type": LegislationType.FEDERAL,
+            "title": f"Last acted on {days} days ago",
+            "status": Status.ACTIVE,
+            "introduced_date": datetime(2023, 1, 9),
+            "last_action_date": now - timedelta(days=days, hours=1) if days is not None else None,
+            "congress": "118",
+        }
+        for days in (3, 89, 91, 400, None)
+    ])
+
+
+def test_stale_filter_orders_by_last_action(client, aging_bills):
+    first = client.get("/api/v1/federal", params={"stale_days": 30, "limit": 1}).json()
+    second = client.get(
+        "/api/v1/federal", params={"stale_days": 30, "limit": 1, "cursor": first["next_cursor"]}
+    ).json()
+    third = client.get(
+        "/api/v1/federal", params={"stale_days": 30, "limit": 1, "cursor": second["next_cursor"]}
+    ).json()
+
+    assert first["total"] == 3
+    assert [page["data"][0]["id"] for page in (first, second, third)] == [
+        "federal_118_hr_89", "federal_118_hr_91", "federal_118_hr_400"
+    ]
+    assert third["next_cursor"] is None
+    assert client.get("/api/v1/federal", params={"stale_days": -1}).status_code == 422
+
+
+def test_stale_counts_are_cached(client, aging_bills):
+    client.get("/api/v1/federal", params={"stale_days": 30})
+    entries = len(_count_cache)
+
+    assert client.get("/api/v1/federal", params={"stale_days": 30}).json()["total"] == 3
+    assert len(_count_cache) == entries
+
+
+def test_day_counts_match_in_python_and_sql(db, aging_bills):
+    rows = db.query(
+        Legislation, Legislation.days_since_last_action, Legislation.days_since_introduction
+    ).order_by(Legislation.days_since_last_action.desc()).all()
+
+    assert [days for _, days, _ in rows] == [400, 91, 89, 3, 0]
+    for item, since_action, since_introduction in rows:
+        assert item.days_since_last_action == since_action
+        assert item.days_since_introduction == since_introduction
+        assert item.is_stale(90) == (since_action > 90)
+    assert db.query(Legislation).filter(Legislation.is_stale(90)).count() == 2
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+
+from app.api.search import fts5_query
+from app.models import LegislationType, Status
+
+
+def order(number, title, body):
+    return {
+        "id": f"executive_{number}",
+        "type": LegislationType.EXECUTIVE,
+        "title": title,
+        "status": Status.SIGNED,
+        "introduced_date": datetime(2021, 1, 27),
+        "president": "Joseph R. Biden",
+        "full_text": body,
+    }
+
+
+@pytest.fixture
+def corpus(scraper):
+    scraper.upsert_legislation([
+        order(14008, "Tackling the Climate Crisis at Home and Abroad",
+              "<p>The United States will <b>exercise</b> its leadership on climate.</p>"),
+        order(14030, "Climate-Related Financial Risk", "<p>Financial regulators shall assess risk.</p>"),
+        order(14036, "Promoting Competition in the American Economy",
+              "<p>Agencies shall consider the climate impact of mergers.</p>"),
+        {
+            "id": "federal_118_hr_1",
+            "type": LegislationType.FEDERAL,
+            "title": "Lower Energy Costs Act",
+            "summary": "<p>Addresses <b>climate</b> permitting.</p>",
+            "status": Status.ACTIVE,
+            "introduced_date": datetime(2023, 3, 14),
+        },
+    ])
+    return scraper
+
+
+def search(client, **params):
+    response = client.get("/api/v1/search", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_results_ranked_title_first(client, corpus):
+    result = search(client, q="climate")
+
+    assert result["total"] == 4
+    ids = [item["id"] for item in result["data"]]
+    assert set(ids[:2]) == {"executive_14008", "executive_14030"}
+    assert ids[0] != "executive_14036"
+    assert all(item["rank"] > 0 for item in result["data"])
+
+
+def test_snippets_mark_hits_without_markup(client, corpus):
+    item = search(client, q="mergers")["data"][0]
+
+    assert item["id"] == "executive_14036"
+    assert "<mark>mergers</mark>" in item["snippet"]
+    assert "<p>" not in item["snippet"]
+
+
+def test_type_filter_and_pagination(client, corpus):
+    result = search(client, q="climate", type="executive", limit=2)
+    assert result["total"] == 3
+    assert result["pages"] == 2
+    assert len(result["data"]) == 2
+
+    second = search(client, q="climate", type="executive", limit=2, page=2)
+    assert len(second["data"]) == 1
+    assert second["data"][0]["id"] not in {item["id"] for item in result["data"]}
+
+
+def test_prefix_and_stemmed_matches(client, corpus):
+    assert search(client, q="financ")["data"][0]["id"] == "executive_14030"
+    assert search(client, q="promotes competition")["data"][0]["id"] == "executive_14036"
+
+
+def test_query_syntax_is_escaped(client, corpus):
+    assert search(client, q='climate" OR (NEAR')["total"] == 0
+    assert search(client, q="***")["total"] == 0
+
+
+def test_index_follows_upserts(client, corpus):
+    corpus.upsert_legislation([
+        order(14030, "Climate-Related Financial Risk", "<p>Insurers shall disclose exposure.</p>"),
+    ])
+
+    assert search(client, q="insurers")["data"][0]["id"] == "executive_14030"
+    assert search(client, q="regulators")["total"] == 0
+    assert search(client, q="climate")["total"] == 4
+
+
+def test_metadata_update_keeps_stored_body(client, corpus):
+    # Re-scraped without a body: the stored document stays indexed
+    corpus.upsert_legislation([{
+        **order(14036, "Promoting Competition in the American Economy (amended)", None),
+    }])
+
+    assert search(client, q="mergers")["data"][0]["id"] == "executive_14036"
+    assert search(client, q="amended")["total"] == 1
+
+
+def test_fts5_query_quotes_terms():
+    assert fts5_query("climate risk") == '"climate" "risk"*'
+    assert fts5_query('a"b') == '"a" "b"*'
+    assert fts5_query("!!") is None
@@ -0,0 +1,276 @@
+import csv
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.config import get_settings
+from app.models import Legislation, ScrapeRun, ScrapeState
+from app.scrapers.base import APIKeyMissingError
+from app.scrapers.orchestrator import plan_units
+from app.scrapers.state import StateLegislatureScraper
+from app.scrapers.state_adapters import NYSenateAdapter, OpenStatesBulkAdapter, US_STATES
+
+
+def openstates_bill(number, updated_at="2024-03-01T12:00:00+00:00", **fields):
+    return {
+        "id": f"ocd-bill/{number:08d}",
+        "identifier": f"HB {number}",
+        "title": f"Relating to item {number}",
+        "session": "2023-2024",
+        "classification": ["bill"],
+        "subject": ["Education"],
+        "abstracts": [{"abstract": f"Abstract {number}"}],
+        "first_action_date": "2023-01-10",
+        "latest_action_date": "2023-02-01",
+        "latest_action_description": "Referred to Committee on Education",
+        "openstates_url": f"https://openstates.org/tx/bills/2023-2024/HB{number}/",
+        "updated_at": updated_at,
+        **fields,
+    }
+
+
+def write_jsonl(path, bills):
+    path.write_text("".join(json.dumps(bill) + "\n" for bill in bills))
+
+
+@pytest.fixture
+def bulk_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "openstates"
+    directory.mkdir()
+    monkeypatch.setattr(get_settings(), "STATE_BULK_DATA_URL", str(directory))
+    monkeypatch.setattr(get_settings(), "NY_LEGISLATURE_API_KEY", None)
+    return directory
+
+
+def scrape(state, db, full=False):
+    with StateLegislatureScraper(state) as scraper:
+        scraper._db = db
+        return scraper.scrape_state(full=full)
+
+
+def test_bulk_jsonl_is_normalized(bulk_dir, db):
+    write_jsonl(bulk_dir / "tx.jsonl", [
+        openstates_bill(1),
+        openstates_bill(2, latest_action_description="Signed by the Governor",
+                        actions=[
+                            {"date": "2023-01-10", "description": "Filed", "classification": ["introduction"],
+                             "organization": {"name": "House", "classification": "lower"}, "order": 0},
+                            {"date": "2023-05-20", "description": "Signed by the Governor",
+                             "classification": ["executive-signature"], "order": 1},
+                        ]),
+    ])
+
+    counts = scrape("TX", db)
+
+    assert (counts["fetched"], counts["inserted"], counts["pages"]) == (2, 2, 1)
+    bill = db.get(Legislation, "state_tx_20232024_hb1")
+    assert (bill.type, bill.state, bill.bill_number, bill.bill_type) == ("STATE", "TX", "HB 1", "hb")
+    assert (bill.title, bill.summary, bill.status) == ("Relating to item 1", "Abstract 1", "ACTIVE")
+    assert bill.introduced_date == datetime(2023, 1, 10)
+    signed = db.get(Legislation, "state_tx_20232024_hb2")
+    assert signed.status == "SIGNED"
+    filed, signing = sorted(signed.actions, key=lambda action: action.action_date)
+    assert (filed.action_type, filed.description, filed.extra_data["chamber"]) == ("introduction", "Filed", "lower")
+    assert (signing.action_type, signing.action_date) == ("executive-signature", datetime(2023, 5, 20))
+
+
+def test_per_session_json_and_csv_files(bulk_dir, db):
+    (bulk_dir / "CA").mkdir()
+    (bulk_dir / "CA" / "ca_2023-2024_bills.json").write_text(
+        json.dumps({"results": [openstates_bill(1, session="20232024")], "pagination": {"max_page": 1}})
+    )
+    with open(bulk_dir / "ca_2021-2022_bills.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, ["identifier", "title", "session", "subject", "updated_at"])
+        writer.writeheader()
+        writer.writerow({
+            "identifier": "AB 7", "title": "An act,\nwith a newline", "session": "20212022",
+            "subject": "Water; Energy", "updated_at": "2022-08-31",
+        })
+
+    counts = scrape("CA", db)
+
+    assert (counts["inserted"], counts["pages"]) == (2, 2)
+    old = db.get(Legislation, "state_ca_20212022_ab7")
+    assert old.title == "An act,\nwith a newline"
+    assert old.extra_data["subjects"] == ["Water", "Energy"]
+    assert db.get(Legislation, "state_ca_20232024_hb1") is not None
+
+
+def test_csv_list_columns_are_decoded(bulk_dir, db):
+    columns = [
+        "id", "identifier", "title", "session", "classification", "subject", "abstracts", "sources",
+        "first_action_date", "latest_action_date", "latest_action_description",
+        "latest_action_classification", "updated_at",
+    ]
+    with open(bulk_dir / "wa_2023-2024_bills.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        # List columns as Open States CSV exports render them
+        writer.writerow({
+            "id": "ocd-bill/5d2f0c1e", "identifier": "SB 5001", "title": "Concerning water rights",
+            "session": "2023-2024", "classification": "['bill']", "subject": "Water; Natural Resources",
+            "abstracts": json.dumps([{"abstract": "Concerns water rights; amends RCW 90.03.", "note": "Digest"}]),
+            "sources": "https://app.leg.wa.gov/billsummary?BillNumber=5001&Year=2023",
+            "first_action_date": "2023-01-09", "latest_action_date": "2023-04-20",
+            "latest_action_description": "Effective date 7/23/2023.",
+            "latest_action_classification": "executive-signature;became-law",
+            "updated_at": "2023-07-24T08:00:00+00:00",
+        })
+        writer.writerow({
+            "id": "ocd-bill/5d2f0c1f", "identifier": "HB 1002", "title": "Concerning hunting licenses",
+            "session": "2023-2024", "classification": "bill", "subject": "",
+            "abstracts": "Changes hunting license fees; creates a youth license.",
+            "sources": json.dumps([{"url": "https://app.leg.wa.gov/billsummary?BillNumber=1002&Year=2023"}]),
+            "first_action_date": "2023-01-09", "latest_action_date": "2023-01-09",
+            "latest_action_description": "First reading, referred to Agriculture & Natural Resources.",
+            "latest_action_classification": '["introduction", "referral-committee"]',
+            "updated_at": "2023-01-10T08:00:00+00:00",
+        })
+
+    counts = scrape("WA", db)
+
+    assert (counts["inserted"], counts["failed"]) == (2, 0)
+    law = db.get(Legislation, "state_wa_20232024_sb5001")
+    assert (law.status, law.summary) == ("SIGNED", "Concerns water rights; amends RCW 90.03.")
+    assert law.source_url == "https://app.leg.wa.gov/billsummary?BillNumber=5001&Year=2023"
+    assert law.extra_data["subjects"] == ["Water", "Natural Resources"]
+    assert law.extra_data["classification"] == ["bill"]
+    referred = db.get(Legislation, "state_wa_20232024_hb1002")
+    assert (referred.status, referred.summary) == ("ACTIVE", "Changes hunting license fees; creates a youth license.")
+    assert referred.source_url == "https://app.leg.wa.gov/billsummary?BillNumber=1002&Year=2023"
+    assert referred.extra_data["subjects"] == []
+
+
+def test_incremental_runs_skip_bills_up_to_the_watermark(bulk_dir, db):
+    write_jsonl(bulk_dir / "tx.jsonl", [openstates_bill(n) for n in range(5)])
+    scrape("TX", db)
+    assert db.get(ScrapeState, ("state", "TX")).last_synced_at == datetime(2024, 3, 1, 12)
+
+    write_jsonl(bulk_dir / "tx.jsonl", [openstates_bill(n) for n in range(5)] + [
+        openstates_bill(1, "2024-03-02T09:30:00Z", title="Relating to item 1 (amended)"),
+        openstates_bill(9, "2024-03-02T09:30:00Z"),
+    ])
+    counts = scrape("TX", db)
+
+    assert (counts["fetched"], counts["inserted"], counts["updated"]) == (2, 1, 1)
+    assert db.get(Legislation, "state_tx_20232024_hb1").title == "Relating to item 1 (amended)"
+    assert db.get(ScrapeState, ("state", "TX")).last_synced_at == datetime(2024, 3, 2, 9, 30)
+
+    # A full run reads everything again, changing nothing
+    counts = scrape("TX", db, full=True)
+    assert (counts["fetched"], counts["unchanged"]) == (7, 6)
+
+
+def test_states_never_delete_each_other(bulk_dir, db):
+    write_jsonl(bulk_dir / "tx.jsonl", [openstates_bill(n) for n in range(3)])
+    write_jsonl(bulk_dir / "ok.jsonl", [openstates_bill(n) for n in range(4)])
+    scrape("TX", db)
+    scrape("OK", db)
+    scrape("TX", db, full=True)
+
+    assert db.query(Legislation).filter(Legislation.state == "OK").count() == 4
+    assert db.query(Legislation).filter(Legislation.state == "TX").count() == 3
+    assert db.query(ScrapeRun).filter(ScrapeRun.source == "state").count() == 3
+
+
+def test_bad_rows_are_counted_not_fatal(bulk_dir, db):
+    write_jsonl(bulk_dir / "tx.jsonl", [openstates_bill(1), {"title": "no identifier"}])
+
+    counts = scrape("TX", db)
+
+    assert (counts["fetched"], counts["inserted"], counts["failed"]) == (2, 1, 1)
+
+
+def test_missing_bulk_data_fails_the_run(bulk_dir, db):
+    with pytest.raises(FileNotFoundError):
+        scrape("WY", db)
+    assert db.query(ScrapeRun).one().error.startswith("No bulk data for WY")
+
+
+class BulkHandler(BaseHTTPRequestHandler):
+    """Serves /{state}.jsonl bulk files and a paginated NY Senate listing"""
+
+    requests_seen = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.requests_seen.append(self.path)
+        if url.path == "/bills/current":
+            offset = int(parse_qs(url.query)["offset"][0])
+            numbers = range(offset, min(offset + 2, 5))
+            body = json.dumps({"bills": [
+                {"printNo": f"S{n}", "title": f"Senate bill {n}", "publishedDate": "2024-01-03"} for n in numbers
+            ]}).encode()
+        elif url.path == "/tx.jsonl":
+            body = "".join(json.dumps(openstates_bill(n)) + "\n" for n in range(3)).encode()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def bulk_server():
+    BulkHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BulkHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_remote_bulk_data(bulk_server, db, monkeypatch):
+    monkeypatch.setattr(get_settings(), "STATE_BULK_DATA_URL", f"{bulk_server}/{{state}}.jsonl")
+
+    assert scrape("TX", db)["inserted"] == 3
+    assert BulkHandler.requests_seen == ["/tx.jsonl"]
+
+
+def test_ny_senate_api_is_paginated_and_upserted(bulk_server, db, monkeypatch):
+    monkeypatch.setattr(get_settings(), "NY_LEGISLATURE_API_KEY", "ny-key")
+    monkeypatch.setattr(NYSenateAdapter, "base_url", bulk_server)
+    monkeypatch.setattr(NYSenateAdapter, "page_size", 2)
+
+    counts = scrape("NY", db)
+    assert (counts["pages"], counts["inserted"]) == (3, 5)
+    assert db.get(Legislation, "state_ny_S4").title == "Senate bill 4"
+
+    assert scrape("NY", db)["unchanged"] == 5
+
+
+def test_adapter_selection(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "STATE_BULK_DATA_URL", None)
+    monkeypatch.setattr(settings, "NY_LEGISLATURE_API_KEY", None)
+
+    with pytest.raises(APIKeyMissingError):
+        StateLegislatureScraper("NY")
+    with pytest.raises(ValueError):
+        StateLegislatureScraper("TX")
+
+    monkeypatch.setattr(settings, "STATE_BULK_DATA_URL", "/srv/openstates")
+    assert isinstance(StateLegislatureScraper("ny").adapter, OpenStatesBulkAdapter)
+    monkeypatch.setattr(settings, "NY_LEGISLATURE_API_KEY", "ny-key")
+    assert isinstance(StateLegislatureScraper("NY").adapter, NYSenateAdapter)
+    with pytest.raises(ValueError):
+        StateLegislatureScraper("PR")
+
+
+def test_all_states_are_planned_from_bulk_data(bulk_dir, monkeypatch):
+    monkeypatch.setattr(get_settings(), "SCRAPER_STATES", "all")
+
+    states = [unit.scope for unit in plan_units(["state"])]
+
+    assert states == list(US_STATES) and len(states) == 50
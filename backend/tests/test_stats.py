@@ -0,0 +1,159 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import LegislationRollup, LegislationType, Status, rebuild_rollups
+from tests.conftest import StubScraper
+
+
+def bill(n, legislation_type, status, introduced_date):
+    return {
+        "id": f"{legislation_type.value.lower()}_{n}",
+        "type": legislation_type,
+        "title": f"Item {n}",
+        "status": status,
+        "introduced_date": introduced_date,
+    }
+
+
+@pytest.fixture
+def seeded(scraper):
+    scraper.upsert_legislation([
+        bill(1, LegislationType.FEDERAL, Status.ACTIVE, datetime(2023, 1, 9)),
+        bill(2, LegislationType.FEDERAL, Status.ACTIVE, datetime(2023, 6, 1)),
+        bill(3, LegislationType.FEDERAL, Status.PASSED, datetime(2022, 3, 2)),
+        bill(4, LegislationType.EXECUTIVE, Status.SIGNED, datetime(2023, 2, 1)),
+        bill(5, LegislationType.STATE, Status.ACTIVE, None),
+    ])
+    return scraper
+
+
+def count_selects(async_engine):
+    statements = []
+
+    def capture(conn, dbapi_cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    return statements
+
+
+def test_stats_breakdowns(client, seeded):
+    stats = client.get("/api/v1/stats").json()
+
+    assert stats["federal_count"] == 3
+    assert stats["executive_count"] == 1
+    assert stats["state_count"] == 1
+    assert stats["total"] == 5
+    assert stats["by_status"] == {"ACTIVE": 3, "PASSED": 1, "SIGNED": 1}
+    assert stats["by_year"] == {"2023": 3, "2022": 1}
+    assert stats["by_type"]["FEDERAL"] == {
+        "total": 3,
+        "by_status": {"ACTIVE": 2, "PASSED": 1},
+        "by_year": {"2023": 2, "2022": 1},
+    }
+
+
+def test_stats_served_from_cache_until_scrape_commits(client, async_engine, seeded):
+    selects = count_selects(async_engine)
+
+    client.get("/api/v1/stats")
+    assert len(selects) == 1
+
+    client.get("/api/v1/stats")
+    assert len(selects) == 1
+
+    seeded.upsert_legislation([
+        bill(6, LegislationType.EXECUTIVE, Status.SIGNED, datetime(2024, 1, 5)),
+    ])
+    selects.clear()
+
+    stats = client.get("/api/v1/stats").json()
+    assert len(selects) == 1
+    assert stats["executive_count"] == 2
+    assert stats["by_year"]["2024"] == 1
+
+
+def test_unchanged_scrape_keeps_cache(client, async_engine, seeded):
+    client.get("/api/v1/stats")
+    seeded.upsert_legislation([
+        bill(1, LegislationType.FEDERAL, Status.ACTIVE, datetime(2023, 1, 9)),
+    ])
+    selects = count_selects(async_engine)
+
+    client.get("/api/v1/stats")
+    assert selects == []
+
+
+def rollups(db):
+    return {
+        (row.type, row.status, row.year, row.congress, row.president, row.state): row.count
+        for row in db.query(LegislationRollup)
+    }
+
+
+def test_rollups_follow_changed_rows(seeded, db):
+    assert rollups(db)[("FEDERAL", "ACTIVE", 2023, "", "", "")] == 2
+    assert rollups(db)[("STATE", "ACTIVE", 0, "", "", "")] == 1
+
+    # A status change moves the item between combinations
+    seeded.upsert_legislation([
+        {**bill(1, LegislationType.FEDERAL, Status.PASSED, datetime(2023, 1, 9)), "congress": "118"},
+    ])
+    counts = rollups(db)
+    assert counts[("FEDERAL", "ACTIVE", 2023, "", "", "")] == 1
+    assert counts[("FEDERAL", "PASSED", 2023, "118", "", "")] == 1
+
+    # Combinations left empty are dropped, and the incremental counts
+    # match a rebuild from the legislation table
+    seeded.upsert_legislation([bill(5, LegislationType.STATE, Status.FAILED, None)])
+    assert ("STATE", "ACTIVE", 0, "", "", "") not in rollups(db)
+    incremental = rollups(db)
+    rebuild_rollups(db)
+    db.commit()
+    assert rollups(db) == incremental
+
+
+def test_rollups_skip_rows_a_concurrent_writer_stored(seeded, db, engine, monkeypatch):
+    payload = bill(1, LegislationType.FEDERAL, Status.PASSED, datetime(2023, 1, 9))
+    upsert_statement = seeded._upsert_statement
+
+    def racing(table):
+        # Another worker stores the same change after this batch read the row
+        with StubScraper() as other:
+            other._db = sessionmaker(bind=engine)()
+            other.upsert_legislation([payload])
+        return upsert_statement(table)
+
+    monkeypatch.setattr(seeded, "_upsert_statement", racing)
+    assert seeded.upsert_legislation([payload])["updated"] == 1
+
+    incremental = rollups(db)
+    assert incremental[("FEDERAL", "PASSED", 2023, "", "", "")] == 1
+    rebuild_rollups(db)
+    db.commit()
+    assert rollups(db) == incremental
+
+
+def test_stats_breakdown(client, seeded):
+    seeded.upsert_legislation([
+        {**bill(6, LegislationType.STATE, Status.ACTIVE, datetime(2024, 2, 1)), "state": "CA"},
+        {**bill(7, LegislationType.FEDERAL, Status.PASSED, datetime(2024, 1, 3)), "congress": "118"},
+        {**bill(8, LegislationType.FEDERAL, Status.SIGNED, datetime(2020, 5, 5)), "congress": "99"},
+    ])
+    breakdown = client.get("/api/v1/stats/breakdown").json()
+
+    assert breakdown["total"] == 8
+    assert breakdown["by_year"] == {"2024": 2, "2023": 3, "2022": 1, "2020": 1}
+    assert breakdown["by_congress"] == {"118": 1, "99": 1}
+    assert breakdown["by_state"] == {"CA": 1}
+    assert breakdown["by_type"]["STATE"]["total"] == 2
+    assert breakdown["by_type"]["FEDERAL"]["by_status"] == {"ACTIVE": 2, "PASSED": 2, "SIGNED": 1}
+
+    seeded.upsert_legislation([
+        {**bill(9, LegislationType.STATE, Status.ACTIVE, datetime(2024, 3, 1)), "state": "CA"},
+    ])
+    assert client.get("/api/v1/stats/breakdown").json()["by_state"] == {"CA": 2}
@@ -0,0 +1,140 @@
+import random
+from email.utils import format_datetime
+from datetime import datetime, timezone
+
+import pytest
+
+from app.scrapers.throttle import (
+    MemoryBucketStore, RateLimiter, RateLimitError, RedisBucketStore, parse_retry_after
+)
+
+
+class FakeClock:
+    """Time that only moves when someone sleeps"""
+
+    def __init__(self, start=1000.0):
+        self.time = start
+        self.slept = []
+
+    def now(self):
+        return self.time
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.time += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store():
+    return MemoryBucketStore()
+
+
+def limiter(store, clock, **options):
+    options.setdefault("rng", random.Random(3))
+    return RateLimiter("test", store=store, clock=clock, **options)
+
+
+def test_burst_then_steady_rate(store, clock):
+    # 70 calls a minute: a 10 call burst, then one call a second
+    bucket = limiter(store, clock, calls=70, period=60, burst=10)
+
+    waits = [bucket.acquire() for _ in range(13)]
+
+    assert waits[:10] == [0] * 10
+    assert waits[10:] == pytest.approx([1.0, 1.0, 1.0])
+
+
+def test_never_exceeds_quota_in_any_window(store, clock):
+    bucket = limiter(store, clock, calls=120, period=60)
+    granted = []
+    for _ in range(400):
+        bucket.acquire()
+        granted.append(clock.now())
+
+    # Flat out, the only limit on throughput is the quota itself
+    window = [t for t in granted if t < granted[0] + 60]
+    assert len(window) == 120
+    for index, start in enumerate(granted):
+        assert sum(1 for t in granted[index:] if t < start + 60) <= 120
+
+
+def test_workers_sharing_a_store_share_the_budget(store, clock):
+    first = limiter(store, clock, calls=61, period=60, burst=1)
+    second = limiter(store, clock, calls=61, period=60, burst=1)
+
+    assert first.acquire() == 0
+    assert second.acquire() == pytest.approx(1.0)
+    assert first.acquire() == pytest.approx(1.0)
+
+
+def test_retry_after_pauses_every_caller(store, clock):
+    bucket = limiter(store, clock, calls=3600, period=3600)
+    other = limiter(store, clock, calls=3600, period=3600)
+    responses = iter([FakeResponse(429, {"Retry-After": "30"}), FakeResponse(200)])
+
+    response = bucket.call(lambda: next(responses))
+
+    assert response.status_code == 200
+    assert clock.slept == [30]
+    # The pause was recorded in the shared bucket, not just slept off locally
+    bucket.penalize(5)
+    assert other.acquire() == 5
+
+
+def test_retry_after_http_date(clock):
+    when = datetime.fromtimestamp(clock.now() + 90, tz=timezone.utc)
+    assert parse_retry_after(format_datetime(when, usegmt=True), clock.now()) == 90
+    assert parse_retry_after("120", clock.now()) == 120
+    assert parse_retry_after("soon", clock.now()) is None
+    assert parse_retry_after(None, clock.now()) is None
+
+
+def test_jittered_exponential_backoff_without_retry_after(store, clock):
+    bucket = limiter(store, clock, calls=3600, period=3600, max_attempts=4, backoff_base=2, backoff_cap=10)
+    responses = iter([FakeResponse(503)] * 3 + [FakeResponse(200)])
+
+    bucket.call(lambda: next(responses))
+
+    assert len(clock.slept) == 3
+    for attempt, delay in enumerate(clock.slept):
+        assert 0 <= delay <= min(10, 2 * 2 ** attempt)
+    assert len(set(clock.slept)) == 3
+
+
+def test_gives_up_after_max_attempts(store, clock):
+    bucket = limiter(store, clock, calls=3600, period=3600, max_attempts=3)
+
+    with pytest.raises(RateLimitError):
+        bucket.call(lambda: FakeResponse(429, {"Retry-After": "1"}))
+    assert clock.slept == [1, 1]
+    # The last Retry-After still holds back the next caller
+    assert bucket.acquire() == 1
+
+
+def test_other_errors_are_returned_not_retried(store, clock):
+    bucket = limiter(store, clock, calls=3600, period=3600)
+    assert bucket.call(lambda: FakeResponse(404)).status_code == 404
+    assert clock.slept == []
+
+
+def test_redis_outage_falls_back_to_local_budget(clock):
+    # Nothing listens on port 1
+    store = RedisBucketStore("redis://127.0.0.1:1/0")
+    bucket = limiter(store, clock, calls=61, period=60, burst=1)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1.0)
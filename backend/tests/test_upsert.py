@@ -0,0 +1,112 @@
+from datetime import datetime
+
+from app.models import Legislation, LegislationType, Status
+
+
+def make_row(number, title=None):
+    return {
+        "id": f"federal_118_hr_{number}",
+        "type": LegislationType.FEDERAL,
+        "title": title or f"Bill {number}",
+        "summary": "",
+        "status": Status.ACTIVE,
+        "introduced_date": datetime(2023, 1, 3),
+        "last_action_date": datetime(2023, 2, 1),
+        "source_url": f"https://www.congress.gov/bill/118th-congress/hr/{number}",
+        "extra_data": {"congress": "118", "bill_type": "hr", "bill_number": str(number)},
+    }
+
+
+def test_upsert_inserts_new_rows(scraper, db):
+    scraper.batch_size = 2
+    counts = scraper.upsert_legislation(make_row(n) for n in range(5))
+
+    assert counts == {"inserted": 5, "updated": 0, "unchanged": 0}
+    assert db.query(Legislation).count() == 5
+
+
+def test_upsert_counts_updated_and_unchanged(scraper, db):
+    scraper.upsert_legislation(make_row(n) for n in range(3))
+
+    rows = [make_row(0), make_row(1, title="Renamed"), make_row(3)]
+    counts = scraper.upsert_legislation(rows)
+
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+    db.expire_all()
+    renamed = db.query(Legislation).filter(Legislation.id == "federal_118_hr_1").one()
+    assert renamed.title == "Renamed"
+    assert renamed.updated_at is not None
+    untouched = db.query(Legislation).filter(Legislation.id == "federal_118_hr_0").one()
+    assert untouched.updated_at is None
+
+
+def test_upsert_keeps_last_duplicate_in_batch(scraper, db):
+    counts = scraper.upsert_legislation([make_row(0), make_row(0, title="Second")])
+
+    assert counts["inserted"] == 1
+    assert db.query(Legislation).one().title == "Second"
+
+
+def test_upsert_skips_rows_with_matching_hash(scraper, db):
+    scraper.upsert_legislation([make_row(0)])
+    stored = db.query(Legislation).one()
+    first_hash = stored.content_hash
+
+    # Same payload with JSON keys in a different order hashes identically
+    row = make_row(0)
+    row["extra_data"] = dict(reversed(list(row["extra_data"].items())))
+    counts = scraper.upsert_legislation([row])
+
+    assert counts == {"inserted": 0, "updated": 0, "unchanged": 1}
+    db.expire_all()
+    assert stored.content_hash == first_hash
+    assert stored.updated_at is None
+
+    counts = scraper.upsert_legislation([make_row(0, title="Amended")])
+    assert counts["updated"] == 1
+    db.expire_all()
+    assert stored.content_hash != first_hash
+
+
+def test_full_text_is_stored_compressed_off_row(scraper, db):
+    body = "<p>Executive order text</p>" * 200
+    row = make_row(0)
+    row["full_text"] = body
+    scraper.upsert_legislation([row])
+
+    stored = db.query(Legislation).one()
+    assert "full_text" not in stored.extra_data
+    assert stored.document.text == body
+    assert len(stored.document.body) < stored.document.raw_size
+
+    # A body change alone is detected through the content hash
+    row["full_text"] = body + "<p>Amended</p>"
+    assert scraper.upsert_legislation([row])["updated"] == 1
+    db.expire_all()
+    assert stored.document.text.endswith("<p>Amended</p>")
+
+
+def test_partial_rows_merge_top_level_extra_data(scraper, db):
+    stored = make_row(1)
+    stored["summary"] = "Stored summary"
+    stored["extra_data"] = {
+        "sponsors": [{"bioguideId": "S000001"}],
+        "latest_action": {"actionDate": "2023-02-01", "actionTime": "10:00:00", "text": "Referred"},
+    }
+    scraper.upsert_legislation([stored])
+
+    scraper.merge_partial_rows = True
+    partial = make_row(1)
+    partial["summary"] = None
+    partial["extra_data"] = {"latest_action": {"actionDate": "2023-03-01", "text": "Passed House"}}
+    assert scraper.upsert_legislation([partial])["updated"] == 1
+
+    db.expire_all()
+    item = db.get(Legislation, "federal_118_hr_1")
+    assert item.summary == "Stored summary"
+    # Keys the row carries are replaced whole, nested objects included
+    assert item.extra_data == {
+        "sponsors": [{"bioguideId": "S000001"}],
+        "latest_action": {"actionDate": "2023-03-01", "text": "Passed House"},
+    }
+    assert scraper.upsert_legislation([partial])["unchanged"] == 1
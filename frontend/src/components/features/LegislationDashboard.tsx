@@ -1,6 +1,7 @@
-import React, { useState } from 'react';
-import { useQuery } from '@tanstack/react-query';
-import { fetchLegislation } from '../../utils/api';
+import React, { useCallback, useState } from 'react';
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
+import { fetchLegislation, fetchLegislationDetail, searchLegislation } from '../../utils/api';
+import { useSearch } from '../../hooks';
 
 const StatusBadge = ({ status }: { status: string }) => {
   const statusColors = {
@@ -19,10 +20,12 @@ const StatusBadge = ({ status }: { status: string }) => {
   );
 };
 
-const FilterBar = ({ activeTab, onFilterChange }: { 
+const FilterBar = ({ activeTab, onFilterChange, onSearch }: { 
   activeTab: string;
   onFilterChange: (filters: any) => void;
+  onSearch: (query: string) => void;
 }) => {
+  const { searchTerm, setSearchTerm } = useSearch({ onSearch });
   const [filters, setFilters] = useState({
     status: '',
     year: '',
@@ -36,8 +39,22 @@ const FilterBar = ({ activeTab, onFilterChange }: {
     onFilterChange(newFilters);
   };
 
+  const handleSearchChange = (value: string) => {
+    setSearchTerm(value);
+    // useSearch only reports non-empty terms; clearing the box ends the search
+    if (!value) onSearch('');
+  };
+
   return (
     <div className="flex flex-wrap gap-4 mb-6">
+      <input
+        type="search"
+        placeholder="Search titles, summaries and text..."
+        className="flex-1 min-w-[16rem] px-3 py-2 border dark:border-gray-600 rounded-lg bg-white dark:bg-gray-800 text-gray-900 dark:text-gray-100"
+        value={searchTerm}
+        onChange={(e) => handleSearchChange(e.target.value)}
+      />
+
       <select 
         className="px-3 py-2 border dark:border-gray-600 rounded-lg bg-white dark:bg-gray-800 text-gray-900 dark:text-gray-100"
         value={filters.status}
@@ -146,6 +163,17 @@ const Pagination = ({
   </div>
 );
 
+// Search snippets wrap matched terms in <mark>; render them as text, not HTML
+const Snippet = ({ text }: { text: string }) => (
+  <p className="text-gray-600 dark:text-gray-300 line-clamp-2">
+    {text.split(/<\/?mark>/).map((part, i) => (
+      i % 2 === 1
+        ? <mark key={i} className="bg-yellow-200 dark:bg-yellow-700 dark:text-white rounded px-0.5">{part}</mark>
+        : <React.Fragment key={i}>{part}</React.Fragment>
+    ))}
+  </p>
+);
+
 const LegislationItem = ({ item, onClick }: { item: any; onClick: (item: any) => void }) => (
   <div 
     className="bg-white dark:bg-gray-800 rounded-lg shadow p-4 cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-700 
@@ -157,7 +185,9 @@ const LegislationItem = ({ item, onClick }: { item: any; onClick: (item: any) =>
         <h3 className="text-lg font-semibold text-gray-900 dark:text-white">{item.title}</h3>
         <StatusBadge status={item.status} />
       </div>
-      {item.summary && (
+      {item.snippet ? (
+        <Snippet text={item.snippet} />
+      ) : item.summary && (
         <p className="text-gray-600 dark:text-gray-300 line-clamp-2">{item.summary}</p>
       )}
       <div className="flex justify-between items-center text-sm text-gray-500 dark:text-gray-400">
@@ -250,10 +280,23 @@ export const LegislationDashboard: React.FC = () => {
   const [selectedItem, setSelectedItem] = useState<any>(null);
   const [currentPage, setCurrentPage] = useState(1);
   const [filters, setFilters] = useState({});
+  const [searchQuery, setSearchQuery] = useState('');
 
+  // Keep the previous page on screen while the next one loads so the
+  // filter bar, and the search box in it, stay mounted
   const { data, isLoading, error } = useQuery({
-    queryKey: ['legislation', activeTab, currentPage, filters],
-    queryFn: () => fetchLegislation(activeTab, currentPage, filters)
+    queryKey: ['legislation', activeTab, currentPage, filters, searchQuery],
+    queryFn: () => searchQuery
+      ? searchLegislation(searchQuery, activeTab, currentPage)
+      : fetchLegislation(activeTab, currentPage, filters),
+    placeholderData: keepPreviousData
+  });
+
+  // List rows only carry summary fields; load the full record for the detail view
+  const { data: detail } = useQuery({
+    queryKey: ['legislation-detail', selectedItem?.id],
+    queryFn: () => fetchLegislationDetail(selectedItem.id),
+    enabled: !!selectedItem
   });
 
   const handleTabChange = (tab: string) => {
@@ -267,6 +310,11 @@ export const LegislationDashboard: React.FC = () => {
     setCurrentPage(1);
   };
 
+  const handleSearch = useCallback((query: string) => {
+    setSearchQuery(query);
+    setCurrentPage(1);
+  }, []);
+
   if (isLoading) return (
     <div className="flex justify-center items-center p-8">
       <div className="text-blue-600 dark:text-blue-400">Loading...</div>
@@ -304,7 +352,11 @@ export const LegislationDashboard: React.FC = () => {
         </button>
       </div>
 
-      <FilterBar activeTab={activeTab} onFilterChange={handleFilterChange} />
+      <FilterBar
+        activeTab={activeTab}
+        onFilterChange={handleFilterChange}
+        onSearch={handleSearch}
+      />
 
       <div className="space-y-4">
         {data?.data?.map((item: any) => (
@@ -327,7 +379,7 @@ export const LegislationDashboard: React.FC = () => {
       {selectedItem && (
         <div className="fixed inset-0 bg-black/50 dark:bg-black/70 flex items-center justify-center p-4 z-50">
           <DetailedView 
-            item={selectedItem} 
+            item={detail ?? selectedItem} 
             onClose={() => setSelectedItem(null)} 
           />
         </div>
@@ -5,7 +5,7 @@ import { FileText } from 'lucide-react';
 interface Stats {
   federal_count: number;
   state_count: number;
-  executive_orders_count: number;
+  executive_count: number;
 }
 
 interface StatsOverviewProps {
@@ -41,7 +41,7 @@ export const StatsOverview: React.FC<StatsOverviewProps> = ({ stats }) => {
             <FileText className="w-5 h-5 text-purple-500" />
             <h3 className="font-semibold">Executive Orders</h3>
           </div>
-          <p className="text-2xl font-bold mt-2">{stats.executive_orders_count.toLocaleString()}</p>
+          <p className="text-2xl font-bold mt-2">{stats.executive_count.toLocaleString()}</p>
         </div>
       </Card>
     </div>
@@ -1,10 +1,31 @@
 export interface LegislationStats {
   federal_count: number;
   state_count: number;
-  executive_orders_count: number;
+  executive_count: number;
+  total: number;
+  by_type: Record<string, {
+    total: number;
+    by_status: Record<string, number>;
+    by_year: Record<string, number>;
+  }>;
+  by_status: Record<string, number>;
+  by_year: Record<string, number>;
   recent_activity?: {
     date: string;
     type: LegislationType;
     description: string;
   }[];
 }
+
+export interface BreakdownCounts {
+  total: number;
+  by_status: Record<string, number>;
+  by_year: Record<string, number>;
+  by_congress: Record<string, number>;
+  by_president: Record<string, number>;
+  by_state: Record<string, number>;
+}
+
+export interface StatsBreakdown extends BreakdownCounts {
+  by_type: Record<string, BreakdownCounts>;
+}
@@ -38,3 +38,47 @@ export const fetchLegislation = async (
     throw error;
   }
 };
+
+export const fetchLegislationDetail = async (id: string) => {
+  try {
+    const response = await fetch(`/api/v1/legislation/${encodeURIComponent(id)}`);
+
+    if (!response.ok) {
+      const errorText = await response.text();
+      console.error(`API Error: ${errorText}`);
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error(`Error fetching legislation ${id}:`, error);
+    throw error;
+  }
+};
+
+export const searchLegislation = async (
+  query: string,
+  type: string,
+  page: number = 1
+) => {
+  try {
+    const params = new URLSearchParams({
+      q: query,
+      type,
+      page: page.toString()
+    });
+
+    const response = await fetch(`/api/v1/search?${params}`);
+
+    if (!response.ok) {
+      const errorText = await response.text();
+      console.error(`API Error: ${errorText}`);
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error(`Error searching ${type} legislation:`, error);
+    throw error;
+  }
+};